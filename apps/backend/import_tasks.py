@@ -0,0 +1,64 @@
+"""
+Script to bulk import tasks into a project from an NDJSON or CSV file.
+Usage: python import_tasks.py <project_id> <file.ndjson|file.csv>
+"""
+
+import asyncio
+import sys
+import uuid
+
+# Add the src directory to the path
+sys.path.append(".")
+
+from src.core.config import settings
+from src.db.database import get_async_session, create_db_and_tables
+from src.models.project import Project
+from src.utils.task_import import TaskImporter, iter_lines, parse_rows
+
+
+async def read_chunks(path: str, size: int = 1 << 16):
+    """Read the file in binary chunks without loading it whole"""
+    with open(path, "rb") as file:
+        while chunk := file.read(size):
+            yield chunk
+
+
+async def import_tasks(project_id: uuid.UUID, path: str):
+    """Import the tasks in `path` into the project"""
+    # Ensure database tables exist
+    await create_db_and_tables()
+
+    file_format = "csv" if path.lower().endswith(".csv") else "ndjson"
+
+    async for db in get_async_session():
+        project = await db.get(Project, project_id)
+        if project is None or project.deleted_at is not None:
+            print(f"❌ Project {project_id} not found")
+            break
+
+        importer = TaskImporter(
+            db,
+            project_id,
+            chunk_size=settings.TASK_IMPORT_CHUNK_SIZE,
+            max_errors=settings.TASK_IMPORT_MAX_ERRORS,
+        )
+        result = await importer.run(
+            parse_rows(iter_lines(read_chunks(path)), file_format)
+        )
+
+        print(f"✅ Imported {result['imported']} task(s)")
+        if result["failed"]:
+            print(f"\n⚠️  Skipped {result['failed']} invalid row(s):")
+            for error in result["errors"]:
+                print(f"  - row {error['row']}: {'; '.join(error['errors'])}")
+
+        break  # Exit after first session
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    print(f"Importing tasks from {sys.argv[2]}...\n")
+    asyncio.run(import_tasks(uuid.UUID(sys.argv[1]), sys.argv[2]))
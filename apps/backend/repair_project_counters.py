@@ -0,0 +1,36 @@
+"""
+Script to recompute the denormalized task and member counters on projects.
+Usage: python repair_project_counters.py [project_id ...]
+"""
+
+import asyncio
+import sys
+import uuid
+
+# Add the src directory to the path
+sys.path.append(".")
+
+from src.db.database import get_async_session, create_db_and_tables
+from src.utils.counters import recompute_project_counters
+
+
+async def repair_counters(project_ids: list[uuid.UUID] | None = None):
+    """Recompute counters for the given projects, or for every project"""
+    # Ensure database tables exist
+    await create_db_and_tables()
+
+    async for db in get_async_session():
+        repaired = await recompute_project_counters(db, project_ids)
+        await db.commit()
+
+        print(f"✅ Repaired counters on {repaired} project(s)")
+
+        break  # Exit after first session
+
+
+if __name__ == "__main__":
+    # Get project IDs from command line arguments, default to all projects
+    ids = [uuid.UUID(arg) for arg in sys.argv[1:]] or None
+
+    print("Recomputing project counters...\n")
+    asyncio.run(repair_counters(ids))
@@ -17,6 +17,56 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Verified-token -> user cache used by get_current_user
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 1024
+
+    # (user_id, project_id) membership cache used by project authorization checks
+    MEMBERSHIP_CACHE_TTL_SECONDS: int = 30
+    MEMBERSHIP_CACHE_MAX_SIZE: int = 10000
+
+    # Upper bound for the `limit` query parameter on paginated task lists
+    TASK_PAGE_MAX_LIMIT: int = 500
+
+    # Maximum number of operations accepted by one task batch request
+    TASK_BATCH_MAX_OPERATIONS: int = 500
+
+    # Rows fetched per round trip (and tasks per chunk sent) by task exports
+    TASK_EXPORT_CHUNK_SIZE: int = 1000
+
+    # Valid rows written per transaction by task imports, and the most row
+    # errors listed in an import result
+    TASK_IMPORT_CHUNK_SIZE: int = 1000
+    TASK_IMPORT_MAX_ERRORS: int = 1000
+
+    # Server-Sent Events: per-subscriber backlog before a slow client is dropped,
+    # and keep-alive interval for idle streams
+    EVENT_STREAM_QUEUE_SIZE: int = 100
+    EVENT_STREAM_HEARTBEAT_SECONDS: float = 15.0
+
+    # Max bcrypt hash/verify calls running at once off the event loop
+    PASSWORD_HASH_MAX_CONCURRENCY: int = 4
+
+    # Cross-worker change bus: "auto" (LISTEN/NOTIFY on PostgreSQL, polling
+    # table otherwise), "postgres", "table" or "local" (single worker only)
+    CHANGE_BUS_BACKEND: str = "auto"
+    CHANGE_BUS_CHANNEL: str = "task_slayer_changes"
+    CHANGE_BUS_POLL_INTERVAL_SECONDS: float = 1.0
+    CHANGE_BUS_RETENTION_SECONDS: int = 3600
+
+    # Background removal of deleted projects: rows deleted per transaction
+    PROJECT_PURGE_BATCH_SIZE: int = 1000
+
+    # Background jobs: jobs run at once per worker, how often idle runners poll
+    # the job table, retries (with exponential backoff from the base delay),
+    # how long one attempt may run, and how long finished jobs are kept
+    JOB_WORKER_CONCURRENCY: int = 2
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_DELAY_SECONDS: float = 10.0
+    JOB_TIMEOUT_SECONDS: float = 600.0
+    JOB_RETENTION_SECONDS: int = 7 * 24 * 3600
+
     @field_validator("ALLOWED_ORIGINS")
     def parse_allowed_origins(cls, v: str) -> List[str]:
         """
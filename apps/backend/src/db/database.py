@@ -6,6 +6,7 @@ and schema initialization.
 """
 
 from collections.abc import AsyncGenerator
+from sqlalchemy import Engine, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -18,6 +19,21 @@ class Base(DeclarativeBase):
     pass
 
 
+@event.listens_for(Engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:
+    """
+    Turn on foreign key enforcement for every new SQLite connection.
+
+    SQLite ignores foreign keys (and so `ON DELETE CASCADE`) unless asked;
+    deletes rely on the database cascading to child rows.
+    """
+    if "sqlite" not in type(dbapi_connection).__module__:
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
 engine = create_async_engine(settings.DATABASE_URL)
 
 async_session_maker = async_sessionmaker(
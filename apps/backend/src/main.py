@@ -2,9 +2,16 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from src.db.database import create_db_and_tables
-from src.routers import auth, projects, users, tasks, license_keys
+from src.db.database import create_db_and_tables, engine
+from src.routers import auth, projects, users, tasks, license_keys, dashboard, jobs
 from src.core.config import settings
+from src.utils.security import principal_cache, password_hash_pool
+from src.utils.access import membership_cache
+from src.utils.pagination import NEXT_CURSOR_HEADER
+from src.utils.events import project_events
+from src.utils.change_bus import change_bus, create_change_bus_backend
+from src.utils.jobs import job_runner
+from src.utils.purge import project_purger
 
 
 @asynccontextmanager
@@ -18,8 +25,17 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize database tables
     await create_db_and_tables()
     print("Database initialized successfully")
+    # Share cache invalidations and project events with the other workers
+    backend = create_change_bus_backend(engine)
+    if backend is not None:
+        await change_bus.start(backend)
+    # Run queued background jobs (purges, counter rebuilds, ...)
+    await job_runner.start()
     yield
-    # Shutdown: Add cleanup code here if needed
+    # Shutdown: stop the background workers and threads
+    await job_runner.stop()
+    await change_bus.stop()
+    password_hash_pool.shutdown()
     print("Application shutting down")
 
 
@@ -37,6 +53,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", NEXT_CURSOR_HEADER],
 )
 
 # Include routers
@@ -45,6 +62,8 @@ app.include_router(users.router)
 app.include_router(license_keys.router)
 app.include_router(projects.router)
 app.include_router(tasks.router)
+app.include_router(dashboard.router)
+app.include_router(jobs.router)
 
 
 @app.get("/", tags=["Root"])
@@ -64,3 +83,21 @@ def health_check():
     Health check endpoint to verify that the API is running.
     """
     return {"status": "ok"}
+
+
+if settings.DEBUG:
+
+    @app.get("/debug/metrics", tags=["Debug"])
+    def debug_metrics():
+        """
+        In-process cache counters (only exposed when DEBUG is enabled).
+        """
+        return {
+            "principal_cache": principal_cache.stats(),
+            "membership_cache": membership_cache.stats(),
+            "project_events": project_events.stats(),
+            "password_hash_pool": password_hash_pool.stats(),
+            "change_bus": change_bus.stats(),
+            "jobs": job_runner.stats(),
+            "project_purger": project_purger.stats(),
+        }
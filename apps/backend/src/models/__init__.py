@@ -1,6 +1,18 @@
 from src.models.user import User
 from src.models.project import Project
-from src.models.task import Task, TaskState
+from src.models.task import Task, TaskState, TaskDeletion
 from src.models.license_key import LicenseKey
+from src.models.change_event import ChangeEvent
+from src.models.job import Job, JobStatus
 
-__all__ = ["User", "Project", "Task", "TaskState", "LicenseKey"]
+__all__ = [
+    "User",
+    "Project",
+    "Task",
+    "TaskState",
+    "TaskDeletion",
+    "LicenseKey",
+    "ChangeEvent",
+    "Job",
+    "JobStatus",
+]
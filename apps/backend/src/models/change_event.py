@@ -0,0 +1,25 @@
+"""
+Change event ORM model.
+
+Rows are the polling-table transport of the change bus: each worker appends
+the changes it commits and polls for rows written by other workers. Only used
+when LISTEN/NOTIFY is unavailable (e.g. SQLite).
+"""
+
+from sqlalchemy import Integer, Text, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+
+from src.db.database import Base
+
+
+class ChangeEvent(Base):
+    """Database model for one serialized change-bus message."""
+
+    __tablename__ = "change_events"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, index=True
+    )
@@ -0,0 +1,79 @@
+"""
+Background job ORM model.
+
+Jobs are queued by routers inside the transaction making the change and run
+by the in-process job runner (see `src.utils.jobs`), so heavy work survives
+restarts and never ties up a request.
+"""
+
+from sqlalchemy import (
+    JSON,
+    String,
+    Text,
+    DateTime,
+    Integer,
+    ForeignKey,
+    Index,
+    UUID,
+    Enum as SQLEnum,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from typing import Any, Optional
+import uuid
+import enum
+
+from src.db.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    """Lifecycle of a background job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job(Base):
+    """Database model for a background job."""
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Serves the runner's "next job due" lookup
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), default=uuid.uuid4, primary_key=True
+    )
+    # Name of the registered handler that runs the job
+    kind: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, default=dict)
+    status: Mapped[JobStatus] = mapped_column(
+        SQLEnum(JobStatus), default=JobStatus.QUEUED, nullable=False
+    )
+    # What the handler returned, or the last error it raised
+    result: Mapped[Optional[dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Not picked up before this time (pushed back after a failed attempt)
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, nullable=False
+    )
+    # A running job whose lease expires is assumed lost and run again
+    locked_until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, index=True
+    )
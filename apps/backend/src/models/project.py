@@ -3,10 +3,10 @@
 Defines the `Project` entity and the user<->project association table.
 """
 
-from sqlalchemy import String, DateTime, ForeignKey, Table, Column, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, DateTime, Integer, ForeignKey, Table, Column, UUID
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 import uuid
 from src.db.database import Base
 
@@ -49,13 +49,54 @@ class Project(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.now, onupdate=datetime.now
     )
+    # Monotonic change counter, bumped on every change to the project or its
+    # tasks. Issued to clients as the delta-sync cursor and used for ETags.
+    revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # When the project, its members or its tasks last changed
+    last_activity_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.now, nullable=False
+    )
+    # Set when the project is deleted. Deleted projects are hidden from every
+    # query and their rows are removed in the background (src/utils/purge.py)
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime, nullable=True, index=True
+    )
+
+    # Denormalized counters kept in step with tasks and members by the routers
+    # (see src/utils/counters.py); repair with repair_project_counters.py
+    scheduled_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    in_progress_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    completed_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    member_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    # Not a column: the earliest future due date among open tasks, loaded on
+    # request with `with_expression` (the board ties its ETag to it)
+    next_due_at: Mapped[Optional[datetime]] = query_expression()
 
     # Many-to-many relationship with users
     users: Mapped[list["User"]] = relationship(
-        "User", secondary=user_projects, back_populates="projects"
+        "User",
+        secondary=user_projects,
+        back_populates="projects",
+        passive_deletes=True,
     )
 
-    # One-to-many relationship with tasks
+    # One-to-many relationship with tasks. Deleting a project leaves its tasks
+    # (and their assignee rows) to the ON DELETE CASCADE foreign keys instead of
+    # loading and deleting them one by one.
     tasks: Mapped[list["Task"]] = relationship(
-        "Task", back_populates="project", cascade="all, delete-orphan"
+        "Task",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
@@ -1,14 +1,17 @@
 """Task ORM model.
 
-Defines task state, assignee association table, and the `Task` entity.
+Defines task state, assignee association table, the `Task` entity and the
+`TaskDeletion` log used for delta sync.
 """
 
 from sqlalchemy import (
     String,
     DateTime,
+    Integer,
     ForeignKey,
     Table,
     Column,
+    Index,
     UUID,
     Enum as SQLEnum,
 )
@@ -38,7 +41,14 @@ task_assignees = Table(
     "task_assignees",
     Base.metadata,
     Column("task_id", ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
-    Column("user_id", ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+    # Indexed on its own: the composite primary key leads with task_id, so it
+    # cannot serve "tasks assigned to user X" lookups
+    Column(
+        "user_id",
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
     Column("assigned_at", DateTime, default=datetime.now),
 )
 
@@ -50,6 +60,13 @@ class Task(Base):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Serves the per-project listing ordered by (created_at, id) and its
+        # keyset pagination cursor
+        Index("ix_tasks_project_id_created_at_id", "project_id", "created_at", "id"),
+        # Serves "tasks changed since revision N" delta queries
+        Index("ix_tasks_project_id_revision", "project_id", "revision"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -69,7 +86,11 @@ class Task(Base):
     due_date: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now(), onupdate=datetime.now
+        DateTime, default=datetime.now, onupdate=datetime.now
+    )
+    # Project revision at which this task (or its assignees) last changed
+    revision: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
     )
 
     # Foreign key to project (one-to-many: a task belongs to one project)
@@ -82,5 +103,30 @@ class Task(Base):
     # Relationships
     project: Mapped["Project"] = relationship("Project", back_populates="tasks")
     assignees: Mapped[list["User"]] = relationship(
-        "User", secondary=task_assignees, back_populates="assigned_tasks"
+        "User",
+        secondary=task_assignees,
+        back_populates="assigned_tasks",
+        passive_deletes=True,
+    )
+
+
+class TaskDeletion(Base):
+    """Tombstone recorded when a task is deleted.
+
+    Lets clients syncing with "changes since revision N" learn about tasks
+    that no longer exist.
+    """
+
+    __tablename__ = "task_deletions"
+    __table_args__ = (
+        Index("ix_task_deletions_project_id_revision", "project_id", "revision"),
+    )
+
+    task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
     )
+    revision: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now)
@@ -40,10 +40,16 @@ class User(Base):
 
     # Many-to-many relationship with projects
     projects: Mapped[list["Project"]] = relationship(
-        "Project", secondary="user_projects", back_populates="users"
+        "Project",
+        secondary="user_projects",
+        back_populates="users",
+        passive_deletes=True,
     )
 
     # Many-to-many relationship with tasks (as assignee)
     assigned_tasks: Mapped[list["Task"]] = relationship(
-        "Task", secondary="task_assignees", back_populates="assignees"
+        "Task",
+        secondary="task_assignees",
+        back_populates="assignees",
+        passive_deletes=True,
     )
@@ -10,12 +10,13 @@ from src.schemas.user import UserCreate, UserResponse, Token
 from src.models.user import User
 from src.models.license_key import LicenseKey
 from src.utils.security import (
-    get_password_hash,
+    get_password_hash_async,
     authenticate_user,
     create_access_token,
     get_current_user,
 )
 from src.core.config import settings
+from src.utils.sql import insert_returning
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
@@ -77,19 +78,19 @@ async def register(
 
     # Create new user
     print(f"user_data.password:{user_data.password} ,length:{len(user_data.password)}")
-    hashed_password = get_password_hash(user_data.password)
-    db_user = User(
-        username=user_data.username,
-        email=user_data.email,
-        hashed_password=hashed_password,
-        is_active=True,
+    hashed_password = await get_password_hash_async(user_data.password)
+    db_user = await insert_returning(
+        db,
+        User,
+        {
+            "username": user_data.username,
+            "email": user_data.email,
+            "hashed_password": hashed_password,
+            "is_active": True,
+        },
     )
 
-    db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
-
-    # Mark license key as used
+    # Mark license key as used, in the same transaction as the new user
     license_key.is_active = False  # type: ignore[assignment]
     license_key.used_at = datetime.now()  # type: ignore[assignment]
     license_key.used_by_user_id = db_user.id  # type: ignore[assignment]
@@ -119,7 +120,8 @@ async def login(
 
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data={"sub": user.username, "uid": str(user.id)},
+        expires_delta=access_token_expires,
     )
 
     return {"access_token": access_token, "token_type": "bearer"}
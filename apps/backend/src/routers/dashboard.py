@@ -0,0 +1,103 @@
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import selectinload
+
+from typing import Optional
+
+from src.db.database import get_async_session
+from src.schemas.dashboard import Dashboard
+from src.models.project import Project, user_projects
+from src.models.task import Task, TaskState, task_assignees
+from src.models.user import User
+from src.utils.security import get_current_user
+from src.utils.conditional import etag_matches, make_etag, not_modified
+
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("/", response_model=Dashboard)
+async def get_dashboard(
+    response: Response,
+    upcoming_limit: int = Query(5, ge=1, le=50),
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Get the current user's dashboard in one request.
+
+    Returns every project the user is a member of (with task counts and
+    last activity), the number of open tasks assigned to the user, and the
+    next `upcoming_limit` of those tasks by due date.
+
+    Supports conditional requests: send the previous `ETag` as `If-None-Match`
+    to get a 304 when nothing on the dashboard has changed.
+    """
+    member_project_ids = (
+        select(user_projects.c.project_id)
+        .join(Project, Project.id == user_projects.c.project_id)
+        .where(user_projects.c.user_id == current_user.id, Project.deleted_at.is_(None))
+    )
+    my_open_tasks = (
+        select(Task.id)
+        .join(task_assignees, task_assignees.c.task_id == Task.id)
+        .join(Project, Project.id == Task.project_id)
+        .where(
+            task_assignees.c.user_id == current_user.id,
+            Task.state != TaskState.COMPLETED,
+            Project.deleted_at.is_(None),
+        )
+    )
+
+    # Every change that can alter the dashboard bumps the revision of a project
+    # the user belongs to or holds an assigned task in
+    result = await db.execute(
+        select(Project.id, Project.revision)
+        .where(
+            Project.deleted_at.is_(None),
+            or_(
+                Project.id.in_(member_project_ids),
+                Project.id.in_(
+                    select(Task.project_id)
+                    .join(task_assignees, task_assignees.c.task_id == Task.id)
+                    .where(task_assignees.c.user_id == current_user.id)
+                ),
+            ),
+        )
+        .order_by(Project.id)
+    )
+    etag = make_etag("dashboard", current_user.id, upcoming_limit, *result.all())
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    # Projects, with their denormalized counters
+    result = await db.execute(
+        select(Project)
+        .where(Project.id.in_(member_project_ids))
+        .order_by(Project.created_at.desc())
+    )
+    projects = result.scalars().all()
+
+    # Open assigned tasks: total count, then the closest ones by due date
+    result = await db.execute(
+        select(func.count()).select_from(my_open_tasks.subquery())
+    )
+    assigned_count = result.scalar_one()
+
+    result = await db.execute(
+        select(Task)
+        .options(selectinload(Task.assignees), selectinload(Task.project))
+        .where(Task.id.in_(my_open_tasks))
+        .order_by(Task.due_date.asc().nullslast(), Task.id.asc())
+        .limit(upcoming_limit)
+    )
+    upcoming_tasks = result.scalars().all()
+
+    return {
+        "projects": projects,
+        "assigned_count": assigned_count,
+        "upcoming_tasks": upcoming_tasks,
+    }
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+import uuid
+
+from src.db.database import get_async_session
+from src.schemas.job import JobResponse
+from src.models.job import Job
+from src.models.user import User
+from src.utils.security import get_current_user
+
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get("/", response_model=list[JobResponse])
+async def list_my_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    List the background jobs started by the current user, newest first.
+    """
+    result = await db.execute(
+        select(Job)
+        .where(Job.created_by_id == current_user.id)
+        .order_by(Job.created_at.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Get the status of a background job.
+
+    Endpoints that answer 202 Accepted return the job and point at this URL.
+    Only the user who started the job can see it.
+    """
+    result = await db.execute(
+        select(Job).where(Job.id == job_id, Job.created_by_id == current_user.id)
+    )
+    job = result.scalar_one_or_none()
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Job not found"
+        )
+
+    return job
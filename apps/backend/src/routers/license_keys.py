@@ -16,6 +16,7 @@ from src.schemas.license_key import (
 )
 from src.models.user import User
 from src.utils.security import get_current_user
+from src.utils.sql import insert_returning, update_returning
 
 
 router = APIRouter(prefix="/license-keys", tags=["License Keys"])
@@ -58,10 +59,8 @@ async def create_license_key(
         )
 
     # Create new license key
-    license_key = LicenseKey(key=key)
-    db.add(license_key)
+    license_key = await insert_returning(db, LicenseKey, {"key": key})
     await db.commit()
-    await db.refresh(license_key)
 
     return license_key
 
@@ -87,10 +86,8 @@ async def create_custom_license_key(
         )
 
     # Create new license key
-    license_key = LicenseKey(key=license_data.key)
-    db.add(license_key)
+    license_key = await insert_returning(db, LicenseKey, {"key": license_data.key})
     await db.commit()
-    await db.refresh(license_key)
 
     return license_key
 
@@ -173,17 +170,19 @@ async def update_license_key(
     """
     Update a license key's active status.
     """
-    result = await db.execute(select(LicenseKey).where(LicenseKey.key == key_id))
-    license_key = result.scalar_one_or_none()
+    license_key = await update_returning(
+        db,
+        LicenseKey,
+        [LicenseKey.key == key_id],
+        {"is_active": update_data.is_active},
+    )
 
     if not license_key:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="License key not found"
         )
 
-    license_key.is_active = update_data.is_active
     await db.commit()
-    await db.refresh(license_key)
 
     return license_key
 
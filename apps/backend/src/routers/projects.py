@@ -1,25 +1,66 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import selectinload, with_expression
 
+from datetime import datetime
+from typing import Optional
 import uuid
 
 from src.db.database import get_async_session
+from src.schemas.job import JobResponse
 from src.schemas.project import (
+    ProjectBoard,
     ProjectCreate,
     ProjectResponse,
     ProjectUpdate,
     ProjectWithUsers,
 )
-from src.models.project import Project
+from src.models.project import Project, user_projects
+from src.models.task import Task, TaskState
 from src.models.user import User
-from src.utils.security import get_current_user
+from src.core.config import settings
+from src.utils.security import get_current_user, get_current_user_for_stream
+from src.utils.access import (
+    get_project_for_member,
+    invalidate_membership,
+    is_project_member,
+    require_project_member,
+)
+from src.utils.conditional import etag_matches, make_etag, not_modified
+from src.utils.revisions import bump_project_revision, get_project_revision
+from src.utils.events import format_sse, project_events, publish_project_event
+from src.utils.jobs import enqueue_job, job_runner
+from src.utils.sql import (
+    insert_ignoring_conflicts,
+    insert_returning,
+    update_returning,
+)
 
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 
+async def _project_with_users(db: AsyncSession, project: Project) -> dict:
+    """Build a `ProjectWithUsers` payload, loading only the member rows."""
+    result = await db.execute(
+        select(User)
+        .join(user_projects, user_projects.c.user_id == User.id)
+        .where(user_projects.c.project_id == project.id)
+    )
+    project_data = ProjectResponse.model_validate(project).model_dump()
+    return {**project_data, "users": result.scalars().all()}
+
+
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
@@ -33,17 +74,21 @@ async def create_project(
     - **description**: project description (optional, max 1000 characters)
     """
     # Create new project
-    db_project = Project(
-        title=project_data.title,
-        description=project_data.description,
+    db_project = await insert_returning(
+        db,
+        Project,
+        {
+            "title": project_data.title,
+            "description": project_data.description,
+            "member_count": 1,
+        },
     )
 
     # Add the creator as the first user of the project
-    db_project.users.append(current_user)
-
-    db.add(db_project)
+    await db.execute(
+        insert(user_projects).values(user_id=current_user.id, project_id=db_project.id)
+    )
     await db.commit()
-    await db.refresh(db_project)
 
     return db_project
 
@@ -52,17 +97,34 @@ async def create_project(
     "/", response_model=list[ProjectResponse]
 )  # NOTE: this endpoint do not return user lists of the projects
 async def get_my_projects(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session),
 ):
     """
     Get all projects that the current user is a member of.
+
+    Supports conditional requests: send the previous `ETag` as `If-None-Match`
+    to get a 304 when none of the projects changed.
     """
+    # The list only changes when a project is added/removed or its revision moves
+    result = await db.execute(
+        select(Project.id, Project.revision)
+        .join(user_projects, user_projects.c.project_id == Project.id)
+        .where(user_projects.c.user_id == current_user.id, Project.deleted_at.is_(None))
+        .order_by(Project.id)
+    )
+    etag = make_etag("projects", current_user.id, *result.all())
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
     # Query projects where the current user is a member
     result = await db.execute(
         select(Project)
         .join(Project.users)
-        .where(User.id == current_user.id)
+        .where(User.id == current_user.id, Project.deleted_at.is_(None))
         .order_by(Project.created_at.desc())
     )
     projects = result.scalars().all()
@@ -73,34 +135,102 @@ async def get_my_projects(
 @router.get("/{project_id}", response_model=ProjectWithUsers)
 async def get_project(
     project_id: uuid.UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session),
 ):
     """
     Get details of a specific project by UUID
     Only members of the project can view its details.
+
+    Supports conditional requests: send the previous `ETag` as `If-None-Match`
+    to get a 304 when the project has not changed.
     """
-    # Fetch project with users loaded
-    result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.users))
-        .where(Project.id == project_id)
+    await require_project_member(db, project_id, current_user)
+    etag = make_etag("project", project_id, await get_project_revision(db, project_id))
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+
+    # Check membership and fetch project with users loaded
+    project = await get_project_for_member(
+        db, project_id, current_user, options=[selectinload(Project.users)]
     )
-    project = result.scalar_one_or_none()
 
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
-        )
+    return project
 
-    # Check if current user is a member of this project
-    if current_user not in project.users:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this project",
+
+@router.get("/{project_id}/board", response_model=ProjectBoard)
+async def get_project_board(
+    project_id: uuid.UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Get everything needed to render a project board in one request:
+    the project with its members, all tasks with their assignees, and task counts.
+
+    Only members of the project can view its board.
+    Runs a fixed number of queries regardless of project size.
+
+    Supports conditional requests: send the previous `ETag` as `If-None-Match`
+    to get a 304 when nothing on the board has changed.
+    """
+    # Fetch project and check membership in one query; its revision covers
+    # every change to the project, its members and its tasks. The overdue
+    # count also changes with the clock, so the same query loads the next
+    # open task to fall due: the tag changes the moment it becomes overdue
+    now = datetime.now()
+    next_due = (
+        select(func.min(Task.due_date))
+        .where(
+            Task.project_id == Project.id,
+            Task.state != TaskState.COMPLETED,
+            Task.due_date >= now,
         )
+        .scalar_subquery()
+    )
+    project = await get_project_for_member(
+        db,
+        project_id,
+        current_user,
+        options=[with_expression(Project.next_due_at, next_due)],
+    )
+    etag = make_etag("board", project_id, project.revision, project.next_due_at)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
-    return project
+    # Members
+    project_data = await _project_with_users(db, project)
+
+    # Tasks with assignees (one query for tasks, one for all their assignees)
+    result = await db.execute(
+        select(Task)
+        .options(selectinload(Task.assignees))
+        .where(Task.project_id == project_id)
+        .order_by(Task.created_at.desc(), Task.id.desc())
+    )
+    tasks = result.scalars().all()
+
+    # Counts come from the tasks already in hand
+    stats = {task_state.value: 0 for task_state in TaskState}
+    stats.update(total=len(tasks), overdue=0, unassigned=0)
+    for task in tasks:
+        stats[task.state.value] += 1
+        if task.due_date and task.due_date < now and task.state != TaskState.COMPLETED:
+            stats["overdue"] += 1
+        if not task.assignees:
+            stats["unassigned"] += 1
+
+    return {
+        "project": project_data,
+        "tasks": tasks,
+        "stats": stats,
+    }
 
 
 @router.put("/{project_id}", response_model=ProjectResponse)
@@ -115,74 +245,111 @@ async def update_project(
 
     Only members of the project can update it.
     """
-    # Fetch project
-    result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.users))
-        .where(Project.id == project_id)
-    )
-    project = result.scalar_one_or_none()
+    # Fetch project, checking that the current user is a member
+    project = await get_project_for_member(db, project_id, current_user)
 
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
-        )
-
-    # Check if current user is a member
-    if current_user not in project.users:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not an member of this project",
-        )
+    revision = await bump_project_revision(db, project_id)
 
     # Update fields if provided
-    if project_data.title is not None:
-        project.title = project_data.title
-    if project_data.description is not None:
-        project.description = project_data.description
-
+    changes = project_data.model_dump(exclude_none=True)
+    if changes:
+        project = await update_returning(
+            db, Project, [Project.id == project_id], changes
+        )
+        if project is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
     await db.commit()
-    await db.refresh(project)
+
+    publish_project_event(
+        project_id,
+        "project.updated",
+        revision,
+        project=ProjectResponse.model_validate(project).model_dump(mode="json"),
+    )
 
     return project
 
 
-@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{project_id}",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def delete_project(
     project_id: uuid.UUID,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session),
 ):
     """
     Delete a project.
 
-    Only members of the project can delete it.
-    Note: This will also remove all user associations due to CASCADE.
+    Only members of the project can delete it. The project disappears
+    immediately; its tasks and memberships are removed by a background job,
+    which is returned right away. Follow the purge at the URL in the
+    `Location` header.
     """
-    # Fetch project
+    # Check that the current user is a member
+    await require_project_member(db, project_id, current_user)
+
+    # Mark the project deleted; the purger removes its rows in small batches
     result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.users))
-        .where(Project.id == project_id)
+        update(Project)
+        .where(Project.id == project_id, Project.deleted_at.is_(None))
+        .values(deleted_at=datetime.now(), updated_at=Project.updated_at)
+        .execution_options(synchronize_session=False)
     )
-    project = result.scalar_one_or_none()
-
-    if not project:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
         )
+    job = await enqueue_job(
+        db,
+        "projects.purge",
+        {"project_id": str(project_id)},
+        created_by_id=current_user.id,
+    )
+    await db.commit()
+    invalidate_membership(project_id)
+    publish_project_event(project_id, "project.deleted")
+    job_runner.wake()
 
-    # Check if current user is a member
-    if current_user not in project.users:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this project",
-        )
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return job
 
-    await db.delete(project)
+
+@router.post(
+    "/{project_id}/counters/rebuild",
+    response_model=JobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def rebuild_project_counters(
+    project_id: uuid.UUID,
+    response: Response,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Recompute a project's task and member counters in the background.
+
+    Only members of the project can request it. Returns the queued job right
+    away; follow its status at the URL in the `Location` header.
+    """
+    await require_project_member(db, project_id, current_user)
+
+    job = await enqueue_job(
+        db,
+        "projects.recompute_counters",
+        {"project_ids": [str(project_id)]},
+        created_by_id=current_user.id,
+    )
     await db.commit()
+    job_runner.wake()
 
-    return None
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return job
 
 
 @router.post("/{project_id}/users/{user_id}", response_model=ProjectWithUsers)
@@ -197,53 +364,37 @@ async def add_user_to_project(
 
     Only existing members of the project can add new users.
     """
-    # Fetch project
-    result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.users))
-        .where(Project.id == project_id)
-    )
-    project = result.scalar_one_or_none()
+    # Fetch project, checking that the current user is a member
+    project = await get_project_for_member(db, project_id, current_user)
 
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
-        )
-
-    # Check if current user is a member
-    if current_user not in project.users:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this project",
-        )
-
-    # Fetch user to add
-    result = await db.execute(select(User).where(User.id == user_id))
-    user_to_add = result.scalar_one_or_none()
-
-    if not user_to_add:
+    # Check that the user to add exists
+    if await db.get(User, user_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    # Check if user is already a member
-    if user_to_add in project.users:
+    # Add the membership row directly; the primary key rejects duplicates
+    result = await db.execute(
+        insert_ignoring_conflicts(db, user_projects).values(
+            user_id=user_id, project_id=project_id
+        )
+    )
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User is already a member of this project",
         )
 
-    # Add user to project
-    project.users.append(user_to_add)
+    revision = await bump_project_revision(db, project_id, member_count=1)
     await db.commit()
-    result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.users))
-        .where(Project.id == project_id)
+    # The row was written directly; drop any stale in-session collection
+    db.expire(project, ["users"])
+    invalidate_membership(project_id, user_id)
+    publish_project_event(
+        project_id, "project.member_added", revision, user_id=str(user_id)
     )
-    project = result.scalar_one()
 
-    return project
+    return await _project_with_users(db, project)
 
 
 @router.delete("/{project_id}/users/{user_id}", response_model=ProjectWithUsers)
@@ -259,57 +410,106 @@ async def remove_user_from_project(
     Only existing members can remove users.
     Cannot remove the last user from a project (project must have at least 1 user).
     """
-    # Fetch project
-    result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.users))
-        .where(Project.id == project_id)
-    )
-    project = result.scalar_one_or_none()
+    # Fetch project, checking that the current user is a member
+    project = await get_project_for_member(db, project_id, current_user)
 
-    if not project:
+    # Check that the user to remove exists
+    if await db.get(User, user_id) is None:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    # Check if current user is a member
-    if current_user not in project.users:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this project",
-        )
+    # Bump first: the row lock on the project serializes concurrent membership
+    # changes, so the "not the last member" guard below cannot race
+    revision = await bump_project_revision(db, project_id, member_count=-1)
 
-    # Check if project has more than 1 user
-    if len(project.users) <= 1:
+    # Delete the membership row directly, unless it is the last one
+    remaining_members = (
+        select(func.count())
+        .select_from(user_projects)
+        .where(user_projects.c.project_id == project_id)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        delete(user_projects).where(
+            user_projects.c.project_id == project_id,
+            user_projects.c.user_id == user_id,
+            remaining_members > 1,
+        )
+    )
+    if result.rowcount == 0:
+        is_member = await is_project_member(db, project_id, user_id)
+        await db.rollback()
+        if not is_member:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User is not a member of this project",
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot remove the last user from a project. A project must have at least 1 user.",
         )
 
-    # Fetch user to remove
-    result = await db.execute(select(User).where(User.id == user_id))
-    user_to_remove = result.scalar_one_or_none()
+    await db.commit()
+    # The row was written directly; drop any stale in-session collection
+    db.expire(project, ["users"])
+    invalidate_membership(project_id, user_id)
+    publish_project_event(
+        project_id, "project.member_removed", revision, user_id=str(user_id)
+    )
 
-    if not user_to_remove:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
+    return await _project_with_users(db, project)
 
-    # Check if user is a member
-    if user_to_remove not in project.users:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User is not a member of this project",
-        )
 
-    # Remove user from project
-    project.users.remove(user_to_remove)
-    await db.commit()
-    result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.users))
-        .where(Project.id == project_id)
-    )
-    project = result.scalar_one()
+@router.get("/{project_id}/events")
+async def stream_project_events(
+    project_id: uuid.UUID,
+    request: Request,
+    current_user: User = Depends(get_current_user_for_stream),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Stream live changes to a project and its tasks as Server-Sent Events.
 
-    return project
+    Only members of the project can subscribe. Authenticate with the usual
+    Bearer header, or pass the token as `access_token` (EventSource cannot set
+    headers). Each event carries a `cursor` usable with
+    `/tasks/project/{project_id}/changes`; a `resync` event means the client fell
+    behind and should catch up through that endpoint, then reconnect.
+    """
+    await require_project_member(db, project_id, current_user)
+    user_id = str(current_user.id)
+
+    # The stream can stay open for hours; do not pin a database connection
+    await db.close()
+    subscription = project_events.subscribe(project_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                event = await subscription.get(
+                    timeout=settings.EVENT_STREAM_HEARTBEAT_SECONDS
+                )
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                yield format_sse(event)
+
+                # Stop once there is nothing more this client may receive
+                if event["type"] in ("resync", "project.deleted"):
+                    break
+                if (
+                    event["type"] == "project.member_removed"
+                    and event.get("user_id") == user_id
+                ):
+                    break
+        finally:
+            project_events.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
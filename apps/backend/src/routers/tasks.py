@@ -1,55 +1,100 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import (
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import selectinload
-from typing import Optional
+from collections import Counter
+from datetime import datetime
+from typing import Any, Literal, Optional
 import uuid
 
+from src.core.config import settings
 from src.db.database import get_async_session
 from src.schemas.task import (
+    TaskAssignmentBatch,
+    TaskAssignmentResult,
+    TaskBatch,
+    TaskBatchResult,
+    TaskChanges,
     TaskCreate,
+    TaskImportResult,
     TaskResponse,
+    TaskStats,
     TaskUpdate,
     TaskWithAssignees,
     TaskWithDetails,
 )
-from src.models.task import Task, TaskState as ModelTaskState
-from src.models.project import Project
+from src.models.task import (
+    Task,
+    TaskDeletion,
+    TaskState as ModelTaskState,
+    task_assignees,
+)
+from src.models.project import Project, user_projects
 from src.models.user import User
 from src.utils.security import get_current_user
+from src.utils.access import (
+    get_task_for_member,
+    is_project_member,
+    require_project_member,
+)
+from src.utils.pagination import (
+    NEXT_CURSOR_HEADER,
+    decode_cursor,
+    encode_cursor,
+    parse_cursor_datetime,
+    parse_cursor_int,
+    parse_cursor_uuid,
+)
+from src.utils.revisions import (
+    bump_project_revision,
+    get_project_revision,
+    record_task_deletion,
+    touch_task,
+)
+from src.utils.counters import adjust_project_counters, task_count_deltas
+from src.utils.conditional import etag_matches, make_etag, not_modified
+from src.utils.events import publish_project_event
+from src.utils.export import csv_chunks, iter_task_records, ndjson_chunks
+from src.utils.task_import import TaskImporter, iter_lines, parse_rows
+from src.utils.sql import (
+    insert_ignoring_conflicts,
+    insert_returning,
+    update_returning,
+)
 
 
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 
-async def verify_project_access(
-    project_id: uuid.UUID,
-    current_user: User,
-    db: AsyncSession,
-) -> Project:
-    """
-    Verify that the current user has access to the specified project.
-    Returns the project if access is granted, otherwise raises HTTPException.
-    """
+async def _task_with_assignees(db: AsyncSession, task: Task) -> dict:
+    """Build a `TaskWithAssignees` payload, loading only the assignee rows."""
     result = await db.execute(
-        select(Project)
-        .options(selectinload(Project.users))
-        .where(Project.id == project_id)
+        select(User)
+        .join(task_assignees, task_assignees.c.user_id == User.id)
+        .where(task_assignees.c.task_id == task.id)
     )
-    project = result.scalar_one_or_none()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
-        )
-
-    if current_user not in project.users:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You are not a member of this project",
-        )
-
-    return project
+    task_data = TaskResponse.model_validate(task).model_dump()
+    return {**task_data, "assignees": result.scalars().all()}
 
 
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
@@ -70,23 +115,35 @@ async def create_task(
     - **project_id**: UUID of the project this task belongs to
     """
     # Verify user has access to the project
-    await verify_project_access(task_data.project_id, current_user, db)
+    await require_project_member(db, task_data.project_id, current_user)
 
     duedate = task_data.due_date
     duedate = duedate.replace(tzinfo=None) if duedate else None
 
-    # Create new task
-    db_task = Task(
-        title=task_data.title,
-        description=task_data.description,
-        state=task_data.state,
-        due_date=duedate,
-        project_id=task_data.project_id,
+    # Create new task, stamped with the project's next revision
+    revision = await bump_project_revision(
+        db, task_data.project_id, **task_count_deltas(added=task_data.state)
+    )
+    db_task = await insert_returning(
+        db,
+        Task,
+        {
+            "title": task_data.title,
+            "description": task_data.description,
+            "state": task_data.state,
+            "due_date": duedate,
+            "project_id": task_data.project_id,
+            "revision": revision,
+        },
     )
-
-    db.add(db_task)
     await db.commit()
-    await db.refresh(db_task)
+
+    publish_project_event(
+        db_task.project_id,
+        "task.created",
+        revision,
+        task=TaskResponse.model_validate(db_task).model_dump(mode="json"),
+    )
 
     return db_task
 
@@ -94,21 +151,38 @@ async def create_task(
 @router.get("/project/{project_id}", response_model=list[TaskWithAssignees])
 async def get_project_tasks(
     project_id: uuid.UUID,
+    response: Response,
     state: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=settings.TASK_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session),
 ):
     """
-    Get all tasks for a specific project.
+    Get tasks for a specific project, newest first.
 
     Only members of the project can view its tasks.
-    Optionally filter by task state.
+    Optionally filter by task state and paginate with a keyset cursor.
 
     - **project_id**: UUID of the project
     - **state**: optional filter by task state (scheduled, in_progress, completed)
+    - **limit**: optional page size; when more tasks remain, the response carries
+      an `X-Next-Cursor` header
+    - **cursor**: value of a previous `X-Next-Cursor` header to fetch the next page
+
+    Supports conditional requests: send the previous `ETag` as `If-None-Match`
+    to get a 304 when no task in the project has changed.
     """
     # Verify user has access to the project
-    await verify_project_access(project_id, current_user, db)
+    await require_project_member(db, project_id, current_user)
+
+    # Answer unchanged polls without touching the task tables
+    revision = await get_project_revision(db, project_id)
+    etag = make_etag("tasks", project_id, revision, state, limit, cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
 
     # Build query
     query = (
@@ -128,28 +202,541 @@ async def get_project_tasks(
             )
         query = query.where(Task.state == state_enum)
 
-    result = await db.execute(query.order_by(Task.created_at.desc()))
-    tasks = result.scalars().all()
+    # Resume strictly after the (created_at, id) of the last task already served
+    if cursor:
+        raw_created_at, raw_id = decode_cursor(cursor, size=2)
+        after_created_at = parse_cursor_datetime(raw_created_at)
+        after_id = parse_cursor_uuid(raw_id)
+        query = query.where(
+            or_(
+                Task.created_at < after_created_at,
+                and_(Task.created_at == after_created_at, Task.id < after_id),
+            )
+        )
+
+    query = query.order_by(Task.created_at.desc(), Task.id.desc())
+    if limit is not None:
+        # Fetch one extra row to learn whether another page exists
+        query = query.limit(limit + 1)
+
+    result = await db.execute(query)
+    tasks = list(result.scalars().all())
+
+    if limit is not None and len(tasks) > limit:
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
 
     return tasks
 
 
+@router.get("/project/{project_id}/changes", response_model=TaskChanges)
+async def get_project_task_changes(
+    project_id: uuid.UUID,
+    since: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Get the tasks of a project that changed since a sync cursor.
+
+    Only members of the project can sync its tasks.
+    Without `since` every task is returned (initial sync). With `since`, only
+    tasks created, updated or (un)assigned afterwards are returned, plus the IDs
+    of tasks deleted afterwards. Pass the returned `cursor` as `since` on the
+    next call.
+
+    - **project_id**: UUID of the project
+    - **since**: cursor returned by a previous call
+    """
+    # Verify user has access to the project
+    await require_project_member(db, project_id, current_user)
+
+    since_revision = None
+    if since:
+        (raw_revision,) = decode_cursor(since, size=1)
+        since_revision = parse_cursor_int(raw_revision)
+
+    # Read the revision before the tasks: every change up to it is already
+    # committed, so nothing can slip between this cursor and the next one
+    current_revision = await get_project_revision(db, project_id)
+
+    query = (
+        select(Task)
+        .options(selectinload(Task.assignees))
+        .where(Task.project_id == project_id)
+    )
+    deleted: list[uuid.UUID] = []
+    if since_revision is not None:
+        query = query.where(Task.revision > since_revision)
+        result = await db.execute(
+            select(TaskDeletion.task_id).where(
+                TaskDeletion.project_id == project_id,
+                TaskDeletion.revision > since_revision,
+            )
+        )
+        deleted = list(result.scalars().all())
+
+    result = await db.execute(query.order_by(Task.revision))
+    tasks = result.scalars().all()
+
+    return {
+        "cursor": encode_cursor(current_revision),
+        "tasks": tasks,
+        "deleted": deleted,
+    }
+
+
+@router.post("/project/{project_id}/batch", response_model=TaskBatchResult)
+async def apply_task_batch(
+    project_id: uuid.UUID,
+    batch: TaskBatch,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Create, update and delete many tasks of one project in a single request.
+
+    Only members of the project can use it. All operations run in one
+    transaction as multi-row statements and share one project revision.
+    Each operation gets its own result, in request order; an operation that
+    cannot be applied does not stop the others.
+
+    - **create**: task fields as for `POST /tasks/` (project from the URL) -> 201
+    - **update**: `id` plus the fields to change -> 200
+    - **delete**: `id` -> 204
+    - a task that is not in the project -> 404; a task referenced by more than
+      one operation -> 409
+    """
+    # Authorize once for the whole batch
+    await require_project_member(db, project_id, current_user)
+
+    operations = batch.operations
+    results: list[dict[str, Any]] = [
+        {"index": index, "op": operation.op}
+        for index, operation in enumerate(operations)
+    ]
+
+    # Every change in the batch is stamped with the same new revision. Taking
+    # it first locks the project, so the task states read below stay current
+    # until the batch commits and concurrent writers cannot skew the counters
+    revision = await bump_project_revision(db, project_id)
+
+    # Look up every referenced task (and its current state) in one query
+    referenced = [op.id for op in operations if op.op != "create"]
+    references = Counter(referenced)
+    existing: dict[uuid.UUID, ModelTaskState] = {}
+    if referenced:
+        result = await db.execute(
+            select(Task.id, Task.state).where(
+                Task.project_id == project_id, Task.id.in_(referenced)
+            )
+        )
+        existing = dict(result.tuples().all())
+
+    now = datetime.now()
+    created: list[dict[str, Any]] = []
+    updated: list[dict[str, Any]] = []
+    deleted: list[uuid.UUID] = []
+    counter_deltas: Counter[str] = Counter()
+
+    for op, item in zip(operations, results):
+        if op.op == "create":
+            row = {
+                "id": uuid.uuid4(),
+                "project_id": project_id,
+                "title": op.title,
+                "description": op.description,
+                "state": op.state,
+                "due_date": op.due_date.replace(tzinfo=None) if op.due_date else None,
+                "created_at": now,
+                "updated_at": now,
+            }
+            created.append(row)
+            counter_deltas.update(task_count_deltas(added=op.state))
+            item.update(status=status.HTTP_201_CREATED, id=row["id"])
+            continue
+
+        item["id"] = op.id
+        if op.id not in existing:
+            item.update(status=status.HTTP_404_NOT_FOUND, detail="Task not found")
+        elif references[op.id] > 1:
+            item.update(
+                status=status.HTTP_409_CONFLICT,
+                detail="Task is referenced by more than one operation in this batch",
+            )
+        elif op.op == "update":
+            changes = op.model_dump(exclude={"op", "id"}, exclude_none=True)
+            if "due_date" in changes:
+                changes["due_date"] = changes["due_date"].replace(tzinfo=None)
+            if "state" in changes:
+                counter_deltas.update(
+                    task_count_deltas(removed=existing[op.id], added=changes["state"])
+                )
+            updated.append({"id": op.id, "updated_at": now, **changes})
+            item["status"] = status.HTTP_200_OK
+        else:
+            deleted.append(op.id)
+            counter_deltas.update(task_count_deltas(removed=existing[op.id]))
+            item["status"] = status.HTTP_204_NO_CONTENT
+
+    if not (created or updated or deleted):
+        # Nothing changed: give the revision back
+        await db.rollback()
+        revision = await get_project_revision(db, project_id)
+        return {"cursor": encode_cursor(revision), "results": results}
+
+    await adjust_project_counters(db, project_id, **counter_deltas)
+    if created:
+        await db.execute(
+            insert(Task), [{**row, "revision": revision} for row in created]
+        )
+    if updated:
+        # Bulk UPDATE by primary key; rows with the same changed columns
+        # are sent together as one executemany
+        await db.execute(
+            update(Task), [{**row, "revision": revision} for row in updated]
+        )
+    if deleted:
+        # Leave tombstones so delta-sync clients learn about the deletions
+        await db.execute(
+            insert(TaskDeletion),
+            [
+                {
+                    "task_id": task_id,
+                    "project_id": project_id,
+                    "revision": revision,
+                    "deleted_at": now,
+                }
+                for task_id in deleted
+            ],
+        )
+        await db.execute(
+            delete(Task)
+            .where(Task.id.in_(deleted))
+            .execution_options(synchronize_session=False)
+        )
+    await db.commit()
+
+    # Return the stored state of every created or updated task
+    changed_ids = [row["id"] for row in created] + [row["id"] for row in updated]
+    tasks: dict[uuid.UUID, Task] = {}
+    if changed_ids:
+        result = await db.execute(
+            select(Task)
+            .where(Task.id.in_(changed_ids))
+            .execution_options(populate_existing=True)
+        )
+        tasks = {task.id: task for task in result.scalars().all()}
+    for item in results:
+        if item["status"] in (status.HTTP_201_CREATED, status.HTTP_200_OK):
+            item["task"] = tasks[item["id"]]
+
+    publish_project_event(
+        project_id,
+        "tasks.batch",
+        revision,
+        created=[str(row["id"]) for row in created],
+        updated=[str(row["id"]) for row in updated],
+        deleted=[str(task_id) for task_id in deleted],
+    )
+
+    return {"cursor": encode_cursor(revision), "results": results}
+
+
+@router.post("/project/{project_id}/assignments", response_model=TaskAssignmentResult)
+async def apply_task_assignments(
+    project_id: uuid.UUID,
+    batch: TaskAssignmentBatch,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Assign and unassign users on many tasks of one project in a single request.
+
+    Only members of the project can change assignments. Every task being
+    assigned must belong to the project and every user being assigned must be
+    a project member; otherwise nothing is changed. Pairs already in the
+    requested state are skipped rather than rejected, and so are removals for
+    tasks that are no longer in the project (e.g. deleted since the client
+    loaded them).
+
+    - **unassign**: list of `{task_id, user_id}` pairs to remove (applied first)
+    - **assign**: list of `{task_id, user_id}` pairs to add
+    """
+    # Authorize once for the whole batch
+    await require_project_member(db, project_id, current_user)
+
+    # Every task being assigned must belong to this project (one query)
+    task_ids = {pair.task_id for pair in batch.assign}
+    if task_ids:
+        result = await db.execute(
+            select(Task.id).where(
+                Task.project_id == project_id, Task.id.in_(task_ids)
+            )
+        )
+        if task_ids - set(result.scalars().all()):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+            )
+
+    # Every user being assigned must be a member (one query for the user set)
+    user_ids = {pair.user_id for pair in batch.assign}
+    if user_ids:
+        result = await db.execute(
+            select(user_projects.c.user_id).where(
+                user_projects.c.project_id == project_id,
+                user_projects.c.user_id.in_(user_ids),
+            )
+        )
+        if user_ids - set(result.scalars().all()):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot assign a user who is not a member of the task's project",
+            )
+
+    # Every task whose assignees change is stamped with one shared revision.
+    # Taking it first locks the project before any assignee row is written,
+    # in the same order as every other task write path
+    revision = await bump_project_revision(db, project_id)
+
+    dialect = db.get_bind().dialect
+    touched: set[uuid.UUID] = set()
+    unassigned = assigned = 0
+
+    if batch.unassign:
+        pairs = {(pair.task_id, pair.user_id) for pair in batch.unassign}
+        project_tasks = select(Task.id).where(Task.project_id == project_id)
+        stmt = delete(task_assignees).where(
+            tuple_(task_assignees.c.task_id, task_assignees.c.user_id).in_(pairs),
+            task_assignees.c.task_id.in_(project_tasks),
+        )
+        if dialect.delete_returning:
+            result = await db.execute(stmt.returning(task_assignees.c.task_id))
+            removed = result.scalars().all()
+            unassigned = len(removed)
+            touched.update(removed)
+        else:
+            result = await db.execute(stmt)
+            unassigned = result.rowcount
+            if unassigned:
+                result = await db.execute(
+                    project_tasks.where(Task.id.in_({t for t, _ in pairs}))
+                )
+                touched.update(result.scalars().all())
+
+    if batch.assign:
+        rows = [
+            {"task_id": task_id, "user_id": user_id}
+            for task_id, user_id in {(p.task_id, p.user_id) for p in batch.assign}
+        ]
+        # One multi-row INSERT; pairs that already exist are skipped
+        stmt = insert_ignoring_conflicts(db, task_assignees).values(rows)
+        if dialect.insert_returning:
+            result = await db.execute(stmt.returning(task_assignees.c.task_id))
+            added = result.scalars().all()
+            assigned = len(added)
+            touched.update(added)
+        else:
+            result = await db.execute(stmt)
+            assigned = result.rowcount
+            touched.update(row["task_id"] for row in rows)
+
+    if not touched:
+        # Nothing changed: give the revision back
+        await db.rollback()
+        revision = await get_project_revision(db, project_id)
+        return {
+            "cursor": encode_cursor(revision),
+            "assigned": 0,
+            "unassigned": 0,
+            "tasks": [],
+        }
+
+    await db.execute(
+        update(Task)
+        .where(Task.id.in_(touched))
+        .values(revision=revision)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+    result = await db.execute(
+        select(Task)
+        .options(selectinload(Task.assignees))
+        .where(Task.id.in_(touched))
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .execution_options(populate_existing=True)
+    )
+    tasks = result.scalars().all()
+
+    publish_project_event(
+        project_id,
+        "tasks.assignments",
+        revision,
+        task_ids=[str(task.id) for task in tasks],
+    )
+
+    return {
+        "cursor": encode_cursor(revision),
+        "assigned": assigned,
+        "unassigned": unassigned,
+        "tasks": tasks,
+    }
+
+
+@router.get("/project/{project_id}/stats", response_model=TaskStats)
+async def get_project_task_stats(
+    project_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Get task counts for a project without downloading its tasks.
+
+    Only members of the project can view its stats.
+    Returns the number of tasks per state, plus tasks that are overdue (due date
+    passed and not completed) and tasks with no assignee.
+
+    - **project_id**: UUID of the project
+    """
+    # Verify user has access to the project
+    await require_project_member(db, project_id, current_user)
+
+    # One pass over the project's tasks, grouped by state
+    is_overdue = and_(
+        Task.due_date < datetime.now(), Task.state != ModelTaskState.COMPLETED
+    )
+    is_unassigned = ~exists().where(task_assignees.c.task_id == Task.id)
+    result = await db.execute(
+        select(
+            Task.state,
+            func.count(),
+            func.count().filter(is_overdue),
+            func.count().filter(is_unassigned),
+        )
+        .where(Task.project_id == project_id)
+        .group_by(Task.state)
+    )
+
+    stats = {task_state.value: 0 for task_state in ModelTaskState}
+    stats.update(total=0, overdue=0, unassigned=0)
+    for task_state, count, overdue, unassigned in result.all():
+        stats[task_state.value] = count
+        stats["total"] += count
+        stats["overdue"] += overdue
+        stats["unassigned"] += unassigned
+
+    return stats
+
+
+@router.get("/project/{project_id}/export")
+async def export_project_tasks(
+    project_id: uuid.UUID,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Download all tasks of a project, with their assignees.
+
+    Only members of the project can export its tasks. Tasks are streamed
+    oldest first as they are read from the database, so the download starts
+    at once and the server's memory use does not grow with the project.
+
+    - **format**: `ndjson` (one JSON task per line, the default) or `csv`
+      (assignees as `;`-separated usernames)
+    """
+    # Verify user has access to the project
+    await require_project_member(db, project_id, current_user)
+
+    chunk_size = settings.TASK_EXPORT_CHUNK_SIZE
+    records = iter_task_records(db, project_id, chunk_size)
+    if format == "csv":
+        body, media_type = csv_chunks(records, chunk_size), "text/csv"
+    else:
+        body, media_type = ndjson_chunks(records, chunk_size), "application/x-ndjson"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="project-{project_id}-tasks.{format}"'
+            )
+        },
+    )
+
+
+@router.post("/project/{project_id}/import", response_model=TaskImportResult)
+async def import_project_tasks(
+    project_id: uuid.UUID,
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_session),
+):
+    """
+    Create many tasks in a project from an NDJSON or CSV upload.
+
+    Only members of the project can import tasks. Send the file as the raw
+    request body; it is parsed as it is received and written in chunks, so
+    very large files are fine. Accepts the export format: `title` (required),
+    `description`, `state`, `due_date` and `assignees` (usernames of project
+    members). Invalid rows are skipped and listed in `errors` with their row
+    number; all other rows are imported.
+
+    - **format**: `ndjson` (one JSON task per line, the default) or `csv`
+      (with a header row; assignees `;`-separated)
+    """
+    # Verify user has access to the project
+    await require_project_member(db, project_id, current_user)
+
+    importer = TaskImporter(
+        db,
+        project_id,
+        chunk_size=settings.TASK_IMPORT_CHUNK_SIZE,
+        max_errors=settings.TASK_IMPORT_MAX_ERRORS,
+    )
+    return await importer.run(parse_rows(iter_lines(request.stream()), format))
+
+
 @router.get("/assigned-to-me", response_model=list[TaskWithDetails])
 async def get_my_assigned_tasks(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_async_session),
     state: Optional[str] = None,
+    include_completed: bool = False,
+    due_after: Optional[datetime] = None,
+    due_before: Optional[datetime] = None,
+    limit: Optional[int] = Query(None, ge=1, le=settings.TASK_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
 ):
     """
-    Get all tasks assigned to the current user across all projects.
+    Get tasks assigned to the current user across all projects.
+
+    Sorted by closest due date first (tasks without a due date last).
+
     - **state**: optional filter by task state (scheduled, in_progress, completed)
+    - **include_completed**: include completed tasks (excluded by default unless
+      `state=completed` is requested)
+    - **due_after** / **due_before**: optional due-date window
+      (`due_after <= due_date < due_before`)
+    - **limit**: optional page size; when more tasks remain, the response carries
+      an `X-Next-Cursor` header
+    - **cursor**: value of a previous `X-Next-Cursor` header to fetch the next page
     """
     # Build query to get tasks assigned to current user
+    # (served by the task_assignees.user_id index)
     query = (
         select(Task)
         .options(selectinload(Task.assignees), selectinload(Task.project))
-        .join(Task.assignees)
-        .where(User.id == current_user.id)
+        .join(task_assignees, task_assignees.c.task_id == Task.id)
+        .join(Project, Project.id == Task.project_id)
+        .where(
+            task_assignees.c.user_id == current_user.id, Project.deleted_at.is_(None)
+        )
     )
 
     # Apply state filter if provided
@@ -162,10 +749,44 @@ async def get_my_assigned_tasks(
                 detail="Invalid task state filter",
             )
         query = query.where(Task.state == state_enum)
+    elif not include_completed:
+        query = query.where(Task.state != ModelTaskState.COMPLETED)
+
+    # Apply due-date window if provided
+    if due_after is not None:
+        query = query.where(Task.due_date >= due_after.replace(tzinfo=None))
+    if due_before is not None:
+        query = query.where(Task.due_date < due_before.replace(tzinfo=None))
+
+    # Resume strictly after the (due_date, id) of the last task already served
+    if cursor:
+        raw_due_date, raw_id = decode_cursor(cursor, size=2)
+        after_due_date = parse_cursor_datetime(raw_due_date, nullable=True)
+        after_id = parse_cursor_uuid(raw_id)
+        if after_due_date is None:
+            query = query.where(Task.due_date.is_(None), Task.id > after_id)
+        else:
+            query = query.where(
+                or_(
+                    Task.due_date > after_due_date,
+                    and_(Task.due_date == after_due_date, Task.id > after_id),
+                    Task.due_date.is_(None),
+                )
+            )
 
     # sorted by closest due date first
-    result = await db.execute(query.order_by(Task.due_date.asc().nullslast()))
-    tasks = result.scalars().all()
+    query = query.order_by(Task.due_date.asc().nullslast(), Task.id.asc())
+    if limit is not None:
+        # Fetch one extra row to learn whether another page exists
+        query = query.limit(limit + 1)
+
+    result = await db.execute(query)
+    tasks = list(result.scalars().all())
+
+    if limit is not None and len(tasks) > limit:
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.due_date, last.id)
 
     return tasks
 
@@ -181,24 +802,10 @@ async def get_task(
 
     Only members of the task's project can view the task.
     """
-    # Fetch task with relationships
-    result = await db.execute(
-        select(Task)
-        .options(
-            selectinload(Task.assignees),
-            selectinload(Task.project).selectinload(Project.users),
-        )
-        .where(Task.id == task_id)
+    # Fetch task with assignees, checking that the current user is a project member
+    task = await get_task_for_member(
+        db, task_id, current_user, options=[selectinload(Task.assignees)]
     )
-    task = result.scalar_one_or_none()
-
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
-        )
-
-    # Check if current user is a member of the task's project
-    await verify_project_access(task.project_id, current_user, db)
 
     return task
 
@@ -215,37 +822,45 @@ async def update_task(
 
     Only members of the task's project can update the task.
     """
-    # Fetch task by id
-    result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.project).selectinload(Project.users))
-        .where(Task.id == task_id)
-    )
-    task = result.scalar_one_or_none()
+    # Fetch task, checking that the current user is a member of its project
+    task = await get_task_for_member(db, task_id, current_user)
 
-    if not task:
+    # Update fields if provided
+    changes = task_data.model_dump(exclude_none=True)
+    if "state" in changes:
+        # Convert schema TaskState to model TaskState
+        changes["state"] = ModelTaskState(task_data.state.value)
+    if "due_date" in changes:
+        changes["due_date"] = changes["due_date"].replace(tzinfo=None)
+
+    project_id = task.project_id
+    revision = await bump_project_revision(db, project_id)
+    if "state" in changes:
+        # Read the state again now that the project lock serializes writers,
+        # so concurrent moves of the same task count it only once
+        state = await db.scalar(select(Task.state).where(Task.id == task_id))
+        if state is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+            )
+        await adjust_project_counters(
+            db, project_id, **task_count_deltas(removed=state, added=changes["state"])
+        )
+    task = await update_returning(
+        db, Task, [Task.id == task_id], {**changes, "revision": revision}
+    )
+    if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
-
-    # Check if current user is a member of the task's project
-    await verify_project_access(task.project_id, current_user, db)
-
-    # Update fields if provided
-    if task_data.title is not None:
-        task.title = task_data.title
-    if task_data.description is not None:
-        task.description = task_data.description
-    if task_data.state is not None:
-        # Convert schema TaskState to model TaskState
-        task.state = ModelTaskState(task_data.state.value)
-    if task_data.due_date is not None:
-        duedate = task_data.due_date
-        duedate = duedate.replace(tzinfo=None) if duedate else None
-        task.due_date = duedate
-
     await db.commit()
-    await db.refresh(task)
+
+    publish_project_event(
+        task.project_id,
+        "task.updated",
+        revision,
+        task=TaskResponse.model_validate(task).model_dump(mode="json"),
+    )
 
     return task
 
@@ -261,25 +876,21 @@ async def delete_task(
 
     Only members of the task's project can delete the task.
     """
-    # Fetch task
-    result = await db.execute(
-        select(Task)
-        .options(selectinload(Task.project).selectinload(Project.users))
-        .where(Task.id == task_id)
-    )
-    task = result.scalar_one_or_none()
-
-    if not task:
+    # Fetch task, checking that the current user is a member of its project
+    task = await get_task_for_member(db, task_id, current_user)
+
+    # Leave a tombstone so delta-sync clients learn about the deletion
+    project_id = task.project_id
+    revision = await record_task_deletion(db, task)
+    if revision is None:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
-
-    # Check if current user is a member of the task's project
-    await verify_project_access(task.project_id, current_user, db)
-
-    await db.delete(task)
     await db.commit()
 
+    publish_project_event(project_id, "task.deleted", revision, task_id=str(task_id))
+
     return None
 
 
@@ -296,57 +907,52 @@ async def assign_user_to_task(
     Only members of the task's project can assign users.
     The user being assigned must also be a member of the same project.
     """
-    # Fetch task with relationships
-    result = await db.execute(
-        select(Task)
-        .options(
-            selectinload(Task.assignees),
-            selectinload(Task.project).selectinload(Project.users),
-        )
-        .where(Task.id == task_id)
-    )
-    task = result.scalar_one_or_none()
-
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
-        )
-
-    # Check if current user is a member of the task's project
-    await verify_project_access(task.project_id, current_user, db)
-
-    # Fetch user to assign
-    result = await db.execute(select(User).where(User.id == user_id))
-    user_to_assign = result.scalar_one_or_none()
+    # Fetch task, checking that the current user is a project member
+    task = await get_task_for_member(db, task_id, current_user)
 
-    if not user_to_assign:
+    # Check that the user to assign exists
+    if await db.get(User, user_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
     # Verify the user to assign is a member of the task's project
-    if user_to_assign not in task.project.users:
+    if not await is_project_member(db, task.project_id, user_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot assign a user who is not a member of the task's project",
         )
 
-    # Check if user is already assigned
-    if user_to_assign in task.assignees:
+    # Lock the project before writing, like every other task write path
+    revision = await touch_task(db, task)
+
+    # Add the assignee row directly; the primary key rejects duplicates
+    result = await db.execute(
+        insert_ignoring_conflicts(db, task_assignees).values(
+            task_id=task_id, user_id=user_id
+        )
+    )
+    if result.rowcount == 0:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User is already assigned to this task",
         )
 
-    # Assign user to task
-    task.assignees.append(user_to_assign)
     await db.commit()
-    result = await db.execute(
-        select(Task).options(selectinload(Task.assignees)).where(Task.id == task_id)
+    # The row was written directly; drop any stale in-session collection
+    db.expire(task, ["assignees"])
+    task_data = await _task_with_assignees(db, task)
+
+    publish_project_event(
+        task.project_id,
+        "task.assigned",
+        revision,
+        user_id=str(user_id),
+        task=TaskWithAssignees.model_validate(task_data).model_dump(mode="json"),
     )
-    task = result.scalar_one()
 
-    return task
+    return task_data
 
 
 @router.delete("/{task_id}/assign/{user_id}", response_model=TaskWithAssignees)
@@ -361,47 +967,43 @@ async def unassign_user_from_task(
 
     Only members of the task's project can unassign users.
     """
-    # Fetch task with relationships
-    result = await db.execute(
-        select(Task)
-        .options(
-            selectinload(Task.assignees),
-            selectinload(Task.project).selectinload(Project.users),
-        )
-        .where(Task.id == task_id)
-    )
-    task = result.scalar_one_or_none()
+    # Fetch task, checking that the current user is a project member
+    task = await get_task_for_member(db, task_id, current_user)
 
-    if not task:
+    # Check that the user to unassign exists
+    if await db.get(User, user_id) is None:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    # Check if current user is a member of the task's project
-    await verify_project_access(task.project_id, current_user, db)
-
-    # Fetch user to unassign
-    result = await db.execute(select(User).where(User.id == user_id))
-    user_to_unassign = result.scalar_one_or_none()
+    # Lock the project before writing, like every other task write path
+    revision = await touch_task(db, task)
 
-    if not user_to_unassign:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+    # Delete the assignee row directly
+    result = await db.execute(
+        delete(task_assignees).where(
+            task_assignees.c.task_id == task_id,
+            task_assignees.c.user_id == user_id,
         )
-
-    # Check if user is assigned to the task
-    if user_to_unassign not in task.assignees:
+    )
+    if result.rowcount == 0:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User is not assigned to this task",
         )
 
-    # Unassign user from task
-    task.assignees.remove(user_to_unassign)
     await db.commit()
-    result = await db.execute(
-        select(Task).options(selectinload(Task.assignees)).where(Task.id == task_id)
+    # The row was written directly; drop any stale in-session collection
+    db.expire(task, ["assignees"])
+    task_data = await _task_with_assignees(db, task)
+
+    publish_project_event(
+        task.project_id,
+        "task.unassigned",
+        revision,
+        user_id=str(user_id),
+        task=TaskWithAssignees.model_validate(task_data).model_dump(mode="json"),
     )
-    task = result.scalar_one()
 
-    return task
+    return task_data
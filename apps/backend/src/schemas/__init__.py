@@ -1,18 +1,29 @@
 from src.schemas.user import UserCreate, UserResponse, UserLogin, Token, TokenData
 from src.schemas.project import (
+    ProjectBoard,
     ProjectCreate,
     ProjectResponse,
     ProjectUpdate,
     ProjectWithUsers,
 )
 from src.schemas.task import (
+    TaskAssignmentBatch,
+    TaskAssignmentResult,
+    TaskBatch,
+    TaskBatchResult,
+    TaskChanges,
     TaskCreate,
+    TaskImportResult,
     TaskResponse,
+    TaskStats,
     TaskUpdate,
     TaskWithAssignees,
     TaskWithDetails,
     TaskState,
 )
+from src.schemas.dashboard import Dashboard
+from src.schemas.job import JobResponse, JobStatus
+
 
 __all__ = [
     "UserCreate",
@@ -20,14 +31,25 @@ __all__ = [
     "UserLogin",
     "Token",
     "TokenData",
+    "ProjectBoard",
     "ProjectCreate",
     "ProjectResponse",
     "ProjectUpdate",
     "ProjectWithUsers",
+    "TaskAssignmentBatch",
+    "TaskAssignmentResult",
+    "TaskBatch",
+    "TaskBatchResult",
+    "TaskChanges",
     "TaskCreate",
+    "TaskImportResult",
     "TaskResponse",
+    "TaskStats",
     "TaskUpdate",
     "TaskWithAssignees",
     "TaskWithDetails",
     "TaskState",
+    "Dashboard",
+    "JobResponse",
+    "JobStatus",
 ]
@@ -0,0 +1,16 @@
+"""Pydantic schemas for the dashboard summary."""
+
+from pydantic import BaseModel
+
+from src.schemas.project import ProjectResponse
+from src.schemas.task import TaskWithDetails
+
+
+class Dashboard(BaseModel):
+    """The current user's projects and upcoming assigned tasks."""
+
+    projects: list[ProjectResponse]
+    # Open (not completed) tasks assigned to the user, across all projects
+    assigned_count: int
+    # The first of those tasks by due date (tasks without a due date last)
+    upcoming_tasks: list[TaskWithDetails]
@@ -0,0 +1,26 @@
+"""Pydantic schemas for background job status."""
+
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Optional
+import uuid
+
+from src.models.job import JobStatus
+
+
+class JobResponse(BaseModel):
+    """Status of a background job, as returned by `GET /jobs/{id}`."""
+
+    id: uuid.UUID
+    kind: str
+    status: JobStatus
+    attempts: int
+    max_attempts: int
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
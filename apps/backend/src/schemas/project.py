@@ -4,6 +4,8 @@ from pydantic import BaseModel, Field
 from datetime import datetime
 import uuid
 
+from src.schemas.task import TaskStats, TaskWithAssignees
+
 
 class ProjectBase(BaseModel):
     """Common project fields shared by create/update/response schemas."""
@@ -31,6 +33,11 @@ class ProjectResponse(ProjectBase):
     id: uuid.UUID
     created_at: datetime
     updated_at: datetime
+    last_activity_at: datetime | None = None
+    scheduled_count: int = 0
+    in_progress_count: int = 0
+    completed_count: int = 0
+    member_count: int = 0
 
     class Config:
         from_attributes = True
@@ -55,3 +62,11 @@ class UserBasicInfo(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ProjectBoard(BaseModel):
+    """Everything a project board needs: project, members, tasks and counts."""
+
+    project: ProjectWithUsers
+    tasks: list[TaskWithAssignees]
+    stats: TaskStats
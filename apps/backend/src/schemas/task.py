@@ -1,10 +1,12 @@
 """Pydantic schemas for tasks."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Literal, Optional, Union
 import uuid
 
+from src.core.config import settings
+
 # Import TaskState from models to ensure consistency
 from src.models.task import TaskState
 
@@ -65,6 +67,140 @@ class TaskWithAssignees(TaskResponse):
         from_attributes = True
 
 
+class TaskChanges(BaseModel):
+    """Delta of a project's tasks since a sync cursor."""
+
+    cursor: str
+    tasks: list[TaskWithAssignees]
+    deleted: list[uuid.UUID]
+
+
+class TaskBatchCreate(TaskBase):
+    """Batch operation creating a task in the batch's project."""
+
+    op: Literal["create"]
+
+
+class TaskBatchUpdate(TaskUpdate):
+    """Batch operation updating a task (partial updates allowed)."""
+
+    op: Literal["update"]
+    id: uuid.UUID
+
+
+class TaskBatchDelete(BaseModel):
+    """Batch operation deleting a task."""
+
+    op: Literal["delete"]
+    id: uuid.UUID
+
+
+TaskBatchOperation = Annotated[
+    Union[TaskBatchCreate, TaskBatchUpdate, TaskBatchDelete],
+    Field(discriminator="op"),
+]
+
+
+class TaskBatch(BaseModel):
+    """Request body for applying several task operations to one project."""
+
+    operations: list[TaskBatchOperation] = Field(
+        ..., min_length=1, max_length=settings.TASK_BATCH_MAX_OPERATIONS
+    )
+
+
+class TaskBatchItemResult(BaseModel):
+    """Outcome of one batch operation, in request order."""
+
+    index: int
+    op: str
+    # HTTP-style status: 201 created, 200 updated, 204 deleted, 4xx on failure
+    status: int
+    id: Optional[uuid.UUID] = None
+    task: Optional[TaskResponse] = None
+    detail: Optional[str] = None
+
+
+class TaskBatchResult(BaseModel):
+    """Per-item results of a batch, plus the project's revision after it."""
+
+    cursor: str
+    results: list[TaskBatchItemResult]
+
+
+class TaskAssignment(BaseModel):
+    """One (task, user) assignee pair."""
+
+    task_id: uuid.UUID
+    user_id: uuid.UUID
+
+
+class TaskAssignmentBatch(BaseModel):
+    """Request body for adding and removing many assignees in one project.
+
+    Removals are applied before additions, so moving tasks from one user to
+    another is a single request.
+    """
+
+    assign: list[TaskAssignment] = []
+    unassign: list[TaskAssignment] = []
+
+    @model_validator(mode="after")
+    def check_size(self) -> "TaskAssignmentBatch":
+        """Require at least one pair and cap the batch size."""
+        size = len(self.assign) + len(self.unassign)
+        if size == 0:
+            raise ValueError("At least one assignment is required")
+        if size > settings.TASK_BATCH_MAX_OPERATIONS:
+            raise ValueError(
+                f"At most {settings.TASK_BATCH_MAX_OPERATIONS} assignments are allowed"
+            )
+        return self
+
+
+class TaskAssignmentResult(BaseModel):
+    """Outcome of an assignment batch.
+
+    `assigned`/`unassigned` count pairs that actually changed; pairs that were
+    already in the requested state are skipped.
+    """
+
+    cursor: str
+    assigned: int
+    unassigned: int
+    tasks: list[TaskWithAssignees]
+
+
+class TaskImportError(BaseModel):
+    """A row skipped by an import (line number for NDJSON, record for CSV)."""
+
+    row: int
+    errors: list[str]
+
+
+class TaskImportResult(BaseModel):
+    """Outcome of a bulk import.
+
+    `errors` lists at most `TASK_IMPORT_MAX_ERRORS` rows; `failed` counts all.
+    """
+
+    cursor: str
+    imported: int
+    failed: int
+    errors: list[TaskImportError]
+
+
+class TaskStats(BaseModel):
+    """Task counts for a project, by state plus overdue and unassigned totals."""
+
+    total: int
+    scheduled: int
+    in_progress: int
+    completed: int
+    overdue: int
+    unassigned: int
+
+
 class ProjectBasicInfo(BaseModel):
     """Minimal project representation used in nested task payloads."""
 
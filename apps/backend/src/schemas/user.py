@@ -48,3 +48,4 @@ class TokenData(BaseModel):
     """Decoded token payload data used by auth helpers."""
 
     username: str | None = None
+    user_id: UUID | None = None
@@ -0,0 +1,188 @@
+"""
+Project authorization helpers.
+
+Membership is answered with an indexed probe on the `user_projects`
+association table, so routers never need to load a project's full member
+list just to decide whether the caller may touch it. Deleted projects (and
+their tasks) are treated as missing. Confirmed memberships are cached per
+process; routers that remove members or delete projects must call
+`invalidate_membership`, which is broadcast to every worker.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.core.config import settings
+from src.models.project import Project, user_projects
+from src.models.task import Task
+from src.models.user import User
+from src.utils.cache import TTLCache
+from src.utils.change_bus import change_bus
+
+
+# (user_id, project_id) -> True for confirmed memberships. Only positive
+# answers are cached so a newly added member is never refused.
+membership_cache: TTLCache[bool] = TTLCache(
+    max_size=settings.MEMBERSHIP_CACHE_MAX_SIZE,
+    ttl_seconds=settings.MEMBERSHIP_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_membership(
+    project_id: uuid.UUID, user_id: Optional[uuid.UUID] = None
+) -> None:
+    """Drop cached memberships for one user, or all users when `user_id` is None."""
+    change_bus.publish(
+        "membership",
+        project_id=str(project_id),
+        user_id=str(user_id) if user_id is not None else None,
+    )
+
+
+def _drop_memberships(message: dict[str, Any]) -> None:
+    project_id = uuid.UUID(message["project_id"])
+    if message["user_id"] is not None:
+        membership_cache.invalidate((uuid.UUID(message["user_id"]), project_id))
+    else:
+        membership_cache.invalidate_where(lambda key, _: key[1] == project_id)
+
+
+change_bus.subscribe("membership", _drop_memberships)
+
+
+def membership_clause(project_id: Any, user_id: Any) -> ColumnElement[bool]:
+    """EXISTS clause that is true when `user_id` is a member of `project_id`.
+
+    Both arguments may be literal values or column expressions, so the clause
+    can be embedded in larger statements (e.g. correlated to `Task.project_id`).
+    """
+    return exists().where(
+        user_projects.c.project_id == project_id,
+        user_projects.c.user_id == user_id,
+    )
+
+
+def _project_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+    )
+
+
+def _not_a_member() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You are not a member of this project",
+    )
+
+
+async def is_project_member(
+    db: AsyncSession, project_id: uuid.UUID, user_id: uuid.UUID
+) -> bool:
+    """Return True if the user is a member of the project."""
+    if membership_cache.get((user_id, project_id)):
+        return True
+
+    result = await db.execute(
+        select(membership_clause(project_id, user_id)).where(
+            Project.id == project_id, Project.deleted_at.is_(None)
+        )
+    )
+    is_member = bool(result.scalar())
+    if is_member:
+        membership_cache.set((user_id, project_id), True)
+    return is_member
+
+
+async def require_project_member(
+    db: AsyncSession, project_id: uuid.UUID, user: User
+) -> None:
+    """
+    Verify that `user` is a member of the project in a single query.
+
+    Raises 404 if the project does not exist and 403 if the user is not a member.
+    Served from `membership_cache` without touching the database when possible.
+    """
+    if membership_cache.get((user.id, project_id)):
+        return
+
+    result = await db.execute(
+        select(membership_clause(project_id, user.id)).where(
+            Project.id == project_id, Project.deleted_at.is_(None)
+        )
+    )
+    is_member = result.scalar_one_or_none()
+
+    if is_member is None:
+        raise _project_not_found()
+    if not is_member:
+        raise _not_a_member()
+
+    membership_cache.set((user.id, project_id), True)
+
+
+async def get_project_for_member(
+    db: AsyncSession,
+    project_id: uuid.UUID,
+    user: User,
+    options: Sequence[Any] = (),
+) -> Project:
+    """
+    Load a project and check the caller's membership in the same statement.
+
+    `options` are passed through to the query (e.g. `selectinload(Project.users)`
+    when the response needs the member list).
+    Raises 404 if the project does not exist and 403 if the user is not a member.
+    """
+    result = await db.execute(
+        select(Project, membership_clause(Project.id, user.id))
+        .options(*options)
+        .where(Project.id == project_id, Project.deleted_at.is_(None))
+    )
+    row = result.one_or_none()
+
+    if row is None:
+        raise _project_not_found()
+    project, is_member = row
+    if not is_member:
+        raise _not_a_member()
+
+    membership_cache.set((user.id, project_id), True)
+    return project
+
+
+async def get_task_for_member(
+    db: AsyncSession,
+    task_id: uuid.UUID,
+    user: User,
+    options: Sequence[Any] = (),
+) -> Task:
+    """
+    Load a task and check that the caller belongs to its project in one statement.
+
+    Raises 404 if the task does not exist and 403 if the user is not a member of
+    the task's project.
+    """
+    result = await db.execute(
+        select(Task, membership_clause(Task.project_id, user.id))
+        .options(*options)
+        .join(Project, Project.id == Task.project_id)
+        .where(Task.id == task_id, Project.deleted_at.is_(None))
+    )
+    row = result.one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
+        )
+    task, is_member = row
+    if not is_member:
+        raise _not_a_member()
+
+    membership_cache.set((user.id, task.project_id), True)
+    return task
@@ -0,0 +1,106 @@
+"""
+Small in-process caches.
+
+Provides a bounded, TTL-based LRU cache used to keep hot lookups (such as
+authenticated principals) off the database on every request.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, Optional, TypeVar
+
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[V]):
+    """Bounded LRU cache whose entries expire after a time-to-live.
+
+    Entries are evicted least-recently-used first once `max_size` is reached.
+    Hit/miss/eviction counters are kept so the cache can be monitored.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for `key`, or None if missing or expired."""
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry  # type: ignore[misc]
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Store `value` under `key`.
+
+        `ttl_seconds` may shorten (never extend) the cache-wide TTL for this entry.
+        """
+        if self.max_size <= 0:
+            return
+
+        ttl = self.ttl_seconds
+        if ttl_seconds is not None:
+            ttl = min(ttl, ttl_seconds)
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, V], bool]) -> int:
+        """Drop every entry for which `predicate(key, value)` is true.
+
+        Returns the number of entries removed.
+        """
+        stale = [
+            key for key, (_, value) in self._entries.items() if predicate(key, value)
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the cache counters."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,374 @@
+"""
+Cross-worker change notifications.
+
+Every uvicorn worker keeps its own in-process state (principal and membership
+caches, event-stream subscribers). Routers publish a small message on the
+change bus after committing; the bus applies it in the current worker right
+away and forwards it to every other worker through a backend:
+
+- `PostgresNotifyBackend` uses LISTEN/NOTIFY on a dedicated asyncpg connection.
+- `PollingTableBackend` appends rows to `change_events` and polls for rows
+  written by other workers, for databases without LISTEN/NOTIFY (SQLite).
+
+Consumers register a handler per message kind at import time. Until `start`
+is called (e.g. in tests or single-process tools) the bus is purely local.
+"""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, Optional, Protocol
+import asyncio
+import json
+import logging
+import uuid
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.models.change_event import ChangeEvent
+
+
+logger = logging.getLogger(__name__)
+
+Message = dict[str, Any]
+Handler = Callable[[Message], None]
+
+# NOTIFY payloads must stay below 8000 bytes
+_MAX_NOTIFY_PAYLOAD = 7900
+
+# Keys of a project event that are always small enough to forward
+_EVENT_SUMMARY_KEYS = ("type", "project_id", "revision", "cursor", "task_id", "user_id")
+
+
+def _encode(message: Message) -> str:
+    return json.dumps(message, default=str, separators=(",", ":"))
+
+
+class ChangeBusBackend(Protocol):
+    """Transport that carries messages between workers."""
+
+    async def start(self, on_message: Callable[[Message], None]) -> None: ...
+
+    async def send(self, messages: list[Message]) -> None: ...
+
+    async def stop(self) -> None: ...
+
+
+class PostgresNotifyBackend:
+    """LISTEN/NOTIFY transport on one asyncpg connection per worker.
+
+    Oversized project events are reduced to their summary keys; subscribers can
+    fetch the full state through the delta-sync endpoint. A lost connection is
+    reopened (and LISTEN re-issued) in the background with capped backoff, and
+    by the next `send`; messages sent while it was down are not delivered, so
+    other workers fall back to their cache TTLs for those changes.
+    """
+
+    def __init__(
+        self, database_url: str, channel: str, reconnect_delay: float = 1.0
+    ) -> None:
+        url = make_url(database_url).set(drivername="postgresql")
+        self.dsn = url.render_as_string(hide_password=False)
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.reconnects = 0
+        self._connection: Any = None
+        self._lock = asyncio.Lock()
+        self._reconnector: Optional[asyncio.Task[None]] = None
+        self._stopped = False
+        self._on_message: Optional[Callable[[Message], None]] = None
+
+    async def start(self, on_message: Callable[[Message], None]) -> None:
+        self._on_message = on_message
+        self._stopped = False
+        await self._connect()
+
+    async def _connect(self) -> Any:
+        """Return the open connection, opening it and listening first if needed."""
+        import asyncpg
+
+        async with self._lock:
+            if self._connection is None or self._connection.is_closed():
+                connection = await asyncpg.connect(self.dsn)
+                await connection.add_listener(self.channel, self._notified)
+                connection.add_termination_listener(self._lost)
+                if self._connection is not None:
+                    self.reconnects += 1
+                self._connection = connection
+            return self._connection
+
+    def _lost(self, connection: Any) -> None:
+        if self._stopped or connection is not self._connection:
+            return
+        if self._reconnector is None or self._reconnector.done():
+            logger.warning("Change bus connection lost, reconnecting")
+            self._reconnector = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self.reconnect_delay
+        while not self._stopped:
+            try:
+                await self._connect()
+                return
+            except Exception:
+                logger.exception("Change bus reconnect failed")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    def _notified(self, _connection: Any, _pid: int, _channel: str, payload: str):
+        if self._on_message is not None:
+            self._on_message(json.loads(payload))
+
+    @staticmethod
+    def _payload(message: Message) -> str:
+        payload = _encode(message)
+        if len(payload.encode()) <= _MAX_NOTIFY_PAYLOAD or "event" not in message:
+            return payload
+        event = message["event"]
+        summary = {key: event[key] for key in _EVENT_SUMMARY_KEYS if key in event}
+        return _encode({**message, "event": summary})
+
+    async def send(self, messages: list[Message]) -> None:
+        connection = await self._connect()
+        await connection.execute(
+            "SELECT pg_notify($1, payload) FROM unnest($2::text[]) AS payload",
+            self.channel,
+            [self._payload(message) for message in messages],
+        )
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._reconnector is not None:
+            self._reconnector.cancel()
+            try:
+                await self._reconnector
+            except asyncio.CancelledError:
+                pass
+            self._reconnector = None
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+
+class PollingTableBackend:
+    """Transport that appends messages to `change_events` and polls for new rows.
+
+    Each worker starts reading after the newest row present at startup and
+    prunes rows older than `retention_seconds`.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        poll_interval: float,
+        retention_seconds: float,
+    ) -> None:
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.last_id = 0
+        self._poller: Optional[asyncio.Task[None]] = None
+        self._on_message: Optional[Callable[[Message], None]] = None
+
+    async def start(self, on_message: Callable[[Message], None]) -> None:
+        self._on_message = on_message
+        async with self.engine.connect() as conn:
+            self.last_id = (
+                await conn.execute(select(func.max(ChangeEvent.id)))
+            ).scalar() or 0
+        self._poller = asyncio.create_task(self._poll_loop())
+
+    async def send(self, messages: list[Message]) -> None:
+        now = datetime.now()
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                insert(ChangeEvent),
+                [
+                    {"payload": _encode(message), "created_at": now}
+                    for message in messages
+                ],
+            )
+
+    async def poll(self) -> int:
+        """Deliver rows written since the last poll; return how many were read."""
+        async with self.engine.connect() as conn:
+            result = await conn.execute(
+                select(ChangeEvent.id, ChangeEvent.payload)
+                .where(ChangeEvent.id > self.last_id)
+                .order_by(ChangeEvent.id)
+            )
+            rows = result.all()
+        for row_id, payload in rows:
+            self.last_id = row_id
+            if self._on_message is not None:
+                self._on_message(json.loads(payload))
+        return len(rows)
+
+    async def prune(self) -> None:
+        """Delete rows every worker has had ample time to read."""
+        cutoff = datetime.now() - timedelta(seconds=self.retention_seconds)
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                delete(ChangeEvent).where(ChangeEvent.created_at < cutoff)
+            )
+
+    async def _poll_loop(self) -> None:
+        prune_every = max(1, int(60 / max(self.poll_interval, 0.001)))
+        polls = 0
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll()
+                polls += 1
+                if polls % prune_every == 0:
+                    await self.prune()
+            except Exception:
+                logger.exception("Change bus poll failed")
+
+    async def stop(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+
+
+class ChangeBus:
+    """Publishes change messages to handlers in this and every other worker."""
+
+    def __init__(self, max_batch_size: int = 100) -> None:
+        self.worker_id = uuid.uuid4().hex
+        self.max_batch_size = max_batch_size
+        self._handlers: dict[str, list[Handler]] = {}
+        self._backend: Optional[ChangeBusBackend] = None
+        self._outbox: Optional[asyncio.Queue[Message]] = None
+        self._sender: Optional[asyncio.Task[None]] = None
+        self.published = 0
+        self.sent = 0
+        self.received = 0
+        self.send_failures = 0
+
+    def subscribe(self, kind: str, handler: Handler) -> None:
+        """Call `handler(message)` for every message of `kind`, from any worker."""
+        self._handlers.setdefault(kind, []).append(handler)
+
+    def publish(self, kind: str, **data: Any) -> None:
+        """Apply a change locally and queue it for the other workers.
+
+        `data` must be JSON-serializable (UUIDs are sent as strings). Call only
+        after the change has been committed.
+        """
+        message: Message = {"kind": kind, "origin": self.worker_id, **data}
+        self.published += 1
+        self._dispatch(message)
+        if self._outbox is not None:
+            self._outbox.put_nowait(message)
+
+    def _dispatch(self, message: Message) -> None:
+        for handler in self._handlers.get(message.get("kind", ""), ()):
+            try:
+                handler(message)
+            except Exception:
+                logger.exception("Change bus handler failed for %s", message["kind"])
+
+    def _receive(self, message: Message) -> None:
+        # Our own messages were already applied when they were published
+        if message.get("origin") == self.worker_id:
+            return
+        self.received += 1
+        self._dispatch(message)
+
+    @property
+    def running(self) -> bool:
+        return self._backend is not None
+
+    async def start(self, backend: ChangeBusBackend) -> None:
+        """Connect to `backend` and start forwarding published messages."""
+        await backend.start(self._receive)
+        self._backend = backend
+        self._outbox = asyncio.Queue()
+        self._sender = asyncio.create_task(self._send_loop())
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been handed to the backend."""
+        if self._outbox is not None:
+            await self._outbox.join()
+
+    async def stop(self) -> None:
+        """Send what is still queued, then disconnect (called on shutdown)."""
+        if self._backend is None:
+            return
+        try:
+            await asyncio.wait_for(self.flush(), timeout=5)
+        except asyncio.TimeoutError:
+            pass
+        if self._sender is not None:
+            self._sender.cancel()
+            try:
+                await self._sender
+            except asyncio.CancelledError:
+                pass
+        await self._backend.stop()
+        self._backend = None
+        self._outbox = None
+        self._sender = None
+
+    async def _send_loop(self) -> None:
+        assert self._outbox is not None and self._backend is not None
+        outbox, backend = self._outbox, self._backend
+        while True:
+            batch = [await outbox.get()]
+            while len(batch) < self.max_batch_size and not outbox.empty():
+                batch.append(outbox.get_nowait())
+            try:
+                await backend.send(batch)
+                self.sent += len(batch)
+            except Exception:
+                # Other workers fall back to their cache TTLs for these changes
+                self.send_failures += len(batch)
+                logger.exception("Change bus send failed")
+            finally:
+                for _ in batch:
+                    outbox.task_done()
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the bus counters."""
+        return {
+            "backend": type(self._backend).__name__ if self._backend else None,
+            "worker_id": self.worker_id,
+            "queued": self._outbox.qsize() if self._outbox is not None else 0,
+            "published": self.published,
+            "sent": self.sent,
+            "received": self.received,
+            "send_failures": self.send_failures,
+        }
+
+
+change_bus = ChangeBus()
+
+
+def create_change_bus_backend(engine: AsyncEngine) -> Optional[ChangeBusBackend]:
+    """Pick the backend configured by `CHANGE_BUS_BACKEND`.
+
+    `auto` uses LISTEN/NOTIFY on PostgreSQL and the polling table elsewhere;
+    `local` disables cross-worker delivery.
+    """
+    choice = settings.CHANGE_BUS_BACKEND
+    if choice == "local":
+        return None
+    if choice == "auto":
+        is_postgres = engine.dialect.name == "postgresql"
+        choice = "postgres" if is_postgres else "table"
+    if choice == "postgres":
+        return PostgresNotifyBackend(settings.DATABASE_URL, settings.CHANGE_BUS_CHANNEL)
+    if choice == "table":
+        return PollingTableBackend(
+            engine,
+            poll_interval=settings.CHANGE_BUS_POLL_INTERVAL_SECONDS,
+            retention_seconds=settings.CHANGE_BUS_RETENTION_SECONDS,
+        )
+    raise ValueError(f"Unknown CHANGE_BUS_BACKEND: {choice!r}")
@@ -0,0 +1,38 @@
+"""
+Conditional GET helpers (ETag / If-None-Match).
+
+ETags are derived from project revisions, which every mutating handler bumps,
+so a client polling an unchanged resource gets a 304 without the server
+loading or serializing anything.
+"""
+
+from typing import Any, Optional
+import hashlib
+
+from fastapi import Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the values that determine a response body."""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True if an If-None-Match header value matches `etag`.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    `W/`-prefixed copy of the tag (as some proxies produce) still matches.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
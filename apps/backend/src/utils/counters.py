@@ -0,0 +1,118 @@
+"""
+Denormalized project counters.
+
+`Project` stores its number of tasks per state and its number of members so
+project cards and stats never have to count rows. Routers adjust the counters
+with relative `UPDATE ... SET col = col + n` statements in the same
+transaction as the change (see `bump_project_revision`), which keeps
+concurrent writers from overwriting each other. `recompute_project_counters`
+rebuilds them from the source tables, directly or as a background job.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional
+import uuid
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.project import Project, user_projects
+from src.models.task import Task, TaskState
+from src.utils.jobs import job_handler
+
+
+# Project column holding the number of tasks in each state
+TASK_STATE_COUNTERS: dict[TaskState, str] = {
+    TaskState.SCHEDULED: "scheduled_count",
+    TaskState.IN_PROGRESS: "in_progress_count",
+    TaskState.COMPLETED: "completed_count",
+}
+
+
+def task_count_deltas(
+    removed: Optional[TaskState] = None, added: Optional[TaskState] = None
+) -> dict[str, int]:
+    """Counter adjustments for a task leaving state `removed` and entering `added`.
+
+    Pass only `added` for a new task and only `removed` for a deleted one.
+    """
+    deltas: dict[str, int] = {}
+    if removed is not None:
+        column = TASK_STATE_COUNTERS[TaskState(removed)]
+        deltas[column] = deltas.get(column, 0) - 1
+    if added is not None:
+        column = TASK_STATE_COUNTERS[TaskState(added)]
+        deltas[column] = deltas.get(column, 0) + 1
+    return {column: delta for column, delta in deltas.items() if delta}
+
+
+async def adjust_project_counters(
+    db: AsyncSession, project_id: uuid.UUID, **counter_deltas: int
+) -> None:
+    """Add `counter_deltas` to the project's counters in the current transaction.
+
+    For adjustments that are only known once `bump_project_revision` holds the
+    project lock; everything else passes its deltas to the bump directly.
+    """
+    counters = {
+        column: getattr(Project, column) + delta
+        for column, delta in counter_deltas.items()
+        if delta
+    }
+    if not counters:
+        return
+    await db.execute(
+        update(Project)
+        .where(Project.id == project_id)
+        # Keep updated_at: counters are not edits to the project itself
+        .values(updated_at=Project.updated_at, **counters)
+    )
+
+
+async def recompute_project_counters(
+    db: AsyncSession, project_ids: Optional[Sequence[uuid.UUID]] = None
+) -> int:
+    """Rebuild the counters of the given projects (all when None) from scratch.
+
+    Only projects whose stored counters disagree with the source tables are
+    written. Returns how many projects were corrected; the caller commits.
+    """
+    actual = {
+        column: select(func.count())
+        .where(Task.project_id == Project.id, Task.state == task_state)
+        .scalar_subquery()
+        for task_state, column in TASK_STATE_COUNTERS.items()
+    }
+    actual["member_count"] = (
+        select(func.count())
+        .where(user_projects.c.project_id == Project.id)
+        .scalar_subquery()
+    )
+
+    stmt = (
+        update(Project)
+        .where(
+            or_(
+                *(getattr(Project, column) != value for column, value in actual.items())
+            )
+        )
+        # Keep updated_at: counters are not edits to the project itself
+        .values(updated_at=Project.updated_at, **actual)
+        .execution_options(synchronize_session=False)
+    )
+    if project_ids is not None:
+        stmt = stmt.where(Project.id.in_(project_ids))
+
+    result = await db.execute(stmt)
+    return result.rowcount
+
+
+@job_handler("projects.recompute_counters")
+async def recompute_counters_job(db: AsyncSession, payload: dict[str, Any]) -> dict:
+    """Job: rebuild the counters of `payload["project_ids"]` (all when absent)."""
+    project_ids = payload.get("project_ids")
+    if project_ids is not None:
+        project_ids = [uuid.UUID(project_id) for project_id in project_ids]
+    repaired = await recompute_project_counters(db, project_ids)
+    await db.commit()
+    return {"projects_repaired": repaired}
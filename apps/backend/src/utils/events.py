@@ -0,0 +1,150 @@
+"""
+In-process pub/sub for project change events.
+
+Routers publish an event after committing a change to a project or its tasks;
+events travel over the change bus so every worker sees them, and the event
+stream endpoint subscribes per project and forwards events to
+connected clients as Server-Sent Events. Each subscriber has a bounded queue:
+a client that falls too far behind is dropped with a final `resync` event
+rather than letting its backlog grow without limit.
+"""
+
+from typing import Any, Optional
+import asyncio
+import json
+import uuid
+
+from src.core.config import settings
+from src.utils.change_bus import change_bus
+from src.utils.pagination import encode_cursor
+
+
+# Sentinel queued for a subscriber that overflowed its queue
+_OVERFLOW: dict[str, Any] = {"type": "resync"}
+
+
+class Subscription:
+    """A single client's view of one project's event stream."""
+
+    def __init__(self, project_id: uuid.UUID, max_queue_size: int) -> None:
+        self.project_id = project_id
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(
+            maxsize=max_queue_size
+        )
+        self.overflowed = False
+
+    def _offer(self, event: dict[str, Any]) -> bool:
+        """Queue an event without blocking; return False if the queue is full."""
+        if self.overflowed:
+            return True
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _overflow(self) -> None:
+        """Discard the backlog and leave only the resync sentinel."""
+        self.overflowed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(_OVERFLOW)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict[str, Any]]:
+        """Wait for the next event; return None if `timeout` elapses first."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ProjectEventBroker:
+    """Fans project events out to every subscriber of that project."""
+
+    def __init__(self, max_queue_size: int) -> None:
+        self.max_queue_size = max_queue_size
+        self._subscribers: dict[uuid.UUID, set[Subscription]] = {}
+        self.published = 0
+        self.dropped_subscribers = 0
+
+    def subscribe(self, project_id: uuid.UUID) -> Subscription:
+        """Register a new subscriber for `project_id`."""
+        subscription = Subscription(project_id, self.max_queue_size)
+        self._subscribers.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber (safe to call more than once)."""
+        subscribers = self._subscribers.get(subscription.project_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.project_id]
+
+    def publish(self, project_id: uuid.UUID, event: dict[str, Any]) -> None:
+        """Deliver `event` to every subscriber of `project_id` without blocking.
+
+        Subscribers whose queue is full are cut off: their backlog is replaced
+        by a single `resync` event and they are unsubscribed.
+        """
+        self.published += 1
+        for subscription in list(self._subscribers.get(project_id, ())):
+            if not subscription._offer(event):
+                subscription._overflow()
+                self.unsubscribe(subscription)
+                self.dropped_subscribers += 1
+
+    def subscriber_count(self, project_id: Optional[uuid.UUID] = None) -> int:
+        """Number of subscribers for one project, or overall."""
+        if project_id is not None:
+            return len(self._subscribers.get(project_id, ()))
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the broker counters."""
+        return {
+            "projects": len(self._subscribers),
+            "subscribers": self.subscriber_count(),
+            "published": self.published,
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+
+project_events = ProjectEventBroker(settings.EVENT_STREAM_QUEUE_SIZE)
+
+
+def publish_project_event(
+    project_id: uuid.UUID,
+    event_type: str,
+    revision: Optional[int] = None,
+    **data: Any,
+) -> None:
+    """Publish a change event for a project. Call only after the change commits.
+
+    `revision` is the project revision the change produced; it is exposed as a
+    delta-sync cursor so clients can catch up with `/tasks/project/{id}/changes`.
+    """
+    event: dict[str, Any] = {"type": event_type, "project_id": str(project_id)}
+    if revision is not None:
+        event["revision"] = revision
+        event["cursor"] = encode_cursor(revision)
+    event.update(data)
+    # Delivered to this worker's subscribers immediately, then to other workers
+    change_bus.publish("project_event", project_id=str(project_id), event=event)
+
+
+def _deliver_project_event(message: dict[str, Any]) -> None:
+    project_events.publish(uuid.UUID(message["project_id"]), message["event"])
+
+
+change_bus.subscribe("project_event", _deliver_project_event)
+
+
+def format_sse(event: dict[str, Any]) -> str:
+    """Serialize an event in the text/event-stream wire format."""
+    lines = [f"event: {event['type']}"]
+    if "revision" in event:
+        lines.append(f"id: {event['revision']}")
+    lines.append(f"data: {json.dumps(event, default=str)}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,334 @@
+"""
+In-process background jobs.
+
+Routers hand heavy work to a job instead of doing it inside the request:
+`enqueue_job` inserts a row into the `jobs` table as part of the caller's
+transaction, the router commits, calls `job_runner.wake()` and answers
+202 Accepted with the job, whose progress clients follow at `GET /jobs/{id}`.
+
+Every worker runs a `JobRunner` (started from the app lifespan) with
+`JOB_WORKER_CONCURRENCY` coroutines. A runner claims a due job with a
+conditional UPDATE, so two workers never run the same attempt, and holds it
+under a lease of `JOB_TIMEOUT_SECONDS` plus `LEASE_MARGIN_SECONDS`; a job
+whose worker died is claimed again once the lease runs out. Failed or lost
+attempts are retried, failures with exponential backoff, until `max_attempts`
+is reached. A worker only records the outcome of the attempt it claimed, so
+a late finish never overwrites a newer attempt.
+
+Handlers are registered per job kind with `@job_handler("kind")`. A handler
+gets its own session and the job's payload, commits its own work, and may
+return a JSON-serializable dict that is stored as the job's result. Long
+handlers can call `report_job_progress` as they commit their work, so the
+job's result shows how far they got while it is still running. Handlers must
+be safe to run again after a partial failure.
+"""
+
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any, Optional
+import asyncio
+import logging
+import time
+import uuid
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.db.database import async_session_maker
+from src.models.job import Job, JobStatus
+from src.utils.sql import insert_returning, update_returning
+
+
+logger = logging.getLogger(__name__)
+
+# Added to the handler timeout to form the lease, so the lease outlasts the
+# handler plus the writes around it
+LEASE_MARGIN_SECONDS = 60.0
+
+JobHandler = Callable[[AsyncSession, dict[str, Any]], Awaitable[Optional[dict]]]
+
+_handlers: dict[str, JobHandler] = {}
+
+# The job whose handler the current coroutine is running
+_current_job: ContextVar[Optional[Job]] = ContextVar("current_job", default=None)
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Register the decorated coroutine as the handler for jobs of `kind`."""
+
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+
+    return register
+
+
+async def enqueue_job(
+    db: AsyncSession,
+    kind: str,
+    payload: Optional[dict[str, Any]] = None,
+    created_by_id: Optional[uuid.UUID] = None,
+) -> Job:
+    """Queue a job in the current transaction; it runs once the caller commits."""
+    if kind not in _handlers:
+        raise ValueError(f"No handler registered for job kind {kind!r}")
+    return await insert_returning(
+        db,
+        Job,
+        {
+            "kind": kind,
+            "payload": payload or {},
+            "max_attempts": settings.JOB_MAX_ATTEMPTS,
+            "created_by_id": created_by_id,
+        },
+    )
+
+
+async def report_job_progress(db: AsyncSession, progress: dict[str, Any]) -> None:
+    """Store `progress` as the running job's result, in the caller's transaction.
+
+    Does nothing outside a job handler, e.g. when a handler's work is called
+    directly. Like `_finish`, only writes to the attempt that was claimed.
+    """
+    job = _current_job.get()
+    if job is None:
+        return
+    await db.execute(
+        update(Job)
+        .where(
+            Job.id == job.id,
+            Job.status == JobStatus.RUNNING,
+            Job.attempts == job.attempts,
+        )
+        .values(result=progress)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class JobRunner:
+    """Runs queued jobs from the `jobs` table on a pool of worker coroutines."""
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession] = async_session_maker,
+        concurrency: int = settings.JOB_WORKER_CONCURRENCY,
+        poll_interval: float = settings.JOB_POLL_INTERVAL_SECONDS,
+        retry_delay: float = settings.JOB_RETRY_DELAY_SECONDS,
+        timeout: float = settings.JOB_TIMEOUT_SECONDS,
+        retention_seconds: float = settings.JOB_RETENTION_SECONDS,
+    ) -> None:
+        self.session_maker = session_maker
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.retention_seconds = retention_seconds
+        self.running = 0
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+        self._last_prune = 0.0
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._workers: list[asyncio.Task[None]] = []
+
+    def wake(self) -> None:
+        """Tell idle workers a job was queued, instead of waiting for the poll."""
+        self._wakeup.set()
+
+    async def _claim(self, db: AsyncSession) -> Optional[Job]:
+        now = datetime.now()
+        due = and_(Job.status == JobStatus.QUEUED, Job.run_after <= now)
+        lost = and_(Job.status == JobStatus.RUNNING, Job.locked_until < now)
+        result = await db.execute(
+            select(Job.id, Job.attempts < Job.max_attempts)
+            .where(or_(due, lost))
+            .order_by(Job.run_after)
+            .limit(self.concurrency + 1)
+        )
+        for job_id, attempts_left in result.tuples().all():
+            if not attempts_left:
+                # A lost job that used up its attempts (e.g. it keeps killing
+                # its worker) fails instead of being run forever
+                job = await update_returning(
+                    db,
+                    Job,
+                    [Job.id == job_id, lost],
+                    {
+                        "status": JobStatus.FAILED,
+                        "error": "Lease expired on the last attempt",
+                        "finished_at": now,
+                        "locked_until": None,
+                    },
+                )
+                await db.commit()
+                if job is not None:
+                    self.failed += 1
+                    logger.error("Job %s (%s) failed: lease expired", job.id, job.kind)
+                continue
+
+            # Only one worker's UPDATE can still match the claimable state
+            job = await update_returning(
+                db,
+                Job,
+                [Job.id == job_id, or_(due, lost)],
+                {
+                    "status": JobStatus.RUNNING,
+                    "attempts": Job.attempts + 1,
+                    "started_at": now,
+                    "locked_until": now
+                    + timedelta(seconds=self.timeout + LEASE_MARGIN_SECONDS),
+                },
+            )
+            await db.commit()
+            if job is not None:
+                return job
+        return None
+
+    async def run_next(self) -> Optional[Job]:
+        """Claim and run one due job; return it finished, or None if none is due."""
+        async with self.session_maker() as db:
+            job = await self._claim(db)
+        if job is None:
+            return None
+
+        handler = _handlers.get(job.kind)
+        self.running += 1
+        token = _current_job.set(job)
+        try:
+            async with self.session_maker() as db:
+                if handler is None:
+                    raise LookupError(
+                        f"No handler registered for job kind {job.kind!r}"
+                    )
+                result = await asyncio.wait_for(
+                    handler(db, job.payload), timeout=self.timeout
+                )
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            return await self._failed(job, error, retry=handler is not None)
+        finally:
+            _current_job.reset(token)
+            self.running -= 1
+
+        self.succeeded += 1
+        return await self._finish(
+            job,
+            status=JobStatus.SUCCEEDED,
+            result=result,
+            error=None,
+            finished_at=datetime.now(),
+        )
+
+    async def _failed(self, job: Job, error: str, retry: bool) -> Job:
+        if retry and job.attempts < job.max_attempts:
+            self.retried += 1
+            delay = self.retry_delay * 2 ** (job.attempts - 1)
+            logger.warning(
+                "Job %s (%s) attempt %d failed, retrying in %.0fs: %s",
+                job.id,
+                job.kind,
+                job.attempts,
+                delay,
+                error,
+            )
+            return await self._finish(
+                job,
+                status=JobStatus.QUEUED,
+                error=error,
+                run_after=datetime.now() + timedelta(seconds=delay),
+            )
+
+        self.failed += 1
+        logger.error("Job %s (%s) failed: %s", job.id, job.kind, error)
+        return await self._finish(
+            job, status=JobStatus.FAILED, error=error, finished_at=datetime.now()
+        )
+
+    async def _finish(self, job: Job, **values: Any) -> Job:
+        async with self.session_maker() as db:
+            # Match the claimed attempt: if the lease ran out and another
+            # worker took the job over, its attempt owns the row now
+            finished = await update_returning(
+                db,
+                Job,
+                [
+                    Job.id == job.id,
+                    Job.status == JobStatus.RUNNING,
+                    Job.attempts == job.attempts,
+                ],
+                {**values, "locked_until": None},
+            )
+            await db.commit()
+        if finished is None:
+            logger.warning(
+                "Job %s (%s) attempt %d finished after losing its lease",
+                job.id,
+                job.kind,
+                job.attempts,
+            )
+            return job
+        return finished
+
+    async def prune(self) -> int:
+        """Delete finished jobs older than the retention period; return how many."""
+        cutoff = datetime.now() - timedelta(seconds=self.retention_seconds)
+        async with self.session_maker() as db:
+            result = await db.execute(delete(Job).where(Job.finished_at < cutoff))
+            await db.commit()
+        return result.rowcount
+
+    async def _work(self) -> None:
+        while not self._stopping:
+            try:
+                job = await self.run_next()
+                if job is None and time.monotonic() - self._last_prune > 3600:
+                    self._last_prune = time.monotonic()
+                    await self.prune()
+            except Exception:
+                logger.exception("Job runner failed")
+                job = None
+            if job is not None or self._stopping:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def start(self) -> None:
+        """Start the worker coroutines (called on startup)."""
+        self._stopping = False
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self.concurrency)
+        ]
+
+    async def stop(self, grace_period: float = 5.0) -> None:
+        """Stop the workers (called on shutdown).
+
+        Running jobs get `grace_period` seconds to finish; jobs cut off after
+        that run again once their lease expires.
+        """
+        self._stopping = True
+        self._wakeup.set()
+        if self._workers:
+            _, pending = await asyncio.wait(self._workers, timeout=grace_period)
+            for worker in pending:
+                worker.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._workers = []
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the runner counters."""
+        return {
+            "workers": len(self._workers),
+            "running": self.running,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+job_runner = JobRunner()
@@ -0,0 +1,75 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque, URL-safe strings encoding the sort key of the last row a
+client received. The next page starts strictly after that key, so every page
+costs the same regardless of how deep into the result set it is.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+import base64
+import binascii
+import json
+import uuid
+
+from fastapi import HTTPException, status
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+    )
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort-key values (datetimes, UUIDs, strings or None) into a cursor."""
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a cursor produced by `encode_cursor` into its raw values.
+
+    Raises 400 if the cursor is malformed or does not hold `size` values.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, binascii.Error):
+        raise _invalid_cursor()
+
+    if not isinstance(values, list) or len(values) != size:
+        raise _invalid_cursor()
+    return values
+
+
+def parse_cursor_datetime(value: Any, nullable: bool = False) -> Optional[datetime]:
+    """Convert a decoded cursor value back into a datetime (400 on bad input)."""
+    if value is None and nullable:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise _invalid_cursor()
+
+
+def parse_cursor_uuid(value: Any) -> uuid.UUID:
+    """Convert a decoded cursor value back into a UUID (400 on bad input)."""
+    try:
+        return uuid.UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        raise _invalid_cursor()
+
+
+def parse_cursor_int(value: Any) -> int:
+    """Convert a decoded cursor value back into a non-negative int (400 if bad)."""
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise _invalid_cursor()
+    return value
@@ -0,0 +1,108 @@
+"""
+Background purge of deleted projects.
+
+`DELETE /projects/{id}` only stamps `Project.deleted_at`, which hides the
+project from every query at once, and queues a "projects.purge" job in the
+same transaction. The job removes the rows off the request path: the
+project's tasks (whose assignee rows follow through ON DELETE CASCADE) and
+task tombstones are deleted in batches of `PROJECT_PURGE_BATCH_SIZE`, each
+batch committed on its own so no transaction holds locks for long, and the
+project row goes last. Each batch also writes the running row count into the
+job's result, so `GET /jobs/{id}` shows progress while the purge runs. An
+interrupted purge picks up where it stopped when the job is retried.
+"""
+
+from typing import Any
+import logging
+import uuid
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models.project import Project
+from src.models.task import Task, TaskDeletion
+from src.utils.jobs import job_handler, report_job_progress
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectPurger:
+    """Deletes the rows of soft-deleted projects in bounded batches."""
+
+    def __init__(self, batch_size: int = settings.PROJECT_PURGE_BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        # project_id -> rows deleted so far, for purges in progress
+        self.progress: dict[uuid.UUID, int] = {}
+        self.purged = 0
+
+    async def purge(self, db: AsyncSession, project_id: uuid.UUID) -> int:
+        """Remove a deleted project and its rows; return how many rows were deleted.
+
+        Does nothing if the project does not exist or has not been deleted.
+        """
+        deleted_at = await db.scalar(
+            select(Project.deleted_at).where(Project.id == project_id)
+        )
+        await db.commit()
+        if deleted_at is None:
+            return 0
+
+        deleted = 0
+        self.progress[project_id] = 0
+        try:
+            for model, key in ((Task, Task.id), (TaskDeletion, TaskDeletion.task_id)):
+                while True:
+                    batch = (
+                        select(key)
+                        .where(model.project_id == project_id)
+                        .limit(self.batch_size)
+                    )
+                    result = await db.execute(
+                        delete(model)
+                        .where(key.in_(batch))
+                        .execution_options(synchronize_session=False)
+                    )
+                    if not result.rowcount:
+                        await db.commit()
+                        break
+                    deleted += result.rowcount
+                    self.progress[project_id] = deleted
+                    await report_job_progress(db, {"rows_deleted": deleted})
+                    await db.commit()
+                    logger.info(
+                        "Purging project %s: %d rows deleted", project_id, deleted
+                    )
+
+            # The project row goes last, taking its memberships with it
+            result = await db.execute(
+                delete(Project)
+                .where(Project.id == project_id)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            deleted += result.rowcount
+        finally:
+            del self.progress[project_id]
+
+        self.purged += 1
+        logger.info("Purged project %s (%d rows)", project_id, deleted)
+        return deleted
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the purge counters."""
+        return {
+            "in_progress": {str(pid): rows for pid, rows in self.progress.items()},
+            "purged": self.purged,
+        }
+
+
+project_purger = ProjectPurger()
+
+
+@job_handler("projects.purge")
+async def purge_project_job(db: AsyncSession, payload: dict[str, Any]) -> dict:
+    """Job: remove the rows of the deleted project `payload["project_id"]`."""
+    rows = await project_purger.purge(db, uuid.UUID(payload["project_id"]))
+    return {"rows_deleted": rows}
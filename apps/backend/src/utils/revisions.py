@@ -0,0 +1,107 @@
+"""
+Project revision tracking.
+
+Every change to a project or its tasks bumps the project's `revision` counter
+inside the writing transaction; task changes also stamp the new value on the
+task (or on a `TaskDeletion` tombstone). Because the bump takes a row lock on
+the project, revisions are handed out in commit order, which makes them safe
+to use as a delta-sync cursor ("everything with revision > N") and as the
+basis for ETags. The same statement also applies any adjustments to the
+project's denormalized counters (see `src.utils.counters`).
+"""
+
+from datetime import datetime
+from typing import Optional
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.project import Project
+from src.models.task import Task, TaskDeletion
+from src.utils.counters import adjust_project_counters, task_count_deltas
+
+
+async def bump_project_revision(
+    db: AsyncSession, project_id: uuid.UUID, **counter_deltas: int
+) -> int:
+    """Increment the project's revision, stamp its activity time, return the revision.
+
+    `counter_deltas` maps counter columns (e.g. `member_count`) to the amount to
+    add to them in the same statement. Must run inside the transaction making
+    the change so everything commits (or rolls back) together with it.
+    """
+    counters = {
+        column: getattr(Project, column) + delta
+        for column, delta in counter_deltas.items()
+        if delta
+    }
+    stmt = (
+        update(Project).where(Project.id == project_id)
+        # Keep updated_at: it tracks edits to the project itself, not its tasks
+        .values(
+            revision=Project.revision + 1,
+            updated_at=Project.updated_at,
+            last_activity_at=datetime.now(),
+            **counters,
+        )
+    )
+
+    if db.get_bind().dialect.update_returning:
+        result = await db.execute(stmt.returning(Project.revision))
+        return result.scalar_one()
+
+    await db.execute(stmt)
+    result = await db.execute(select(Project.revision).where(Project.id == project_id))
+    return result.scalar_one()
+
+
+async def get_project_revision(db: AsyncSession, project_id: uuid.UUID) -> int:
+    """Return the project's current revision (404 if the project does not exist)."""
+    result = await db.execute(select(Project.revision).where(Project.id == project_id))
+    revision = result.scalar_one_or_none()
+    if revision is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+        )
+    return revision
+
+
+async def touch_task(db: AsyncSession, task: Task) -> int:
+    """Bump the project revision and stamp it on `task` as its last change.
+
+    Call before writing the change itself, so the project lock is taken first
+    as on every other task write path.
+    """
+    task.revision = await bump_project_revision(db, task.project_id)
+    return task.revision
+
+
+async def record_task_deletion(db: AsyncSession, task: Task) -> Optional[int]:
+    """Delete `task`, bump the project revision and leave a tombstone.
+
+    Returns the new revision, or None if the task was already gone (e.g.
+    deleted by a concurrent request); the caller should then roll back.
+    """
+    # Lock the project first: only one of two concurrent deletes finds the row
+    revision = await bump_project_revision(db, task.project_id)
+    stmt = (
+        delete(Task)
+        .where(Task.id == task.id)
+        .execution_options(synchronize_session=False)
+    )
+    # Assignee rows go with the task through ON DELETE CASCADE
+    if db.get_bind().dialect.delete_returning:
+        state = await db.scalar(stmt.returning(Task.state))
+    else:
+        state = await db.scalar(select(Task.state).where(Task.id == task.id))
+        await db.execute(stmt)
+    if state is None:
+        return None
+
+    await adjust_project_counters(
+        db, task.project_id, **task_count_deltas(removed=state)
+    )
+    db.add(TaskDeletion(task_id=task.id, project_id=task.project_id, revision=revision))
+    return revision
@@ -1,20 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
+import asyncio
+import time
+import uuid
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
+from pydantic import ValidationError
 
 from src.core.config import settings
 from src.schemas.user import TokenData
 from src.models.user import User
 from src.db.database import get_async_session
+from src.utils.cache import TTLCache
+from src.utils.change_bus import change_bus
 
 
+T = TypeVar("T")
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
+
+# Verified access token -> detached snapshot of the user it belongs to.
+# Entries never outlive the token's own `exp` claim.
+principal_cache: TTLCache[User] = TTLCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -27,6 +45,86 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHashPool:
+    """Runs bcrypt work on a dedicated thread pool with bounded concurrency.
+
+    bcrypt releases the GIL, so moving it onto threads keeps the event loop free
+    to serve other requests during login/registration bursts. Callers beyond
+    `max_concurrency` wait on the loop (counted as `queued`) rather than piling
+    work into the executor.
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.max_queued = 0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run `func(*args)` on the pool and return its result."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="password-hash"
+            )
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        semaphore = self._semaphore
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        try:
+            await semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        self.running += 1
+        try:
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            semaphore.release()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (called on application shutdown)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._semaphore = None
+        self._loop = None
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of the pool counters."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "max_queued": self.max_queued,
+        }
+
+
+password_hash_pool = PasswordHashPool(settings.PASSWORD_HASH_MAX_CONCURRENCY)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop."""
+    return await password_hash_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    return await password_hash_pool.run(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -50,6 +148,11 @@ async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User
     return result.scalar_one_or_none()
 
 
+async def get_user_by_id(db: AsyncSession, user_id: uuid.UUID) -> Optional[User]:
+    """Get a user by primary key (uses the session identity map when possible)."""
+    return await db.get(User, user_id)
+
+
 async def authenticate_user(
     db: AsyncSession, username: str, password: str
 ) -> Optional[User]:
@@ -57,15 +160,71 @@ async def authenticate_user(
     user = await get_user_by_username(db, username)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
     return user
 
 
+def _snapshot_user(user: User) -> User:
+    """Copy a loaded user into a clean, detached instance shareable across sessions."""
+    snapshot = User(
+        **{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+    )
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def invalidate_user_principals(user_id: uuid.UUID) -> None:
+    """Drop every cached principal belonging to `user_id`, in every worker."""
+    change_bus.publish("user", user_id=str(user_id))
+
+
+def _drop_user_principals(message: dict[str, Any]) -> None:
+    user_id = uuid.UUID(message["user_id"])
+    principal_cache.invalidate_where(lambda _token, user: user.id == user_id)
+
+
+change_bus.subscribe("user", _drop_user_principals)
+
+
+# Session.info key collecting the users changed in the current transaction
+_CHANGED_USERS = "changed_user_ids"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _record_changed_user(_mapper, _connection, target: User) -> None:
+    """Remember a changed or removed user until its transaction commits."""
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_CHANGED_USERS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    """Keep the principal cache coherent once user changes are committed."""
+    for user_id in session.info.pop(_CHANGED_USERS, ()):
+        invalidate_user_principals(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_users(session: Session) -> None:
+    session.info.pop(_CHANGED_USERS, None)
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_session)
 ) -> User:
-    """Get the current authenticated user from JWT token."""
+    """Get the current authenticated user from JWT token.
+
+    Verified tokens are cached (see `principal_cache`) so repeat requests with the
+    same token skip both JWT decoding and the user lookup.
+    """
+    cached = principal_cache.get(token)
+    if cached is not None:
+        # Attach the snapshot to this session without emitting a SELECT
+        return await db.merge(cached, load=False)
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -79,15 +238,45 @@ async def get_current_user(
         username: Optional[str] = payload.get("sub")
         if username is None:
             raise credentials_exception
-        token_data = TokenData(username=username)
-    except JWTError:
+        token_data = TokenData(username=username, user_id=payload.get("uid"))
+        expires_at: Optional[float] = payload.get("exp")
+    except (JWTError, ValidationError):
         raise credentials_exception
 
     if token_data.username is None:
         raise credentials_exception
 
-    user = await get_user_by_username(db, username=token_data.username)
+    if token_data.user_id is not None:
+        user = await get_user_by_id(db, token_data.user_id)
+    else:
+        # Tokens issued before `uid` was added only carry the username
+        user = await get_user_by_username(db, username=token_data.username)
     if user is None:
         raise credentials_exception
 
+    if expires_at is not None:
+        principal_cache.set(
+            token, _snapshot_user(user), ttl_seconds=expires_at - time.time()
+        )
+
     return user
+
+
+async def get_current_user_for_stream(
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    access_token: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_session),
+) -> User:
+    """Authenticate a streaming request.
+
+    Browsers' EventSource cannot set an Authorization header, so the same JWT
+    may also be passed as the `access_token` query parameter.
+    """
+    bearer = token or access_token
+    if not bearer:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await get_current_user(token=bearer, db=db)
@@ -0,0 +1,84 @@
+"""
+Dialect-aware SQL building blocks.
+
+The app runs on PostgreSQL in production and SQLite in development and tests.
+Both understand `INSERT ... ON CONFLICT DO NOTHING` (which SQLAlchemy only
+exposes through each dialect's own `insert` construct) and, on SQLite 3.35+,
+`INSERT/UPDATE ... RETURNING`, which lets a write hand back the stored row
+instead of following it with a SELECT.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Optional, TypeVar
+
+from sqlalchemy import Table, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.db.database import Base
+
+
+M = TypeVar("M", bound=Base)
+
+
+def insert_ignoring_conflicts(db: AsyncSession, table: Table) -> Insert:
+    """`INSERT ... ON CONFLICT DO NOTHING` into `table` for the session's database.
+
+    Rows that would violate a unique constraint (e.g. an association that
+    already exists) are skipped instead of failing the statement.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    if dialect == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing()
+    raise NotImplementedError(f"ON CONFLICT DO NOTHING is not supported on {dialect}")
+
+
+async def insert_returning(
+    db: AsyncSession, model: type[M], values: dict[str, Any]
+) -> M:
+    """INSERT one row and return it as a mapped object in a single round trip.
+
+    Column defaults, including server-side ones, come back through RETURNING.
+    Databases without INSERT ... RETURNING fall back to flush plus refresh.
+    """
+    if db.get_bind().dialect.insert_returning:
+        result = await db.scalars(insert(model).returning(model), [values])
+        return result.one()
+
+    instance = model(**values)
+    db.add(instance)
+    await db.flush()
+    await db.refresh(instance)
+    return instance
+
+
+async def update_returning(
+    db: AsyncSession,
+    model: type[M],
+    where: Sequence[ColumnElement[bool]],
+    values: dict[str, Any],
+) -> Optional[M]:
+    """UPDATE the row matching `where` and return it as a mapped object.
+
+    Returns None when no row matched. Any copy of the row already in the
+    session is overwritten with the stored values. Databases without
+    UPDATE ... RETURNING fall back to UPDATE plus SELECT.
+    """
+    stmt = update(model).where(*where).values(**values)
+    if db.get_bind().dialect.update_returning:
+        result = await db.execute(
+            stmt.returning(model).execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    result = await db.execute(stmt.execution_options(synchronize_session=False))
+    if result.rowcount == 0:
+        return None
+    result = await db.execute(
+        select(model).where(*where).execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
@@ -0,0 +1,297 @@
+"""
+Bulk import of tasks from NDJSON or CSV.
+
+The input is parsed as it arrives: bytes are decoded incrementally into lines
+and each line (or each CSV record, which may span lines inside quotes) becomes
+one row. Rows use the export format (see `src.utils.export`): `title`,
+`description`, `state`, `due_date` and optional `assignees` (usernames of
+project members, `;`-separated in CSV). Other columns, such as the exported
+`id` and timestamps, are ignored; imported tasks are new tasks.
+
+`TaskImporter` validates rows against `TaskCreate` a chunk at a time and
+writes each chunk of `TASK_IMPORT_CHUNK_SIZE` valid rows in its own short
+transaction: one revision bump (with the counter deltas), one multi-row
+INSERT for the tasks and one for their assignees. Rows that fail to parse or
+validate are skipped and reported with their row number; they never abort
+the rest of the import.
+"""
+
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterable, AsyncIterator
+from datetime import datetime, timedelta
+from typing import Any, Optional
+import codecs
+import csv
+import json
+import uuid
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.project import user_projects
+from src.models.task import Task, task_assignees
+from src.models.user import User
+from src.schemas.task import TaskCreate
+from src.utils.counters import task_count_deltas
+from src.utils.events import publish_project_event
+from src.utils.pagination import encode_cursor
+from src.utils.revisions import bump_project_revision, get_project_revision
+
+
+# Row columns read by the import; anything else is ignored
+IMPORT_FIELDS = ("title", "description", "state", "due_date")
+
+# A parsed row: its row number, and its fields or the reason it was unreadable
+ParsedRow = tuple[int, dict[str, Any] | ValueError]
+
+_task_list = TypeAdapter(list[TaskCreate])
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Decode UTF-8 byte chunks into lines, keeping their line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        # Split on "\n" only: str.splitlines also breaks on characters such
+        # as U+2028 that may appear unescaped inside JSON strings
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def parse_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[ParsedRow]:
+    """Parse one JSON object per line; blank lines are skipped."""
+    row = 0
+    async for line in lines:
+        row += 1
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield row, ValueError(f"invalid JSON: {exc.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield row, ValueError("expected a JSON object")
+            continue
+        yield row, data
+
+
+def _ends_in_quotes(line: str, in_quotes: bool) -> bool:
+    """Whether a CSV record is inside a quoted value at the end of `line`.
+
+    Follows the `csv` module: a quote opens a quoted value only at the start
+    of a field; anywhere else in an unquoted field (`5" screen`) it is a
+    literal character.
+    """
+    pos = line.find('"')
+    while pos >= 0:
+        if in_quotes:
+            if line.startswith('"', pos + 1):
+                # Escaped quote inside a quoted value
+                pos += 1
+            else:
+                in_quotes = False
+        elif pos == 0 or line[pos - 1] == ",":
+            in_quotes = True
+        pos = line.find('"', pos + 1)
+    return in_quotes
+
+
+async def parse_csv(lines: AsyncIterable[str]) -> AsyncIterator[ParsedRow]:
+    """Parse CSV with a header row; quoted values may span several lines.
+
+    Row numbers count records after the header.
+    """
+    header: Optional[list[str]] = None
+    record: list[str] = []
+    in_quotes = False
+    row = 0
+    async for line in lines:
+        record.append(line)
+        in_quotes = _ends_in_quotes(line, in_quotes)
+        if in_quotes:
+            continue
+        text = "".join(record)
+        record = []
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield row, ValueError(
+                f"expected {len(header)} columns, found {len(values)}"
+            )
+            continue
+        yield row, dict(zip(header, values))
+    if record:
+        yield row + 1, ValueError("unterminated quoted value")
+
+
+def parse_rows(lines: AsyncIterable[str], format: str) -> AsyncIterator[ParsedRow]:
+    """Parse `lines` as `format` ("ndjson" or "csv")."""
+    return parse_csv(lines) if format == "csv" else parse_ndjson(lines)
+
+
+class TaskImporter:
+    """Validates parsed rows and inserts them into a project in chunks."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        project_id: uuid.UUID,
+        chunk_size: int,
+        max_errors: int,
+    ) -> None:
+        self.db = db
+        self.project_id = project_id
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.imported = 0
+        self.failed = 0
+        self.errors: list[dict[str, Any]] = []
+        self.revision: Optional[int] = None
+        self._members: dict[str, uuid.UUID] = {}
+
+    def _error(self, row: int, messages: list[str]) -> None:
+        self.failed += 1
+        # Keep counting past the limit, but stop collecting details
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"row": row, "errors": messages})
+
+    def _prepare(self, data: dict[str, Any]) -> tuple[dict[str, Any], list[uuid.UUID]]:
+        """Split a row into `TaskCreate` input and the assignees' user IDs."""
+        fields = {
+            key: data[key] for key in IMPORT_FIELDS if data.get(key) not in (None, "")
+        }
+        fields["project_id"] = self.project_id
+
+        assignees = data.get("assignees") or []
+        if isinstance(assignees, str):
+            assignees = [name.strip() for name in assignees.split(";") if name.strip()]
+        elif not isinstance(assignees, list):
+            raise ValueError("assignees: expected a list or a ';'-separated string")
+        user_ids = []
+        for assignee in assignees:
+            username = (
+                assignee.get("username") if isinstance(assignee, dict) else assignee
+            )
+            if not isinstance(username, str):
+                raise ValueError(
+                    "assignees: expected usernames or objects with a username"
+                )
+            if username not in self._members:
+                raise ValueError(
+                    f"assignees: {username!r} is not a member of the project"
+                )
+            user_ids.append(self._members[username])
+        return fields, list(dict.fromkeys(user_ids))
+
+    def _validate(
+        self, pending: list[tuple[int, dict[str, Any], list[uuid.UUID]]]
+    ) -> list[tuple[TaskCreate, list[uuid.UUID]]]:
+        """Validate a chunk in one pass, reporting and dropping invalid rows."""
+        try:
+            tasks = _task_list.validate_python([fields for _, fields, _ in pending])
+            return list(zip(tasks, [user_ids for _, _, user_ids in pending]))
+        except ValidationError as exc:
+            invalid: dict[int, list[str]] = defaultdict(list)
+            for error in exc.errors():
+                index, *loc = error["loc"]
+                field = ".".join(str(part) for part in loc) or "row"
+                invalid[index].append(f"{field}: {error['msg']}")
+            for index, messages in sorted(invalid.items()):
+                self._error(pending[index][0], messages)
+            valid = [row for i, row in enumerate(pending) if i not in invalid]
+            return self._validate(valid) if valid else []
+
+    async def _insert(self, rows: list[tuple[TaskCreate, list[uuid.UUID]]]) -> None:
+        """Write one chunk of valid rows in a single transaction."""
+        deltas: Counter[str] = Counter()
+        for task, _ in rows:
+            deltas.update(task_count_deltas(added=task.state))
+        revision = await bump_project_revision(self.db, self.project_id, **deltas)
+
+        # Spread created_at by a microsecond per row to keep the file order
+        now = datetime.now()
+        task_rows = []
+        assignee_rows = []
+        for i, (task, user_ids) in enumerate(rows):
+            task_id = uuid.uuid4()
+            created_at = now + timedelta(microseconds=i)
+            due_date = task.due_date.replace(tzinfo=None) if task.due_date else None
+            task_rows.append(
+                {
+                    "id": task_id,
+                    "title": task.title,
+                    "description": task.description,
+                    "state": task.state,
+                    "due_date": due_date,
+                    "project_id": self.project_id,
+                    "revision": revision,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                }
+            )
+            assignee_rows.extend(
+                {"task_id": task_id, "user_id": user_id, "assigned_at": now}
+                for user_id in user_ids
+            )
+
+        await self.db.execute(insert(Task), task_rows)
+        if assignee_rows:
+            await self.db.execute(insert(task_assignees), assignee_rows)
+        await self.db.commit()
+
+        self.imported += len(task_rows)
+        self.revision = revision
+        publish_project_event(
+            self.project_id, "tasks.imported", revision, count=len(task_rows)
+        )
+
+    async def run(self, rows: AsyncIterable[ParsedRow]) -> dict[str, Any]:
+        """Import every row; return the `TaskImportResult` payload."""
+        result = await self.db.execute(
+            select(User.username, User.id)
+            .join(user_projects, user_projects.c.user_id == User.id)
+            .where(user_projects.c.project_id == self.project_id)
+        )
+        self._members = dict(result.all())
+
+        pending: list[tuple[int, dict[str, Any], list[uuid.UUID]]] = []
+        async for row, data in rows:
+            if isinstance(data, ValueError):
+                self._error(row, [str(data)])
+                continue
+            try:
+                fields, user_ids = self._prepare(data)
+            except ValueError as exc:
+                self._error(row, [str(exc)])
+                continue
+            pending.append((row, fields, user_ids))
+            if len(pending) >= self.chunk_size:
+                valid = self._validate(pending)
+                pending = []
+                if valid:
+                    await self._insert(valid)
+        if pending:
+            valid = self._validate(pending)
+            if valid:
+                await self._insert(valid)
+
+        if self.revision is None:
+            self.revision = await get_project_revision(self.db, self.project_id)
+        return {
+            "cursor": encode_cursor(self.revision),
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": sorted(self.errors, key=lambda error: error["row"]),
+        }
@@ -6,6 +6,7 @@ import pytest
 import asyncio
 from typing import AsyncGenerator, Generator
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
@@ -14,7 +15,8 @@ from src.db.database import Base, get_async_session
 
 # Import models to register them with Base
 from src.models import User, Project, Task, LicenseKey
-from src.utils.security import get_password_hash
+from src.utils.security import get_password_hash, principal_cache
+from src.utils.access import membership_cache
 
 
 @pytest.fixture(scope="session")
@@ -25,6 +27,16 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Reset in-process caches so state never leaks between tests."""
+    principal_cache.clear()
+    membership_cache.clear()
+    yield
+    principal_cache.clear()
+    membership_cache.clear()
+
+
 @pytest.fixture(scope="function")
 async def db_engine():
     """Create a test database engine with a single connection."""
@@ -75,6 +87,19 @@ async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest.fixture
+def query_counter(db_engine) -> Generator[list[str], None, None]:
+    """Record every SQL statement executed against the test engine."""
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, _params, _context, _executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
 @pytest.fixture(scope="function")
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create a test client with overridden database session."""
@@ -167,6 +192,7 @@ async def test_project(db_session: AsyncSession, test_user: User) -> Project:
     project = Project(
         title="Test Project",
         description="A test project description",
+        member_count=1,
     )
     # Add the user to the project through the many-to-many relationship
     project.users.append(test_user)
@@ -1,6 +1,18 @@
+import asyncio
+import time
+
 import pytest
 from httpx import AsyncClient
 
+from jose import jwt
+
+from src.core.config import settings
+from src.utils.security import (
+    PasswordHashPool,
+    create_access_token,
+    principal_cache,
+)
+
 
 class TestRegistration:
     """Test user registration functionality."""
@@ -137,3 +149,111 @@ class TestAuthentication:
         response = await client.get("/auth/me")
 
         assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_login_token_carries_user_id(self, client: AsyncClient, test_user):
+        """Test issued tokens include the user's UUID for primary-key lookups."""
+        response = await client.post(
+            "/auth/login",
+            data={"username": test_user.username, "password": "testpassword123"},
+        )
+
+        payload = jwt.decode(
+            response.json()["access_token"],
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+        )
+        assert payload["sub"] == test_user.username
+        assert payload["uid"] == str(test_user.id)
+
+    @pytest.mark.asyncio
+    async def test_legacy_username_only_token(self, client: AsyncClient, test_user):
+        """Test tokens without a `uid` claim are still accepted."""
+        token = create_access_token(data={"sub": test_user.username})
+        response = await client.get(
+            "/auth/me", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["id"] == str(test_user.id)
+
+    @pytest.mark.asyncio
+    async def test_token_with_malformed_user_id(self, client: AsyncClient, test_user):
+        """Test a token whose `uid` is not a UUID is rejected."""
+        token = create_access_token(data={"sub": test_user.username, "uid": "nope"})
+        response = await client.get(
+            "/auth/me", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 401
+
+
+class TestPrincipalCache:
+    """Test caching of verified token principals."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_requests_hit_cache(
+        self, client: AsyncClient, auth_headers, test_user
+    ):
+        """Test the second request with the same token is served from the cache."""
+        first = await client.get("/auth/me", headers=auth_headers)
+        hits_before = principal_cache.hits
+
+        second = await client.get("/auth/me", headers=auth_headers)
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json()["id"] == str(test_user.id)
+        assert principal_cache.hits == hits_before + 1
+
+    @pytest.mark.asyncio
+    async def test_user_change_invalidates_cache(
+        self, client: AsyncClient, auth_headers, test_user, db_session
+    ):
+        """Test updating a user drops their cached principal."""
+        await client.get("/auth/me", headers=auth_headers)
+        assert len(principal_cache) == 1
+
+        # Nothing is published before the change commits, nor after a rollback
+        test_user.email = "rolled-back@example.com"
+        await db_session.flush()
+        assert len(principal_cache) == 1
+        await db_session.rollback()
+        await client.get("/auth/me", headers=auth_headers)
+        assert len(principal_cache) == 1
+
+        test_user.email = "changed@example.com"
+        await db_session.flush()
+        assert len(principal_cache) == 1
+        await db_session.commit()
+
+        assert len(principal_cache) == 0
+        response = await client.get("/auth/me", headers=auth_headers)
+        assert response.json()["email"] == "changed@example.com"
+
+
+class TestPasswordHashPool:
+    """Test the bounded thread pool used for bcrypt work."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        """Test callers beyond the cap queue instead of running concurrently."""
+        pool = PasswordHashPool(max_concurrency=1)
+
+        def slow_double(value: int) -> int:
+            time.sleep(0.05)
+            return value * 2
+
+        try:
+            results = await asyncio.gather(
+                *(pool.run(slow_double, i) for i in range(3))
+            )
+        finally:
+            pool.shutdown()
+
+        assert results == [0, 2, 4]
+        stats = pool.stats()
+        assert stats["completed"] == 3
+        assert stats["max_queued"] == 2
+        assert stats["queued"] == 0
+        assert stats["running"] == 0
@@ -0,0 +1,198 @@
+"""
+Tests for the cross-worker change bus.
+"""
+
+import uuid
+
+import pytest
+
+from src.utils.access import invalidate_membership, membership_cache
+from src.utils.change_bus import (
+    ChangeBus,
+    PollingTableBackend,
+    PostgresNotifyBackend,
+    change_bus,
+)
+from src.utils.events import project_events
+
+
+def make_worker(db_engine) -> tuple[ChangeBus, PollingTableBackend, list[dict]]:
+    """Create a bus on the polling-table backend that records `ping` messages."""
+    bus = ChangeBus()
+    backend = PollingTableBackend(db_engine, poll_interval=3600, retention_seconds=60)
+    received: list[dict] = []
+    bus.subscribe("ping", received.append)
+    return bus, backend, received
+
+
+class TestChangeBus:
+    """Test message delivery between bus instances."""
+
+    @pytest.mark.asyncio
+    async def test_publish_reaches_other_worker(self, db_engine):
+        """Test a message published by one worker is delivered to another."""
+        bus_a, backend_a, received_a = make_worker(db_engine)
+        bus_b, backend_b, received_b = make_worker(db_engine)
+        await bus_a.start(backend_a)
+        await bus_b.start(backend_b)
+        try:
+            bus_a.publish("ping", value=1)
+            await bus_a.flush()
+            await backend_a.poll()
+            await backend_b.poll()
+        finally:
+            await bus_a.stop()
+            await bus_b.stop()
+
+        # Applied once locally, and not again when read back from the table
+        assert [m["value"] for m in received_a] == [1]
+        assert [m["value"] for m in received_b] == [1]
+        assert bus_a.sent == 1
+        assert bus_b.received == 1
+
+    @pytest.mark.asyncio
+    async def test_new_worker_skips_old_messages(self, db_engine):
+        """Test a worker started later does not replay earlier messages."""
+        bus_a, backend_a, _ = make_worker(db_engine)
+        await bus_a.start(backend_a)
+        bus_a.publish("ping", value=1)
+        await bus_a.flush()
+
+        bus_b, backend_b, received_b = make_worker(db_engine)
+        await bus_b.start(backend_b)
+        try:
+            assert await backend_b.poll() == 0
+        finally:
+            await bus_a.stop()
+            await bus_b.stop()
+
+        assert received_b == []
+
+    @pytest.mark.asyncio
+    async def test_prune_removes_old_rows(self, db_engine):
+        """Test rows older than the retention window are pruned."""
+        bus, backend, _ = make_worker(db_engine)
+        backend.retention_seconds = -1
+        await bus.start(backend)
+        try:
+            bus.publish("ping", value=1)
+            await bus.flush()
+            await backend.prune()
+            reader = PollingTableBackend(db_engine, 3600, 60)
+            reader._on_message = lambda message: None
+            assert await reader.poll() == 0
+        finally:
+            await bus.stop()
+
+    @pytest.mark.asyncio
+    async def test_remote_membership_invalidation(self):
+        """Test membership invalidations from another worker clear the local cache."""
+        user_id, project_id = uuid.uuid4(), uuid.uuid4()
+        membership_cache.set((user_id, project_id), True)
+
+        change_bus._receive(
+            {
+                "kind": "membership",
+                "origin": "other-worker",
+                "project_id": str(project_id),
+                "user_id": str(user_id),
+            }
+        )
+
+        assert membership_cache.get((user_id, project_id)) is None
+
+    @pytest.mark.asyncio
+    async def test_remote_project_event_reaches_subscribers(self):
+        """Test project events from another worker are delivered to local streams."""
+        project_id = uuid.uuid4()
+        subscription = project_events.subscribe(project_id)
+        try:
+            change_bus._receive(
+                {
+                    "kind": "project_event",
+                    "origin": "other-worker",
+                    "project_id": str(project_id),
+                    "event": {"type": "task.deleted", "project_id": str(project_id)},
+                }
+            )
+            event = await subscription.get(timeout=1)
+        finally:
+            project_events.unsubscribe(subscription)
+
+        assert event["type"] == "task.deleted"
+
+    def test_local_invalidation_without_backend(self):
+        """Test invalidation applies immediately when the bus is not started."""
+        user_id, project_id = uuid.uuid4(), uuid.uuid4()
+        membership_cache.set((user_id, project_id), True)
+
+        invalidate_membership(project_id)
+
+        assert membership_cache.get((user_id, project_id)) is None
+
+
+class FakeConnection:
+    """Stands in for an asyncpg connection that can be dropped."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.listeners: list = []
+        self.termination_listeners: list = []
+        self.executed: list[tuple] = []
+
+    async def add_listener(self, channel, callback) -> None:
+        self.listeners.append((channel, callback))
+
+    def add_termination_listener(self, callback) -> None:
+        self.termination_listeners.append(callback)
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def execute(self, *args) -> None:
+        self.executed.append(args)
+
+    def drop(self) -> None:
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestPostgresNotifyBackend:
+    """Test the LISTEN connection is reopened after it drops."""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_and_listens_again(self, monkeypatch):
+        """Test a dropped connection is replaced and LISTEN is re-issued."""
+        import asyncio
+
+        import asyncpg
+
+        connections: list[FakeConnection] = []
+
+        async def connect(dsn):
+            connections.append(FakeConnection())
+            return connections[-1]
+
+        monkeypatch.setattr(asyncpg, "connect", connect)
+        backend = PostgresNotifyBackend("postgresql+asyncpg://db/app", "changes")
+        await backend.start(lambda message: None)
+
+        connections[0].drop()
+        await asyncio.sleep(0)
+        await backend._reconnector
+
+        assert len(connections) == 2
+        assert [channel for channel, _ in connections[1].listeners] == ["changes"]
+        assert backend.reconnects == 1
+
+        # A send after another drop opens a connection before sending
+        connections[1].closed = True
+        await backend.send([{"kind": "ping"}])
+        assert len(connections) == 3
+        assert len(connections[2].executed) == 1
+
+        await backend.stop()
@@ -0,0 +1,93 @@
+import pytest
+from httpx import AsyncClient
+
+
+async def create_task(client: AsyncClient, headers, project_id, **fields) -> str:
+    """Create a task through the API and return its ID."""
+    response = await client.post(
+        "/tasks/",
+        headers=headers,
+        json={"title": "Task", "project_id": str(project_id), **fields},
+    )
+    return response.json()["id"]
+
+
+class TestDashboard:
+    """Test the dashboard summary endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_dashboard_contents(
+        self, client: AsyncClient, auth_headers, test_project, test_user
+    ):
+        """Test projects, counts and upcoming tasks are returned together."""
+        due_dates = ["2030-03-01T00:00:00", None, "2030-01-01T00:00:00"]
+        for due_date in due_dates:
+            task_id = await create_task(
+                client, auth_headers, test_project.id, due_date=due_date
+            )
+            await client.post(
+                f"/tasks/{task_id}/assign/{test_user.id}", headers=auth_headers
+            )
+        done_id = await create_task(
+            client, auth_headers, test_project.id, state="completed"
+        )
+        await client.post(
+            f"/tasks/{done_id}/assign/{test_user.id}", headers=auth_headers
+        )
+
+        response = await client.get(
+            "/dashboard/", headers=auth_headers, params={"upcoming_limit": 2}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [p["id"] for p in data["projects"]] == [str(test_project.id)]
+        project = data["projects"][0]
+        assert project["scheduled_count"] == 3
+        assert project["completed_count"] == 1
+        assert project["last_activity_at"] is not None
+        # Completed tasks are left out of the assigned count
+        assert data["assigned_count"] == 3
+        assert [t["due_date"] for t in data["upcoming_tasks"]] == [
+            "2030-01-01T00:00:00",
+            "2030-03-01T00:00:00",
+        ]
+        assert data["upcoming_tasks"][0]["project"]["id"] == str(test_project.id)
+
+    @pytest.mark.asyncio
+    async def test_dashboard_empty(self, client: AsyncClient, auth_headers_user2):
+        """Test a user with no projects gets an empty dashboard."""
+        response = await client.get("/dashboard/", headers=auth_headers_user2)
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "projects": [],
+            "assigned_count": 0,
+            "upcoming_tasks": [],
+        }
+
+    @pytest.mark.asyncio
+    async def test_dashboard_not_modified(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test the dashboard honours If-None-Match until a project changes."""
+        etag = (await client.get("/dashboard/", headers=auth_headers)).headers["ETag"]
+
+        response = await client.get(
+            "/dashboard/", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+        await create_task(client, auth_headers, test_project.id)
+        response = await client.get(
+            "/dashboard/", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_dashboard_requires_auth(self, client: AsyncClient):
+        """Test the dashboard requires authentication."""
+        response = await client.get("/dashboard/")
+
+        assert response.status_code == 401
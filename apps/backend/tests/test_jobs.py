@@ -0,0 +1,211 @@
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.models.job import Job, JobStatus
+from src.utils.jobs import JobRunner, enqueue_job, job_handler, report_job_progress
+
+
+@job_handler("tests.echo")
+async def echo_job(db, payload):
+    return {"echo": payload["value"]}
+
+
+@job_handler("tests.broken")
+async def broken_job(db, payload):
+    raise RuntimeError("boom")
+
+
+@job_handler("tests.partial")
+async def partial_job(db, payload):
+    await report_job_progress(db, {"done": 1})
+    await db.commit()
+    raise RuntimeError("stopped halfway")
+
+
+@pytest.fixture
+def runner(db_engine) -> JobRunner:
+    """A job runner on the test database that retries without delay."""
+    return JobRunner(
+        async_sessionmaker(db_engine, expire_on_commit=False), retry_delay=0
+    )
+
+
+class TestJobRunner:
+    """Test claiming, running and retrying background jobs."""
+
+    @pytest.mark.asyncio
+    async def test_job_succeeds(self, runner, db_session):
+        """Test a queued job runs once and stores its result."""
+        job = await enqueue_job(db_session, "tests.echo", {"value": 42})
+        await db_session.commit()
+
+        finished = await runner.run_next()
+
+        assert finished.id == job.id
+        assert finished.status == JobStatus.SUCCEEDED
+        assert finished.result == {"echo": 42}
+        assert finished.attempts == 1
+        assert finished.finished_at is not None
+        assert await runner.run_next() is None
+        assert runner.stats()["succeeded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_job_retried_then_failed(self, runner, db_session):
+        """Test a failing job is requeued until it runs out of attempts."""
+        await enqueue_job(db_session, "tests.broken")
+        await db_session.commit()
+
+        job = await runner.run_next()
+        assert job.status == JobStatus.QUEUED
+        assert job.attempts == 1
+        assert job.error == "RuntimeError: boom"
+
+        while job.status == JobStatus.QUEUED:
+            job = await runner.run_next()
+
+        assert job.status == JobStatus.FAILED
+        assert job.attempts == job.max_attempts
+        assert runner.retried == job.max_attempts - 1
+        assert runner.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_progress_reported_while_running(self, runner, db_session):
+        """Test a handler's progress is stored on the job before it finishes."""
+        job = await enqueue_job(db_session, "tests.partial")
+        await db_session.commit()
+
+        job = await runner.run_next()
+
+        assert job.status == JobStatus.QUEUED
+        assert job.result == {"done": 1}
+        assert job.error == "RuntimeError: stopped halfway"
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, runner, db_session):
+        """Test a job left running by a dead worker is run again."""
+        job = await enqueue_job(db_session, "tests.echo", {"value": 1})
+        await db_session.execute(
+            update(Job)
+            .where(Job.id == job.id)
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=1,
+                locked_until=datetime.now() - timedelta(seconds=1),
+            )
+        )
+        await db_session.commit()
+
+        finished = await runner.run_next()
+
+        assert finished.status == JobStatus.SUCCEEDED
+        assert finished.attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_on_last_attempt_fails(self, runner, db_session):
+        """Test a job that keeps losing its worker is not retried forever."""
+        job = await enqueue_job(db_session, "tests.echo", {"value": 1})
+        await db_session.execute(
+            update(Job)
+            .where(Job.id == job.id)
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=job.max_attempts,
+                locked_until=datetime.now() - timedelta(seconds=1),
+            )
+        )
+        await db_session.commit()
+
+        assert await runner.run_next() is None
+
+        await db_session.refresh(job)
+        assert job.status == JobStatus.FAILED
+        assert job.attempts == job.max_attempts
+        assert job.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_late_finish_keeps_newer_attempt(self, runner, db_session):
+        """Test a worker that lost its lease cannot overwrite the next attempt."""
+        job = await enqueue_job(db_session, "tests.echo", {"value": 1})
+        await db_session.commit()
+        async with runner.session_maker() as db:
+            first = await runner._claim(db)
+
+        # The lease runs out and another worker claims the job again
+        await db_session.execute(
+            update(Job)
+            .where(Job.id == job.id)
+            .values(locked_until=datetime.now() - timedelta(seconds=1))
+        )
+        await db_session.commit()
+        async with runner.session_maker() as db:
+            second = await runner._claim(db)
+        assert second.attempts == first.attempts + 1
+
+        await runner._finish(first, status=JobStatus.FAILED, error="late")
+
+        await db_session.refresh(job)
+        assert job.status == JobStatus.RUNNING
+        assert job.attempts == second.attempts
+        assert job.locked_until is not None
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_rejected(self, db_session):
+        """Test jobs can only be queued for registered kinds."""
+        with pytest.raises(ValueError):
+            await enqueue_job(db_session, "tests.missing")
+
+
+class TestJobEndpoints:
+    """Test 202 responses and job status lookups."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_counters_accepted(
+        self,
+        client: AsyncClient,
+        auth_headers,
+        auth_headers_user2,
+        test_project,
+        runner,
+        db_session,
+    ):
+        """Test rebuilding counters returns a job that can be followed to completion."""
+        response = await client.post(
+            f"/projects/{test_project.id}/counters/rebuild", headers=auth_headers
+        )
+
+        assert response.status_code == 202
+        job = response.json()
+        assert job["kind"] == "projects.recompute_counters"
+        assert job["status"] == "queued"
+        assert response.headers["Location"] == f"/jobs/{job['id']}"
+
+        response = await client.get(f"/jobs/{job['id']}", headers=auth_headers_user2)
+        assert response.status_code == 404
+
+        await db_session.commit()
+        await runner.run_next()
+        # Drop the session's stale copy of the job
+        db_session.expunge_all()
+
+        response = await client.get(f"/jobs/{job['id']}", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["status"] == "succeeded"
+        assert response.json()["result"] == {"projects_repaired": 0}
+
+        response = await client.get("/jobs/", headers=auth_headers)
+        assert [j["id"] for j in response.json()] == [job["id"]]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_counters_requires_membership(
+        self, client: AsyncClient, auth_headers_user2, test_project
+    ):
+        """Test non-members cannot queue jobs for a project."""
+        response = await client.post(
+            f"/projects/{test_project.id}/counters/rebuild", headers=auth_headers_user2
+        )
+
+        assert response.status_code == 403
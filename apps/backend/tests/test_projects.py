@@ -1,5 +1,16 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.models.job import JobStatus
+from src.models.project import Project, user_projects
+from src.models.task import Task, task_assignees
+
+from src.utils.access import membership_cache
+from src.utils.events import ProjectEventBroker, format_sse, project_events
+from src.utils.jobs import JobRunner
+from src.utils.purge import ProjectPurger
 
 
 class TestProjectCreation:
@@ -179,12 +190,93 @@ class TestProjectDeletion:
         project_id = str(test_project.id)
         response = await client.delete(f"/projects/{project_id}", headers=auth_headers)
 
-        assert response.status_code == 204
+        assert response.status_code == 202
+        job = response.json()
+        assert job["kind"] == "projects.purge"
+        assert response.headers["Location"] == f"/jobs/{job['id']}"
 
         # Verify project is deleted
         get_response = await client.get(f"/projects/{project_id}", headers=auth_headers)
         assert get_response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_delete_project_purged_in_background(
+        self,
+        client: AsyncClient,
+        auth_headers,
+        test_project,
+        test_user,
+        db_engine,
+        db_session,
+    ):
+        """Test a deleted project is hidden at once and its rows purged later."""
+        project_id = test_project.id
+        task_ids = []
+        for _ in range(3):
+            response = await client.post(
+                "/tasks/",
+                headers=auth_headers,
+                json={"title": "Task", "project_id": str(project_id)},
+            )
+            task_ids.append(response.json()["id"])
+            await client.post(
+                f"/tasks/{task_ids[-1]}/assign/{test_user.id}", headers=auth_headers
+            )
+
+        response = await client.delete(f"/projects/{project_id}", headers=auth_headers)
+        assert response.status_code == 202
+        job_url = response.headers["Location"]
+
+        # Hidden everywhere, although the rows are still there
+        assert (await client.get("/projects/", headers=auth_headers)).json() == []
+        response = await client.get(f"/tasks/{task_ids[0]}", headers=auth_headers)
+        assert response.status_code == 404
+        response = await client.delete(f"/projects/{project_id}", headers=auth_headers)
+        assert response.status_code == 404
+        assert await db_session.scalar(select(func.count()).select_from(Task)) == 3
+        await db_session.commit()
+
+        runner = JobRunner(async_sessionmaker(db_engine, expire_on_commit=False))
+        job = await runner.run_next()
+
+        assert job.kind == "projects.purge"
+        assert job.status == JobStatus.SUCCEEDED
+        # Three tasks and the project row
+        assert job.result == {"rows_deleted": 4}
+        db_session.expunge_all()
+        response = await client.get(job_url, headers=auth_headers)
+        assert response.json()["result"] == {"rows_deleted": 4}
+        for stmt in (
+            select(func.count()).select_from(Project),
+            select(func.count()).select_from(Task),
+            select(func.count()).select_from(task_assignees),
+            select(func.count()).select_from(user_projects),
+        ):
+            assert await db_session.scalar(stmt) == 0
+
+    @pytest.mark.asyncio
+    async def test_purge_in_batches(
+        self, client: AsyncClient, auth_headers, test_project, db_session
+    ):
+        """Test the purger removes rows in batches and skips live projects."""
+        project_id = test_project.id
+        for _ in range(5):
+            await client.post(
+                "/tasks/",
+                headers=auth_headers,
+                json={"title": "Task", "project_id": str(project_id)},
+            )
+        purger = ProjectPurger(batch_size=2)
+
+        assert await purger.purge(db_session, project_id) == 0
+
+        await client.delete(f"/projects/{project_id}", headers=auth_headers)
+
+        assert await purger.purge(db_session, project_id) == 6
+        assert purger.purged == 1
+        assert purger.progress == {}
+        assert await db_session.scalar(select(func.count()).select_from(Task)) == 0
+
     @pytest.mark.asyncio
     async def test_delete_project_unauthorized(
         self, client: AsyncClient, auth_headers_user2, test_project
@@ -250,3 +342,476 @@ class TestProjectUserManagement:
         )
 
         assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_add_existing_member(
+        self, client: AsyncClient, auth_headers, test_project, test_user
+    ):
+        """Test adding a user who is already a member fails."""
+        response = await client.post(
+            f"/projects/{test_project.id}/users/{test_user.id}", headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert "already a member" in response.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_remove_last_user_rejected(
+        self, client: AsyncClient, auth_headers, test_project, test_user
+    ):
+        """Test the last member cannot be removed and nothing is changed."""
+        url = f"/projects/{test_project.id}"
+        user_id = str(test_user.id)
+        before = await client.get(url, headers=auth_headers)
+
+        response = await client.delete(f"{url}/users/{user_id}", headers=auth_headers)
+
+        assert response.status_code == 400
+        assert "last user" in response.json()["detail"]
+        after = await client.get(url, headers=auth_headers)
+        assert after.headers["ETag"] == before.headers["ETag"]
+        assert after.json()["member_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_remove_non_member(
+        self, client: AsyncClient, auth_headers, test_project, test_user2
+    ):
+        """Test removing a user who is not a member fails."""
+        url = f"/projects/{test_project.id}/users/{test_user2.id}"
+
+        response = await client.delete(url, headers=auth_headers)
+
+        assert response.status_code == 400
+        assert "not a member" in response.json()["detail"]
+
+
+class TestConditionalRequests:
+    """Test ETag / If-None-Match handling on project reads."""
+
+    @pytest.mark.asyncio
+    async def test_get_project_not_modified(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test a matching If-None-Match returns 304 until the project changes."""
+        first = await client.get(f"/projects/{test_project.id}", headers=auth_headers)
+        etag = first.headers["ETag"]
+
+        cached = await client.get(
+            f"/projects/{test_project.id}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        await client.put(
+            f"/projects/{test_project.id}",
+            headers=auth_headers,
+            json={"title": "Renamed"},
+        )
+        changed = await client.get(
+            f"/projects/{test_project.id}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert changed.status_code == 200
+        assert changed.json()["title"] == "Renamed"
+        assert changed.headers["ETag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_member_change_updates_project_etag(
+        self, client: AsyncClient, auth_headers, test_project, test_user2
+    ):
+        """Test adding a member invalidates the project ETag."""
+        first = await client.get(f"/projects/{test_project.id}", headers=auth_headers)
+
+        await client.post(
+            f"/projects/{test_project.id}/users/{test_user2.id}", headers=auth_headers
+        )
+        response = await client.get(
+            f"/projects/{test_project.id}",
+            headers={**auth_headers, "If-None-Match": first.headers["ETag"]},
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()["users"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_project_list_not_modified(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test the project list returns 304 until a project is added."""
+        first = await client.get("/projects/", headers=auth_headers)
+        etag = first.headers["ETag"]
+
+        cached = await client.get(
+            "/projects/", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+
+        await client.post("/projects/", headers=auth_headers, json={"title": "Another"})
+        changed = await client.get(
+            "/projects/", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert changed.status_code == 200
+        assert len(changed.json()) == 2
+
+
+class TestMembershipCache:
+    """Test the per-process project membership cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_access_uses_cache(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test repeated task reads hit the membership cache."""
+        await client.get(f"/tasks/project/{test_project.id}", headers=auth_headers)
+        hits_before = membership_cache.hits
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert membership_cache.hits == hits_before + 1
+
+    @pytest.mark.asyncio
+    async def test_removed_member_loses_access(
+        self,
+        client: AsyncClient,
+        auth_headers,
+        auth_headers_user2,
+        test_project,
+        test_user2,
+    ):
+        """Test removing a member invalidates their cached membership."""
+        await client.post(
+            f"/projects/{test_project.id}/users/{test_user2.id}", headers=auth_headers
+        )
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers_user2
+        )
+        assert response.status_code == 200
+
+        await client.delete(
+            f"/projects/{test_project.id}/users/{test_user2.id}", headers=auth_headers
+        )
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers_user2
+        )
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_deleted_project_is_not_served_from_cache(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test deleting a project drops its cached memberships."""
+        await client.get(f"/tasks/project/{test_project.id}", headers=auth_headers)
+
+        await client.delete(f"/projects/{test_project.id}", headers=auth_headers)
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+
+        assert response.status_code == 404
+
+
+class TestProjectBoard:
+    """Test the combined project board endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_board_contents(
+        self, client: AsyncClient, auth_headers, test_project, test_task, test_user
+    ):
+        """Test the board returns project, members, tasks and counts."""
+        await client.post(
+            f"/tasks/{test_task.id}/assign/{test_user.id}", headers=auth_headers
+        )
+
+        response = await client.get(
+            f"/projects/{test_project.id}/board", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["project"]["id"] == str(test_project.id)
+        assert [u["username"] for u in data["project"]["users"]] == ["testuser"]
+        assert [t["id"] for t in data["tasks"]] == [str(test_task.id)]
+        assert data["tasks"][0]["assignees"][0]["id"] == str(test_user.id)
+        assert data["stats"]["total"] == 1
+        assert data["stats"]["scheduled"] == 1
+        assert data["stats"]["unassigned"] == 0
+
+    @pytest.mark.asyncio
+    async def test_board_query_count_is_fixed(
+        self,
+        client: AsyncClient,
+        auth_headers,
+        test_project,
+        test_user,
+        db_session,
+        query_counter,
+    ):
+        """Test the number of queries does not grow with the number of tasks."""
+        from src.models.task import Task
+
+        async def add_tasks(count: int) -> None:
+            for i in range(count):
+                task = Task(title=f"Task {i}", project_id=test_project.id)
+                task.assignees.append(test_user)
+                db_session.add(task)
+            await db_session.commit()
+
+        url = f"/projects/{test_project.id}/board"
+        await add_tasks(1)
+        await client.get(url, headers=auth_headers)
+
+        query_counter.clear()
+        await client.get(url, headers=auth_headers)
+        small_board_queries = len(query_counter)
+
+        await add_tasks(5)
+        query_counter.clear()
+        response = await client.get(url, headers=auth_headers)
+
+        assert len(response.json()["tasks"]) == 6
+        assert len(query_counter) == small_board_queries <= 4
+
+    @pytest.mark.asyncio
+    async def test_board_not_modified(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test the board honours If-None-Match until the project changes."""
+        url = f"/projects/{test_project.id}/board"
+        etag = (await client.get(url, headers=auth_headers)).headers["ETag"]
+
+        response = await client.get(
+            url, headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+        await client.post(
+            "/tasks/",
+            headers=auth_headers,
+            json={"title": "New", "project_id": str(test_project.id)},
+        )
+        response = await client.get(
+            url, headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_board_etag_follows_overdue(
+        self, client: AsyncClient, auth_headers, test_project, db_session
+    ):
+        """Test the board is not cached past the moment a task becomes overdue."""
+        import uuid
+        from datetime import datetime, timedelta
+
+        from sqlalchemy import update
+
+        due = datetime.now() + timedelta(hours=1)
+        response = await client.post(
+            "/tasks/",
+            headers=auth_headers,
+            json={
+                "title": "Due soon",
+                "project_id": str(test_project.id),
+                "due_date": due.isoformat(),
+            },
+        )
+        task_id = response.json()["id"]
+        url = f"/projects/{test_project.id}/board"
+        response = await client.get(url, headers=auth_headers)
+        etag = response.headers["ETag"]
+        assert response.json()["stats"]["overdue"] == 0
+
+        # Let the due date pass without any write to the project
+        await db_session.execute(
+            update(Task)
+            .where(Task.id == uuid.UUID(task_id))
+            .values(due_date=datetime.now() - timedelta(minutes=1))
+        )
+        await db_session.commit()
+        db_session.expunge_all()
+
+        response = await client.get(
+            url, headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()["stats"]["overdue"] == 1
+
+    @pytest.mark.asyncio
+    async def test_board_unauthorized(
+        self, client: AsyncClient, auth_headers_user2, test_project
+    ):
+        """Test non-members cannot view the board."""
+        response = await client.get(
+            f"/projects/{test_project.id}/board", headers=auth_headers_user2
+        )
+
+        assert response.status_code == 403
+
+
+class TestProjectCounters:
+    """Test the denormalized task and member counters on projects."""
+
+    async def get_counts(self, client: AsyncClient, auth_headers, project_id):
+        response = await client.get(f"/projects/{project_id}", headers=auth_headers)
+        data = response.json()
+        return (
+            data["scheduled_count"],
+            data["in_progress_count"],
+            data["completed_count"],
+            data["member_count"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_task_counters_follow_changes(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test creating, moving and deleting tasks adjusts the counters."""
+        for title in ("A", "B"):
+            response = await client.post(
+                "/tasks/",
+                headers=auth_headers,
+                json={"title": title, "project_id": str(test_project.id)},
+            )
+        task_id = response.json()["id"]
+        assert await self.get_counts(client, auth_headers, test_project.id) == (
+            2,
+            0,
+            0,
+            1,
+        )
+
+        await client.put(
+            f"/tasks/{task_id}", headers=auth_headers, json={"state": "completed"}
+        )
+        # Updating other fields leaves the counters alone
+        await client.put(f"/tasks/{task_id}", headers=auth_headers, json={"title": "C"})
+        assert await self.get_counts(client, auth_headers, test_project.id) == (
+            1,
+            0,
+            1,
+            1,
+        )
+
+        await client.delete(f"/tasks/{task_id}", headers=auth_headers)
+        assert await self.get_counts(client, auth_headers, test_project.id) == (
+            1,
+            0,
+            0,
+            1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_member_count_follows_membership(
+        self, client: AsyncClient, auth_headers, test_project, test_user2
+    ):
+        """Test adding and removing members adjusts member_count."""
+        response = await client.post(
+            "/projects/", headers=auth_headers, json={"title": "Counted"}
+        )
+        assert response.json()["member_count"] == 1
+
+        response = await client.post(
+            f"/projects/{test_project.id}/users/{test_user2.id}",
+            headers=auth_headers,
+        )
+        assert response.json()["member_count"] == 2
+
+        response = await client.delete(
+            f"/projects/{test_project.id}/users/{test_user2.id}",
+            headers=auth_headers,
+        )
+        assert response.json()["member_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recompute_repairs_drift(
+        self, client: AsyncClient, auth_headers, test_project, db_session
+    ):
+        """Test recompute_project_counters fixes counters changed behind its back."""
+        from src.models.task import Task, TaskState
+        from src.utils.counters import recompute_project_counters
+
+        db_session.add(
+            Task(title="Raw", project_id=test_project.id, state=TaskState.IN_PROGRESS)
+        )
+        await db_session.commit()
+
+        assert await recompute_project_counters(db_session) == 1
+        await db_session.commit()
+        assert await recompute_project_counters(db_session) == 0
+        await db_session.refresh(test_project)
+
+        assert await self.get_counts(client, auth_headers, test_project.id) == (
+            0,
+            1,
+            0,
+            1,
+        )
+
+
+class TestProjectEvents:
+    """Test project change events and the SSE endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_task_changes_are_published(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test committed task changes reach project subscribers."""
+        subscription = project_events.subscribe(test_project.id)
+        try:
+            response = await client.post(
+                "/tasks/",
+                headers=auth_headers,
+                json={"title": "Live", "project_id": str(test_project.id)},
+            )
+            event = await subscription.get(timeout=1)
+        finally:
+            project_events.unsubscribe(subscription)
+
+        assert event["type"] == "task.created"
+        assert event["task"]["id"] == response.json()["id"]
+        assert event["task"]["title"] == "Live"
+        assert event["cursor"]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_is_dropped(self, test_project):
+        """Test a subscriber whose queue fills up gets a resync and is removed."""
+        broker = ProjectEventBroker(max_queue_size=2)
+        subscription = broker.subscribe(test_project.id)
+
+        for i in range(3):
+            broker.publish(test_project.id, {"type": "task.updated", "revision": i})
+
+        assert broker.subscriber_count(test_project.id) == 0
+        assert broker.dropped_subscribers == 1
+        assert (await subscription.get(timeout=1))["type"] == "resync"
+        assert await subscription.get(timeout=0.01) is None
+
+    def test_format_sse(self):
+        """Test events are framed in the text/event-stream format."""
+        frame = format_sse({"type": "task.deleted", "revision": 7, "task_id": "x"})
+
+        assert frame.startswith("event: task.deleted\nid: 7\ndata: {")
+        assert frame.endswith("\n\n")
+
+    @pytest.mark.asyncio
+    async def test_stream_requires_membership(
+        self, client: AsyncClient, auth_headers_user2, test_project
+    ):
+        """Test non-members cannot subscribe, with the token passed as a query."""
+        token = auth_headers_user2["Authorization"].removeprefix("Bearer ")
+        response = await client.get(
+            f"/projects/{test_project.id}/events", params={"access_token": token}
+        )
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_stream_requires_token(self, client: AsyncClient, test_project):
+        """Test subscribing without any token is rejected."""
+        response = await client.get(f"/projects/{test_project.id}/events")
+
+        assert response.status_code == 401
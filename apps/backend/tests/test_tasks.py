@@ -3,7 +3,7 @@ from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
-from src.models.task import Task
+from src.models.task import Task, TaskState
 
 
 class TestTaskCreation:
@@ -90,6 +90,18 @@ class TestTaskRetrieval:
         assert len(data) >= 1
         assert any(t["id"] == str(test_task.id) for t in data)
 
+    @pytest.mark.asyncio
+    async def test_get_tasks_nonexistent_project(
+        self, client: AsyncClient, auth_headers
+    ):
+        """Test listing tasks of an unknown project returns 404."""
+        response = await client.get(
+            "/tasks/project/00000000-0000-0000-0000-000000000000",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
+
     @pytest.mark.asyncio
     async def test_get_task_by_id(self, client: AsyncClient, auth_headers, test_task):
         """Test retrieving a specific task by ID."""
@@ -127,6 +139,21 @@ class TestTaskRetrieval:
         assert isinstance(data, list)
         assert any(t["id"] == str(test_task.id) for t in data)
 
+    @pytest.mark.asyncio
+    async def test_get_task_authorizes_in_one_query(
+        self, client: AsyncClient, auth_headers, test_task, query_counter
+    ):
+        """Test loading a task and checking membership costs a single statement."""
+        # Warm the principal cache so only task work is counted
+        await client.get("/auth/me", headers=auth_headers)
+        query_counter.clear()
+
+        response = await client.get(f"/tasks/{test_task.id}", headers=auth_headers)
+
+        assert response.status_code == 200
+        # One statement for task + membership, one for the assignee collection
+        assert len(query_counter) == 2
+
     @pytest.mark.asyncio
     async def test_get_task_unauthorized(
         self, client: AsyncClient, auth_headers_user2, test_task
@@ -139,6 +166,973 @@ class TestTaskRetrieval:
         assert response.status_code == 403
 
 
+class TestTaskPagination:
+    """Test keyset pagination of project task lists."""
+
+    @pytest.mark.asyncio
+    async def test_paginate_project_tasks(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test walking every page returns each task exactly once, newest first."""
+        for i in range(5):
+            await client.post(
+                "/tasks/",
+                headers=auth_headers,
+                json={"title": f"Task {i}", "project_id": str(test_project.id)},
+            )
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                f"/tasks/project/{test_project.id}",
+                headers=auth_headers,
+                params=params,
+            )
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page) <= 2
+            seen.extend(page)
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert len(seen) == 5
+        assert len({t["id"] for t in seen}) == 5
+        created = [t["created_at"] for t in seen]
+        assert created == sorted(created, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_unpaginated_request_has_no_cursor(
+        self, client: AsyncClient, auth_headers, test_project, test_task
+    ):
+        """Test omitting `limit` keeps returning the full list."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert "X-Next-Cursor" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test a malformed cursor is rejected."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}",
+            headers=auth_headers,
+            params={"limit": 2, "cursor": "not-a-cursor"},
+        )
+
+        assert response.status_code == 400
+
+
+class TestAssignedTasks:
+    """Test filtering and pagination of /tasks/assigned-to-me."""
+
+    async def _create_assigned(
+        self, client, headers, project_id, user_id, title, due_date=None, state=None
+    ) -> str:
+        body = {"title": title, "project_id": str(project_id)}
+        if due_date:
+            body["due_date"] = due_date
+        if state:
+            body["state"] = state
+        response = await client.post("/tasks/", headers=headers, json=body)
+        task_id = response.json()["id"]
+        await client.post(f"/tasks/{task_id}/assign/{user_id}", headers=headers)
+        return task_id
+
+    @pytest.mark.asyncio
+    async def test_completed_excluded_by_default(
+        self, client: AsyncClient, auth_headers, test_project, test_user
+    ):
+        """Test completed tasks only appear when requested."""
+        open_id = await self._create_assigned(
+            client, auth_headers, test_project.id, test_user.id, "Open"
+        )
+        done_id = await self._create_assigned(
+            client,
+            auth_headers,
+            test_project.id,
+            test_user.id,
+            "Done",
+            state="completed",
+        )
+
+        default = await client.get("/tasks/assigned-to-me", headers=auth_headers)
+        ids = {t["id"] for t in default.json()}
+        assert open_id in ids
+        assert done_id not in ids
+
+        everything = await client.get(
+            "/tasks/assigned-to-me",
+            headers=auth_headers,
+            params={"include_completed": True},
+        )
+        assert {open_id, done_id} <= {t["id"] for t in everything.json()}
+
+    @pytest.mark.asyncio
+    async def test_due_date_window(
+        self, client: AsyncClient, auth_headers, test_project, test_user
+    ):
+        """Test due_after/due_before restrict results to the window."""
+        inside = await self._create_assigned(
+            client,
+            auth_headers,
+            test_project.id,
+            test_user.id,
+            "Inside",
+            due_date="2030-01-15T00:00:00",
+        )
+        await self._create_assigned(
+            client,
+            auth_headers,
+            test_project.id,
+            test_user.id,
+            "Outside",
+            due_date="2030-03-01T00:00:00",
+        )
+
+        response = await client.get(
+            "/tasks/assigned-to-me",
+            headers=auth_headers,
+            params={
+                "due_after": "2030-01-01T00:00:00",
+                "due_before": "2030-02-01T00:00:00",
+            },
+        )
+
+        assert [t["id"] for t in response.json()] == [inside]
+
+    @pytest.mark.asyncio
+    async def test_paginate_by_due_date_nulls_last(
+        self, client: AsyncClient, auth_headers, test_project, test_user
+    ):
+        """Test pages follow due date order with undated tasks at the end."""
+        due_dates = ["2030-01-03T00:00:00", None, "2030-01-01T00:00:00", None]
+        for i, due_date in enumerate(due_dates):
+            await self._create_assigned(
+                client,
+                auth_headers,
+                test_project.id,
+                test_user.id,
+                f"Task {i}",
+                due_date=due_date,
+            )
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 1}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get(
+                "/tasks/assigned-to-me", headers=auth_headers, params=params
+            )
+            assert response.status_code == 200
+            seen.extend(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if not cursor:
+                break
+
+        assert len({t["id"] for t in seen}) == 4
+        assert [t["due_date"] for t in seen][:2] == [
+            "2030-01-01T00:00:00",
+            "2030-01-03T00:00:00",
+        ]
+        assert [t["due_date"] for t in seen][2:] == [None, None]
+
+
+class TestTaskListConditionalRequests:
+    """Test ETag / If-None-Match handling on project task lists."""
+
+    @pytest.mark.asyncio
+    async def test_task_list_not_modified(
+        self, client: AsyncClient, auth_headers, test_project, test_task, query_counter
+    ):
+        """Test unchanged polls get a 304 without querying the task tables."""
+        first = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+        etag = first.headers["ETag"]
+        query_counter.clear()
+
+        cached = await client.get(
+            f"/tasks/project/{test_project.id}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+
+        assert cached.status_code == 304
+        assert not any("FROM tasks" in statement for statement in query_counter)
+
+    @pytest.mark.asyncio
+    async def test_task_change_updates_etag(
+        self, client: AsyncClient, auth_headers, test_project, test_task
+    ):
+        """Test modifying a task invalidates the list ETag."""
+        first = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+
+        await client.put(
+            f"/tasks/{test_task.id}", headers=auth_headers, json={"state": "completed"}
+        )
+        response = await client.get(
+            f"/tasks/project/{test_project.id}",
+            headers={**auth_headers, "If-None-Match": first.headers["ETag"]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()[0]["state"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_etag_depends_on_filters(
+        self, client: AsyncClient, auth_headers, test_project, test_task
+    ):
+        """Test differently filtered lists get different ETags."""
+        everything = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+        filtered = await client.get(
+            f"/tasks/project/{test_project.id}",
+            headers=auth_headers,
+            params={"state": "completed"},
+        )
+
+        assert everything.headers["ETag"] != filtered.headers["ETag"]
+
+
+class TestTaskSync:
+    """Test the delta-sync endpoint for project tasks."""
+
+    @pytest.mark.asyncio
+    async def test_initial_sync_returns_all_tasks(
+        self, client: AsyncClient, auth_headers, test_project, test_task
+    ):
+        """Test syncing without a cursor returns the full task list."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/changes", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [t["id"] for t in data["tasks"]] == [str(test_task.id)]
+        assert data["deleted"] == []
+        assert data["cursor"]
+
+    @pytest.mark.asyncio
+    async def test_sync_returns_only_changes(
+        self, client: AsyncClient, auth_headers, test_project, test_task, test_user
+    ):
+        """Test syncing from a cursor returns changed tasks and tombstones only."""
+        created = await client.post(
+            "/tasks/",
+            headers=auth_headers,
+            json={"title": "Doomed", "project_id": str(test_project.id)},
+        )
+        doomed_id = created.json()["id"]
+        untouched = await client.post(
+            "/tasks/",
+            headers=auth_headers,
+            json={"title": "Untouched", "project_id": str(test_project.id)},
+        )
+
+        initial = await client.get(
+            f"/tasks/project/{test_project.id}/changes", headers=auth_headers
+        )
+        cursor = initial.json()["cursor"]
+
+        # Nothing changed yet
+        idle = await client.get(
+            f"/tasks/project/{test_project.id}/changes",
+            headers=auth_headers,
+            params={"since": cursor},
+        )
+        assert idle.json()["tasks"] == []
+        assert idle.json()["deleted"] == []
+        assert idle.json()["cursor"] == cursor
+
+        await client.post(
+            f"/tasks/{test_task.id}/assign/{test_user.id}", headers=auth_headers
+        )
+        await client.delete(f"/tasks/{doomed_id}", headers=auth_headers)
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/changes",
+            headers=auth_headers,
+            params={"since": cursor},
+        )
+
+        data = response.json()
+        assert [t["id"] for t in data["tasks"]] == [str(test_task.id)]
+        assert data["tasks"][0]["assignees"][0]["id"] == str(test_user.id)
+        assert data["deleted"] == [doomed_id]
+        assert untouched.json()["id"] not in [t["id"] for t in data["tasks"]]
+        assert data["cursor"] != cursor
+
+    @pytest.mark.asyncio
+    async def test_sync_invalid_cursor(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test a malformed cursor is rejected."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/changes",
+            headers=auth_headers,
+            params={"since": "garbage"},
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_sync_unauthorized(
+        self, client: AsyncClient, auth_headers_user2, test_project
+    ):
+        """Test non-members cannot sync a project's tasks."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/changes", headers=auth_headers_user2
+        )
+
+        assert response.status_code == 403
+
+
+class TestTaskBatch:
+    """Test applying many task operations in one request."""
+
+    async def create(self, client: AsyncClient, headers, project_id, title) -> str:
+        response = await client.post(
+            "/tasks/",
+            headers=headers,
+            json={"title": title, "project_id": str(project_id)},
+        )
+        return response.json()["id"]
+
+    @pytest.mark.asyncio
+    async def test_batch_mixed_operations(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test creates, updates and deletes are applied with per-item results."""
+        keep_id = await self.create(client, auth_headers, test_project.id, "Keep")
+        drop_id = await self.create(client, auth_headers, test_project.id, "Drop")
+        twice_id = await self.create(client, auth_headers, test_project.id, "Twice")
+        unknown_id = "00000000-0000-0000-0000-000000000000"
+
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/batch",
+            headers=auth_headers,
+            json={
+                "operations": [
+                    {"op": "create", "title": "New 1"},
+                    {"op": "create", "title": "New 2", "state": "in_progress"},
+                    {"op": "update", "id": keep_id, "state": "completed"},
+                    {"op": "delete", "id": drop_id},
+                    {"op": "delete", "id": unknown_id},
+                    {"op": "update", "id": twice_id, "title": "A"},
+                    {"op": "delete", "id": twice_id},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["status"] for r in results] == [201, 201, 200, 204, 404, 409, 409]
+        assert results[0]["task"]["title"] == "New 1"
+        assert results[1]["task"]["state"] == "in_progress"
+        assert results[2]["task"]["state"] == "completed"
+        assert results[2]["task"]["title"] == "Keep"
+        assert results[3]["task"] is None
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+        titles = sorted(task["title"] for task in response.json())
+        assert titles == ["Keep", "New 1", "New 2", "Twice"]
+
+        project = (
+            await client.get(f"/projects/{test_project.id}", headers=auth_headers)
+        ).json()
+        assert project["scheduled_count"] == 2
+        assert project["in_progress_count"] == 1
+        assert project["completed_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_visible_to_delta_sync(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test batch changes are picked up by the changes endpoint."""
+        drop_id = await self.create(client, auth_headers, test_project.id, "Drop")
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/changes", headers=auth_headers
+        )
+        cursor = response.json()["cursor"]
+
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/batch",
+            headers=auth_headers,
+            json={
+                "operations": [
+                    {"op": "create", "title": "Batched"},
+                    {"op": "delete", "id": drop_id},
+                ]
+            },
+        )
+        assert response.json()["cursor"] != cursor
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/changes",
+            headers=auth_headers,
+            params={"since": cursor},
+        )
+        data = response.json()
+        assert [task["title"] for task in data["tasks"]] == ["Batched"]
+        assert data["deleted"] == [drop_id]
+
+    @pytest.mark.asyncio
+    async def test_batch_ignores_other_projects_tasks(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test a batch cannot touch tasks belonging to another project."""
+        response = await client.post(
+            "/projects/", headers=auth_headers, json={"title": "Other"}
+        )
+        other_id = response.json()["id"]
+        task_id = await self.create(client, auth_headers, other_id, "Elsewhere")
+
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/batch",
+            headers=auth_headers,
+            json={"operations": [{"op": "delete", "id": task_id}]},
+        )
+
+        assert response.json()["results"][0]["status"] == 404
+        response = await client.get(f"/tasks/{task_id}", headers=auth_headers)
+        assert response.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_batch_unauthorized(
+        self, client: AsyncClient, auth_headers_user2, test_project
+    ):
+        """Test non-members cannot apply batches."""
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/batch",
+            headers=auth_headers_user2,
+            json={"operations": [{"op": "create", "title": "Nope"}]},
+        )
+
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_batch_validation(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test empty batches and unknown operations are rejected."""
+        url = f"/tasks/project/{test_project.id}/batch"
+        response = await client.post(url, headers=auth_headers, json={"operations": []})
+        assert response.status_code == 422
+
+        response = await client.post(
+            url,
+            headers=auth_headers,
+            json={"operations": [{"op": "archive", "id": str(test_project.id)}]},
+        )
+        assert response.status_code == 422
+
+
+class TestTaskAssignmentBatch:
+    """Test assigning and unassigning users on many tasks at once."""
+
+    @pytest.fixture
+    async def tasks(self, db_session, test_project, test_user):
+        """Three tasks, the first two assigned to test_user."""
+        tasks = [Task(title=f"Task {i}", project_id=test_project.id) for i in range(3)]
+        tasks[0].assignees.append(test_user)
+        tasks[1].assignees.append(test_user)
+        db_session.add_all(tasks)
+        await db_session.commit()
+        return tasks
+
+    @pytest.fixture
+    async def member2(
+        self, client: AsyncClient, auth_headers, test_project, test_user2
+    ):
+        """test_user2 added as a member of test_project."""
+        await client.post(
+            f"/projects/{test_project.id}/users/{test_user2.id}", headers=auth_headers
+        )
+        return test_user2
+
+    @pytest.mark.asyncio
+    async def test_reassign_in_one_request(
+        self, client: AsyncClient, auth_headers, test_project, test_user, member2, tasks
+    ):
+        """Test moving tasks from one user to another, skipping existing pairs."""
+        moves = [{"task_id": str(t.id), "user_id": str(test_user.id)} for t in tasks]
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/assignments",
+            headers=auth_headers,
+            json={
+                "unassign": moves,
+                "assign": [
+                    {"task_id": str(t.id), "user_id": str(member2.id)} for t in tasks
+                ]
+                # Duplicate pair is ignored rather than rejected
+                + [{"task_id": str(tasks[0].id), "user_id": str(member2.id)}],
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["unassigned"] == 2
+        assert data["assigned"] == 3
+        assert len(data["tasks"]) == 3
+        for task in data["tasks"]:
+            assert [a["id"] for a in task["assignees"]] == [str(member2.id)]
+
+        # Assigning again changes nothing
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/assignments",
+            headers=auth_headers,
+            json={
+                "assign": [{"task_id": str(tasks[0].id), "user_id": str(member2.id)}]
+            },
+        )
+        assert response.json()["assigned"] == 0
+        assert response.json()["tasks"] == []
+        # ...and does not spend a revision
+        assert response.json()["cursor"] == data["cursor"]
+
+    @pytest.mark.asyncio
+    async def test_assignments_visible_to_delta_sync(
+        self, client: AsyncClient, auth_headers, test_project, test_user, tasks
+    ):
+        """Test only tasks whose assignees changed show up as changed."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/changes", headers=auth_headers
+        )
+        cursor = response.json()["cursor"]
+
+        await client.post(
+            f"/tasks/project/{test_project.id}/assignments",
+            headers=auth_headers,
+            json={
+                "assign": [
+                    {"task_id": str(t.id), "user_id": str(test_user.id)} for t in tasks
+                ]
+            },
+        )
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/changes",
+            headers=auth_headers,
+            params={"since": cursor},
+        )
+        assert [t["id"] for t in response.json()["tasks"]] == [str(tasks[2].id)]
+
+    @pytest.mark.asyncio
+    async def test_assign_non_member_rejected(
+        self, client: AsyncClient, auth_headers, test_project, test_user2, tasks
+    ):
+        """Test nothing is assigned when one of the users is not a member."""
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/assignments",
+            headers=auth_headers,
+            json={
+                "assign": [{"task_id": str(tasks[2].id), "user_id": str(test_user2.id)}]
+            },
+        )
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_task_outside_project_rejected(
+        self, client: AsyncClient, auth_headers, test_project, test_user
+    ):
+        """Test tasks from other projects cannot be referenced."""
+        response = await client.post(
+            "/projects/", headers=auth_headers, json={"title": "Other"}
+        )
+        other_id = response.json()["id"]
+        response = await client.post(
+            "/tasks/", headers=auth_headers, json={"title": "X", "project_id": other_id}
+        )
+        task_id = response.json()["id"]
+
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/assignments",
+            headers=auth_headers,
+            json={"assign": [{"task_id": task_id, "user_id": str(test_user.id)}]},
+        )
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_unassign_skips_unknown_tasks(
+        self, client: AsyncClient, auth_headers, test_project, test_user, tasks
+    ):
+        """Test removals for deleted or foreign tasks are skipped, not rejected."""
+        import uuid
+
+        response = await client.post(
+            "/projects/", headers=auth_headers, json={"title": "Other"}
+        )
+        other_id = response.json()["id"]
+        response = await client.post(
+            "/tasks/", headers=auth_headers, json={"title": "X", "project_id": other_id}
+        )
+        foreign_id = response.json()["id"]
+        await client.post(
+            f"/tasks/{foreign_id}/assign/{test_user.id}", headers=auth_headers
+        )
+
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/assignments",
+            headers=auth_headers,
+            json={
+                "unassign": [
+                    {"task_id": task_id, "user_id": str(test_user.id)}
+                    for task_id in (str(tasks[0].id), str(uuid.uuid4()), foreign_id)
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["unassigned"] == 1
+        assert [t["id"] for t in response.json()["tasks"]] == [str(tasks[0].id)]
+        response = await client.get(f"/tasks/{foreign_id}", headers=auth_headers)
+        assert [a["id"] for a in response.json()["assignees"]] == [str(test_user.id)]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_rejected(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test a request without any pairs is a validation error."""
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/assignments",
+            headers=auth_headers,
+            json={},
+        )
+
+        assert response.status_code == 422
+
+
+class TestTaskStats:
+    """Test per-project task counts."""
+
+    @pytest.mark.asyncio
+    async def test_stats_counts(
+        self, client: AsyncClient, auth_headers, test_project, test_user, db_session
+    ):
+        """Test counts per state, overdue and unassigned tasks."""
+        from datetime import datetime, timedelta
+
+        past = datetime.now() - timedelta(days=1)
+        tasks = [
+            Task(title="Late", project_id=test_project.id, due_date=past),
+            Task(
+                title="Late but done",
+                project_id=test_project.id,
+                state=TaskState.COMPLETED,
+                due_date=past,
+            ),
+            Task(
+                title="Working",
+                project_id=test_project.id,
+                state=TaskState.IN_PROGRESS,
+            ),
+        ]
+        tasks[2].assignees.append(test_user)
+        db_session.add_all(tasks)
+        await db_session.commit()
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/stats", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "total": 3,
+            "scheduled": 1,
+            "in_progress": 1,
+            "completed": 1,
+            "overdue": 1,
+            "unassigned": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_stats_empty_project(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test an empty project reports zero for every count."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/stats", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert set(response.json().values()) == {0}
+
+    @pytest.mark.asyncio
+    async def test_stats_unauthorized(
+        self, client: AsyncClient, auth_headers_user2, test_project
+    ):
+        """Test non-members cannot view project stats."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/stats", headers=auth_headers_user2
+        )
+
+        assert response.status_code == 403
+
+
+class TestTaskExport:
+    """Test streaming task exports."""
+
+    @pytest.fixture
+    async def export_tasks(self, db_session, test_project, test_user, test_user2):
+        """Three tasks, the last assigned to both test users."""
+        from datetime import datetime, timedelta
+
+        start = datetime(2030, 1, 1)
+        tasks = [
+            Task(
+                title=f"Task {i}",
+                project_id=test_project.id,
+                created_at=start + timedelta(minutes=i),
+            )
+            for i in range(3)
+        ]
+        tasks[2].state = TaskState.COMPLETED
+        tasks[2].assignees.extend([test_user2, test_user])
+        db_session.add_all(tasks)
+        await db_session.commit()
+        return tasks
+
+    @pytest.mark.asyncio
+    async def test_export_ndjson(
+        self, client: AsyncClient, auth_headers, test_project, export_tasks
+    ):
+        """Test NDJSON exports one task per line with its assignees."""
+        import json
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/export", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert "attachment" in response.headers["content-disposition"]
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["title"] for r in records] == ["Task 0", "Task 1", "Task 2"]
+        assert records[0]["assignees"] == []
+        assert records[2]["state"] == "completed"
+        assert [a["username"] for a in records[2]["assignees"]] == [
+            "testuser",
+            "testuser2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_export_csv(
+        self, client: AsyncClient, auth_headers, test_project, export_tasks, monkeypatch
+    ):
+        """Test CSV exports a header and one row per task, across chunks."""
+        import csv
+
+        from src.core.config import settings
+
+        # One row per fetch: a task's assignee rows span several fetches
+        monkeypatch.setattr(settings, "TASK_EXPORT_CHUNK_SIZE", 1)
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/export",
+            headers=auth_headers,
+            params={"format": "csv"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(response.text.splitlines()))
+        assert [row["id"] for row in rows] == [str(t.id) for t in export_tasks]
+        assert rows[1]["assignees"] == ""
+        assert rows[2]["assignees"] == "testuser;testuser2"
+
+    @pytest.mark.asyncio
+    async def test_export_unauthorized(
+        self, client: AsyncClient, auth_headers_user2, test_project
+    ):
+        """Test non-members cannot export a project's tasks."""
+        response = await client.get(
+            f"/tasks/project/{test_project.id}/export", headers=auth_headers_user2
+        )
+
+        assert response.status_code == 403
+
+
+class TestTaskImport:
+    """Test bulk task imports."""
+
+    @pytest.mark.asyncio
+    async def test_import_ndjson(
+        self, client: AsyncClient, auth_headers, test_project, db_session
+    ):
+        """Test valid rows are imported and invalid ones reported by line."""
+        import json
+
+        lines = [
+            json.dumps({"title": "First", "due_date": "2030-01-01T00:00:00"}),
+            json.dumps({"title": "Bad state", "state": "archived"}),
+            json.dumps({"title": "Assigned", "assignees": ["testuser"]}),
+            "{not json",
+            json.dumps({"title": "Stranger", "assignees": ["nobody"]}),
+            json.dumps({"title": "Done", "state": "completed"}),
+        ]
+
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/import",
+            headers=auth_headers,
+            content="\n".join(lines),
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 3
+        assert data["failed"] == 3
+        assert [error["row"] for error in data["errors"]] == [2, 4, 5]
+        assert data["errors"][0]["errors"][0].startswith("state:")
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+        tasks = {task["title"]: task for task in response.json()}
+        assert set(tasks) == {"First", "Assigned", "Done"}
+        assert [u["username"] for u in tasks["Assigned"]["assignees"]] == ["testuser"]
+
+        await db_session.refresh(test_project)
+        assert test_project.scheduled_count == 2
+        assert test_project.completed_count == 1
+
+    @pytest.mark.asyncio
+    async def test_import_csv_round_trip(
+        self, client: AsyncClient, auth_headers, test_project, monkeypatch
+    ):
+        """Test an export imports back, across chunks and split uploads."""
+        from src.core.config import settings
+
+        monkeypatch.setattr(settings, "TASK_IMPORT_CHUNK_SIZE", 2)
+        for title, description in [
+            ("Plain", None),
+            ("Quoted", 'Says "hi",\nthen leaves — ok'),
+            ("Third", "x"),
+        ]:
+            await client.post(
+                "/tasks/",
+                headers=auth_headers,
+                json={
+                    "title": title,
+                    "description": description,
+                    "project_id": str(test_project.id),
+                },
+            )
+        export = await client.get(
+            f"/tasks/project/{test_project.id}/export",
+            headers=auth_headers,
+            params={"format": "csv"},
+        )
+
+        async def upload():
+            # Small pieces split lines and multi-byte characters
+            body = export.content
+            for i in range(0, len(body), 7):
+                yield body[i : i + 7]
+
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/import",
+            headers=auth_headers,
+            params={"format": "csv"},
+            content=upload(),
+        )
+
+        assert response.status_code == 200
+        assert response.json()["imported"] == 3
+        assert response.json()["failed"] == 0
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+        descriptions = [
+            task["description"] for task in response.json() if task["title"] == "Quoted"
+        ]
+        assert descriptions == ['Says "hi",\nthen leaves — ok'] * 2
+
+    @pytest.mark.asyncio
+    async def test_import_csv_bare_quote(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test a quote inside an unquoted field is a literal, not an open quote."""
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/import",
+            headers=auth_headers,
+            params={"format": "csv"},
+            content='title,description\nFix 5" screen,a\nSecond,b\n"Third",c\n',
+        )
+
+        assert response.status_code == 200
+        assert response.json()["imported"] == 3
+        assert response.json()["failed"] == 0
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+        titles = {task["title"] for task in response.json()}
+        assert titles == {'Fix 5" screen', "Second", "Third"}
+
+    @pytest.mark.asyncio
+    async def test_import_malformed_rows(
+        self, client: AsyncClient, auth_headers, test_project
+    ):
+        """Test malformed assignees are reported and U+2028 stays in its row."""
+        import json
+
+        lines = [
+            json.dumps({"title": "Count", "assignees": 5}),
+            json.dumps({"title": "Nested", "assignees": [["testuser"]]}),
+            json.dumps({"title": "No name", "assignees": [{"id": "x"}]}),
+            json.dumps({"title": "Line\u2028separator"}, ensure_ascii=False),
+        ]
+
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/import",
+            headers=auth_headers,
+            content="\n".join(lines).encode(),
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 1
+        assert [error["row"] for error in data["errors"]] == [1, 2, 3]
+        assert all(
+            error["errors"][0].startswith("assignees:") for error in data["errors"]
+        )
+
+        response = await client.get(
+            f"/tasks/project/{test_project.id}", headers=auth_headers
+        )
+        assert [task["title"] for task in response.json()] == ["Line\u2028separator"]
+
+    @pytest.mark.asyncio
+    async def test_import_unauthorized(
+        self, client: AsyncClient, auth_headers_user2, test_project
+    ):
+        """Test non-members cannot import tasks."""
+        response = await client.post(
+            f"/tasks/project/{test_project.id}/import",
+            headers=auth_headers_user2,
+            content='{"title": "Task"}',
+        )
+
+        assert response.status_code == 403
+
+
 class TestTaskUpdate:
     """Test task update functionality."""
 
@@ -213,6 +1207,23 @@ class TestTaskDeletion:
         get_response = await client.get(f"/tasks/{test_task.id}", headers=auth_headers)
         assert get_response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_delete_task_lost_race(
+        self, client: AsyncClient, auth_headers, test_task, monkeypatch
+    ):
+        """Test a delete whose task vanished after the access check gets a 404."""
+        response = await client.delete(f"/tasks/{test_task.id}", headers=auth_headers)
+        assert response.status_code == 204
+
+        # Replay the second of two concurrent deletes: its access check passed
+        async def stale_task(*args, **kwargs):
+            return test_task
+
+        monkeypatch.setattr("src.routers.tasks.get_task_for_member", stale_task)
+        response = await client.delete(f"/tasks/{test_task.id}", headers=auth_headers)
+
+        assert response.status_code == 404
+
     @pytest.mark.asyncio
     async def test_delete_task_unauthorized(
         self, client: AsyncClient, auth_headers_user2, test_task
@@ -0,0 +1,110 @@
+"""
+Script to bring an existing database up to the current models.
+Usage: python upgrade_schema.py
+
+`create_db_and_tables` only creates missing tables; it never alters existing
+ones. This script also adds the columns and indexes that newer models define
+on existing tables (e.g. `projects.revision`, `projects.deleted_at`, the
+project counters, `tasks.revision`), backfills them, and recomputes the
+project counters. It is safe to run more than once.
+"""
+
+import asyncio
+import sys
+
+# Add the src directory to the path
+sys.path.append(".")
+
+from sqlalchemy import Column, Connection, Table, inspect, text
+
+from src.db.database import Base, engine, get_async_session
+import src.models  # noqa: F401 - registers every model on Base.metadata
+from src.utils.counters import recompute_project_counters
+
+
+# Value existing rows get for new NOT NULL columns without a server default
+BACKFILL = {
+    ("projects", "last_activity_at"): "updated_at",
+}
+
+
+def _add_column(conn: Connection, table: Table, column: Column) -> None:
+    """ALTER TABLE ... ADD COLUMN for a model column missing from the table."""
+    quote = conn.dialect.identifier_preparer.quote
+    name = quote(column.name)
+    type_ = column.type.compile(dialect=conn.dialect)
+    sql = f"ALTER TABLE {quote(table.name)} ADD COLUMN {name} {type_}"
+    if column.server_default is not None:
+        sql += f" DEFAULT {column.server_default.arg}"
+        if not column.nullable:
+            sql += " NOT NULL"
+    conn.execute(text(sql))
+
+    backfill = BACKFILL.get((table.name, column.name))
+    if backfill is not None:
+        conn.execute(text(f"UPDATE {quote(table.name)} SET {name} = {backfill}"))
+        # SQLite cannot add NOT NULL to an existing column; the app always sets it
+        if not column.nullable and conn.dialect.name == "postgresql":
+            conn.execute(
+                text(f"ALTER TABLE {quote(table.name)} ALTER COLUMN {name} SET NOT NULL")
+            )
+
+
+def upgrade(conn: Connection) -> list[str]:
+    """Add missing tables, columns and indexes; return what was changed."""
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    changes = []
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in present:
+                _add_column(conn, table, column)
+                changes.append(f"column {table.name}.{column.name}")
+
+    # New tables come with their indexes
+    Base.metadata.create_all(conn)
+    changes.extend(
+        f"table {table.name}"
+        for table in Base.metadata.sorted_tables
+        if table.name not in existing_tables
+    )
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in present:
+                index.create(conn)
+                changes.append(f"index {index.name}")
+
+    return changes
+
+
+async def upgrade_schema():
+    """Upgrade the schema, then rebuild the counters the new columns start from"""
+    async with engine.begin() as conn:
+        changes = await conn.run_sync(upgrade)
+
+    for change in changes:
+        print(f"  + {change}")
+
+    async for db in get_async_session():
+        repaired = await recompute_project_counters(db)
+        await db.commit()
+
+        print(
+            f"✅ Applied {len(changes)} schema change(s), "
+            f"repaired counters on {repaired} project(s)"
+        )
+
+        break  # Exit after first session
+
+
+if __name__ == "__main__":
+    print("Upgrading database schema...\n")
+    asyncio.run(upgrade_schema())
@@ -4,7 +4,7 @@ import { useState, useEffect } from "react";
 
 import { apiGet, apiPost } from "@/lib/apiClient";
 import { API_ENDPOINTS } from "@/lib/api";
-import { Project, CreateProjectRequest, Task } from "@/types";
+import { Project, CreateProjectRequest, Task, DashboardData } from "@/types";
 import { ProjectCard } from "@/components/ProjectCard";
 
 import { FiPlus, FiFolder } from "react-icons/fi";
@@ -22,6 +22,7 @@ import { DashboardStat } from "@/components/DashboardStat";
 export default function Dashboard() {
   const [projects, setProjects] = useState<Project[]>([]);
   const [assignedTasks, setAssignedTasks] = useState<Task[]>([]);
+  const [assignedCount, setAssignedCount] = useState(0);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
   const [showCreateModal, setShowCreateModal] = useState(false);
@@ -29,15 +30,14 @@ export default function Dashboard() {
   const [newProjectDescription, setNewProjectDescription] = useState("");
   const [creating, setCreating] = useState(false);
 
-  // Fetch projects on component mount
+  // Fetch dashboard data on component mount
   useEffect(() => {
     // Initial fetch (shows loading/errors)
-    fetchProjects();
-    fetchAssginedTasks();
+    fetchDashboard();
 
-    // Refresh projects every 10 seconds without affecting loading/error UI
+    // Refresh every 10 seconds without affecting loading/error UI
     const interval = setInterval(() => {
-      fetchProjects(true).catch(() => {});
+      fetchDashboard(true).catch(() => {});
     }, 10000);
 
     // Clean up interval on unmount
@@ -45,43 +45,30 @@ export default function Dashboard() {
   }, []);
 
   /**
-   * Fetches projects for the current user.
+   * Fetches the user's projects and upcoming assigned tasks in one request.
    *
    * @param silent When true, does not affect the loading/error UI (polling).
    */
-  const fetchProjects = async (silent = false) => {
+  const fetchDashboard = async (silent = false) => {
     try {
       if (!silent) {
         setLoading(true);
         setError("");
       }
-      const data = await apiGet<Project[]>(API_ENDPOINTS.projects.list);
-      setProjects(data);
+      const data = await apiGet<DashboardData>(API_ENDPOINTS.dashboard);
+      setProjects(data.projects);
+      setAssignedTasks(data.upcoming_tasks);
+      setAssignedCount(data.assigned_count);
     } catch (err: any) {
       if (!silent) {
-        setError(err.message || "Failed to load projects");
-        console.error("Error fetching projects:", err);
+        setError(err.message || "Failed to load dashboard");
+        console.error("Error fetching dashboard:", err);
       }
     } finally {
       if (!silent) setLoading(false);
     }
   };
 
-  /** Fetches tasks assigned to the current user across all projects. */
-  const fetchAssginedTasks = async () => {
-    try {
-      setLoading(true);
-      setError("");
-      const data = await apiGet<Task[]>(API_ENDPOINTS.tasks.assignedToMe);
-      setAssignedTasks(data);
-    } catch (err: any) {
-      setError(err.message || "Failed to load assigned tasks");
-      console.error("Error fetching assigned tasks:", err);
-    } finally {
-      setLoading(false);
-    }
-  };
-
   /**
    * Creates a project via the API and prepends it to local state.
    */
@@ -119,7 +106,7 @@ export default function Dashboard() {
 
   // Calculate stats from real project data
   const totalProjects = projects.length;
-  const totalAssignedTasks = assignedTasks.length;
+  const totalAssignedTasks = assignedCount;
 
   return (
     <ProtectedRoute>
@@ -22,7 +22,7 @@ import { useParams, useRouter } from "next/navigation";
 import Link from "next/link";
 
 import { TaskWithAssignees, TaskState, UserBasicInfo } from "@/types";
-import { apiGet, apiPost, apiDelete } from "@/lib/apiClient";
+import { apiGet, apiPost } from "@/lib/apiClient";
 import { API_ENDPOINTS } from "@/lib/api";
 import { useAuth } from "@/contexts/AuthContext";
 import { KanbanColumn } from "@/components/KanbanColumn";
@@ -34,6 +34,9 @@ import { ProjectStats } from "@/components/ProjectStats";
 
 import { useProjectTasks } from "@/hooks/useProjectTasks";
 
+// Pairs per assignments request (the backend's TASK_BATCH_MAX_OPERATIONS default)
+const ASSIGNMENT_BATCH_SIZE = 500;
+
 export function KanbanBoardView() {
   const params = useParams();
   const router = useRouter();
@@ -340,6 +343,29 @@ export function KanbanBoardView() {
     }
   };
 
+  /**
+   * Unassigns a user from all of their tasks on the board, in requests the
+   * assignments endpoint accepts. A failed request is logged and skipped so
+   * removing the member still goes ahead.
+   */
+  const unassignUserFromTasks = async (projectId: string, userId: string) => {
+    const pairs = tasks
+      .filter((task) =>
+        task.assignees?.some((assignee) => assignee.id === userId),
+      )
+      .map((task) => ({ task_id: task.id, user_id: userId }));
+
+    for (let i = 0; i < pairs.length; i += ASSIGNMENT_BATCH_SIZE) {
+      try {
+        await apiPost(API_ENDPOINTS.tasks.assignments(projectId), {
+          unassign: pairs.slice(i, i + ASSIGNMENT_BATCH_SIZE),
+        });
+      } catch (err) {
+        console.error("Failed to unassign tasks:", err);
+      }
+    }
+  };
+
   /**
    * Removes a user from the project and unassigns their tasks first.
    */
@@ -355,19 +381,8 @@ export function KanbanBoardView() {
       setUpdating(true);
       setError("");
 
-      // Find all tasks in this project assigned to this user
-      const tasksAssignedToUser = tasks.filter((task) =>
-        task.assignees?.some((assignee) => assignee.id === userId),
-      );
-
       // Unassign the user from all their tasks
-      for (const task of tasksAssignedToUser) {
-        try {
-          await apiDelete(API_ENDPOINTS.tasks.unassign(task.id, userId));
-        } catch (err) {
-          console.error(`Failed to unassign task ${task.id}:`, err);
-        }
-      }
+      await unassignUserFromTasks(project.id, userId);
 
       // Remove user from project
       await removeUserFromProject(userId);
@@ -405,19 +420,8 @@ export function KanbanBoardView() {
       setUpdating(true);
       setError("");
 
-      // Find all tasks assigned to current user
-      const tasksAssignedToUser = tasks.filter((task) =>
-        task.assignees?.some((assignee) => assignee.id === user.id),
-      );
-
       // Unassign current user from all their tasks
-      for (const task of tasksAssignedToUser) {
-        try {
-          await apiDelete(API_ENDPOINTS.tasks.unassign(task.id, user.id));
-        } catch (err) {
-          console.error(`Failed to unassign task ${task.id}:`, err);
-        }
-      }
+      await unassignUserFromTasks(project.id, user.id);
 
       // Remove current user from project
       await removeUserFromProject(user.id);
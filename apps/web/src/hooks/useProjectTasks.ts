@@ -7,6 +7,7 @@ import {
   CreateTaskRequest,
   UpdateTaskRequest,
   ProjectWithUsers,
+  ProjectBoard,
 } from "@/types";
 
 /**
@@ -40,17 +41,12 @@ export function useProjectTasks(projectId: string) {
       }
       setError("");
 
-      // Fetch project details
-      const projectData = await apiGet<ProjectWithUsers>(
-        API_ENDPOINTS.projects.detail(projectId),
+      // Fetch project details and its tasks in a single request
+      const board = await apiGet<ProjectBoard>(
+        API_ENDPOINTS.projects.board(projectId),
       );
-      setProject(projectData);
-
-      // Fetch tasks for this project
-      const tasksData = await apiGet<TaskWithAssignees[]>(
-        API_ENDPOINTS.tasks.list(projectId),
-      );
-      setTasks(tasksData);
+      setProject(board.project);
+      setTasks(board.tasks);
     } catch (err: any) {
       setError(err.message || "Failed to load project data");
       console.error("Error fetching data:", err);
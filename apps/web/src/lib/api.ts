@@ -16,6 +16,8 @@ export const API_ENDPOINTS = {
     login: `${API_BASE_URL}/auth/login`,
     me: `${API_BASE_URL}/auth/me`,
   },
+  /** Projects, counts and upcoming assigned tasks in one request. */
+  dashboard: `${API_BASE_URL}/dashboard`,
   users: {
     /** Lookup a user by email address (URL-encoded). */
     byEmail: (email: string) =>
@@ -25,6 +27,8 @@ export const API_ENDPOINTS = {
     list: `${API_BASE_URL}/projects`,
     /** Project details by UUID. */
     detail: (id: string) => `${API_BASE_URL}/projects/${id}`,
+    /** Project, members, tasks and counts in one request. */
+    board: (id: string) => `${API_BASE_URL}/projects/${id}/board`,
     create: `${API_BASE_URL}/projects`,
     /** Update a project by UUID. */
     update: (id: string) => `${API_BASE_URL}/projects/${id}`,
@@ -40,6 +44,9 @@ export const API_ENDPOINTS = {
   tasks: {
     /** List tasks for a project. */
     list: (projectId: string) => `${API_BASE_URL}/tasks/project/${projectId}`,
+    /** Assign/unassign many (task, user) pairs in a project at once. */
+    assignments: (projectId: string) =>
+      `${API_BASE_URL}/tasks/project/${projectId}/assignments`,
     assignedToMe: `${API_BASE_URL}/tasks/assigned-to-me`,
     /** Task details by UUID. */
     detail: (id: string) => `${API_BASE_URL}/tasks/${id}`,
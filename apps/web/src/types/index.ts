@@ -38,6 +38,11 @@ export interface Project {
   description: string | null;
   created_at: string;
   updated_at: string;
+  last_activity_at?: string | null;
+  scheduled_count?: number;
+  in_progress_count?: number;
+  completed_count?: number;
+  member_count?: number;
 }
 
 export interface ProjectWithUsers extends Project {
@@ -65,6 +70,31 @@ export interface TaskWithAssignees extends Task {
   assignees: UserBasicInfo[];
 }
 
+export interface TaskStats {
+  total: number;
+  scheduled: number;
+  in_progress: number;
+  completed: number;
+  overdue: number;
+  unassigned: number;
+}
+
+/** Response of `GET /projects/{id}/board`. */
+export interface ProjectBoard {
+  project: ProjectWithUsers;
+  tasks: TaskWithAssignees[];
+  stats: TaskStats;
+}
+
+/** Response of `GET /dashboard`. */
+export interface DashboardData {
+  projects: Project[];
+  /** Open tasks assigned to the current user. */
+  assigned_count: number;
+  /** The closest of those tasks by due date. */
+  upcoming_tasks: TaskWithDetails[];
+}
+
 export interface TaskWithDetails extends TaskWithAssignees {
   project: {
     id: string;